@@ -324,6 +324,11 @@ class MultiModalGuiderFactory:
         sorted_items = tuple(sorted(sigma_to_params.items(), key=lambda x: x[0], reverse=True))
         return cls(negative_context=negative_context, _params_by_sigma=sorted_items)
 
+    @property
+    def params_by_sigma(self) -> tuple[tuple[float, MultiModalGuiderParams], ...]:
+        """(sigma upper bound, params) bins, sorted by descending sigma."""
+        return self._params_by_sigma
+
     def params(self, sigma: float | torch.Tensor) -> MultiModalGuiderParams:
         """Return params effective for the given sigma (getter; single source of truth)."""
         sigma_val = float(sigma.item() if isinstance(sigma, torch.Tensor) else sigma)
@@ -2,12 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 import torch
 
-if TYPE_CHECKING:
-    from ltx_core.types import LatentState
+from ltx_core.types import BlockAttentionMask, LatentState
 
 
 def resolve_cross_mask(
@@ -81,14 +78,16 @@ def update_attention_mask(
     batch_size: int,
     device: torch.device,
     dtype: torch.dtype,
-) -> torch.Tensor | None:
+) -> torch.Tensor | BlockAttentionMask | None:
     """Build or update the self-attention mask for newly appended conditioning tokens.
     If *attention_mask* is ``None`` and no existing mask is present, returns
     ``None``.  If *attention_mask* is ``None`` but an existing mask is present,
     the mask is expanded with full attention (1s) for the new tokens so that
     its dimensions stay consistent with the growing latent sequence.  Otherwise,
-    resolves *attention_mask* to a per-token cross-mask and expands the 2-D
-    attention mask via :func:`build_attention_mask`.
+    resolves *attention_mask* to a per-token cross-mask and appends the new tokens
+    as a conditioning group with the block structure of :func:`build_attention_mask`.
+    The mask is kept in the compact :class:`~ltx_core.types.BlockAttentionMask` form;
+    a dense existing mask (e.g. supplied by the caller) is expanded densely instead.
     Args:
         latent_state: Current latent state (provides the existing mask and total
             existing-token count).
@@ -101,18 +100,23 @@ def update_attention_mask(
         device: Device for the output tensor.
         dtype: Data type for the output tensor.
     Returns:
-        Updated attention mask of shape ``(B, N+M, N+M)``, or ``None`` if no
+        Updated attention mask describing shape ``(B, N+M, N+M)``, or ``None`` if no
         masking is needed.
     """
+    existing_mask = latent_state.attention_mask
     if attention_mask is None:
-        if latent_state.attention_mask is None:
+        if existing_mask is None:
             return None
         # Existing mask present but no new mask requested: pad with 1s (full
         # attention) so the mask dimensions stay consistent with the growing
         # latent sequence.
         cross_mask = torch.ones(batch_size, num_new_tokens, device=device, dtype=dtype)
+    else:
+        cross_mask = resolve_cross_mask(attention_mask, num_new_tokens, batch_size, device, dtype)
+
+    if isinstance(existing_mask, torch.Tensor):
         return build_attention_mask(
-            existing_mask=latent_state.attention_mask,
+            existing_mask=existing_mask,
             num_noisy_tokens=num_noisy_tokens,
             num_new_tokens=num_new_tokens,
             num_existing_tokens=latent_state.latent.shape[1],
@@ -121,16 +125,12 @@ def update_attention_mask(
             dtype=dtype,
         )
 
-    cross_mask = resolve_cross_mask(attention_mask, num_new_tokens, batch_size, device, dtype)
-    return build_attention_mask(
-        existing_mask=latent_state.attention_mask,
-        num_noisy_tokens=num_noisy_tokens,
-        num_new_tokens=num_new_tokens,
-        num_existing_tokens=latent_state.latent.shape[1],
-        cross_mask=cross_mask,
-        device=device,
-        dtype=dtype,
-    )
+    if existing_mask is None:
+        existing_mask = BlockAttentionMask(
+            num_noisy_tokens=num_noisy_tokens,
+            num_base_tokens=latent_state.latent.shape[1],
+        )
+    return existing_mask.with_group(cross_mask)
 
 
 def build_attention_mask(
@@ -178,6 +178,9 @@ def build_attention_mask(
         dtype: Data type for the output tensor.
     Returns:
         Attention mask of shape (B, N+M, N+M) with values in [0, 1].
+    .. note::
+        Conditioning items use :func:`update_attention_mask`, which keeps the same layout as a compact
+        :class:`~ltx_core.types.BlockAttentionMask` instead of materializing it.
     """
     batch_size = cross_mask.shape[0]
     total = num_existing_tokens + num_new_tokens
@@ -1,6 +1,9 @@
 """Loader utilities for model weights, LoRAs, and safetensor operations."""
 
+from ltx_core.loader.checkpoint_index import CheckpointHeader, read_checkpoint_header
+from ltx_core.loader.converted_checkpoint import ConvertedComponent, convert_checkpoint, converted_checkpoint_dirs
 from ltx_core.loader.fuse_loras import apply_loras
+from ltx_core.loader.fused_lora_cache import FusedLoraCache, fused_lora_cache_from_env
 from ltx_core.loader.module_ops import ModuleOps
 from ltx_core.loader.primitives import (
     LoRAAdaptableProtocol,
@@ -10,7 +13,7 @@ from ltx_core.loader.primitives import (
     StateDict,
     StateDictLoader,
 )
-from ltx_core.loader.registry import DummyRegistry, Registry, StateDictRegistry
+from ltx_core.loader.registry import DummyRegistry, Registry, StateDictRegistry, shared_registry
 from ltx_core.loader.sd_ops import (
     LTXV_LORA_COMFY_RENAMING_MAP,
     ContentMatching,
@@ -25,9 +28,12 @@ from ltx_core.loader.single_gpu_model_builder import SingleGPUModelBuilder
 
 __all__ = [
     "LTXV_LORA_COMFY_RENAMING_MAP",
+    "CheckpointHeader",
     "ContentMatching",
     "ContentReplacement",
+    "ConvertedComponent",
     "DummyRegistry",
+    "FusedLoraCache",
     "KeyValueOperation",
     "KeyValueOperationResult",
     "LoRAAdaptableProtocol",
@@ -45,4 +51,9 @@ __all__ = [
     "StateDictLoader",
     "StateDictRegistry",
     "apply_loras",
+    "convert_checkpoint",
+    "converted_checkpoint_dirs",
+    "fused_lora_cache_from_env",
+    "read_checkpoint_header",
+    "shared_registry",
 ]
@@ -0,0 +1,174 @@
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import torch
+
+from ltx_core.loader.parallel_io import TensorRange, parse_safetensors_header
+from ltx_core.loader.sd_ops import ContentMatching, ContentReplacement, SDOps
+from ltx_core.utils import get_cache_dir
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+CHECKPOINT_INDEX_FORMAT_VERSION = 1
+
+# A selection: tensors kept by an SDOps, in file order, with the keys it renames them to
+Selection = tuple[tuple[TensorRange, str], ...]
+
+
+@dataclass(frozen=True)
+class CheckpointHeader:
+    """
+    Parsed header of a safetensors file, shared by every builder loading from the file.
+    Attributes:
+        path: Resolved path of the file.
+        size: Size of the file when the header was read.
+        mtime_ns: Modification time of the file when the header was read.
+        metadata: String metadata of the header.
+        config: Model configuration parsed from the ``config`` metadata entry, or an empty dict.
+        tensors: Tensors of the file in file order.
+        persist: Whether the header and its selections are written to the sidecar index
+            (see :func:`checkpoint_index_path`).
+        selections: Selections computed so far, by :func:`sd_ops_key`.
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+    metadata: dict[str, str]
+    config: dict
+    tensors: tuple[TensorRange, ...]
+    persist: bool = True
+    selections: dict[str, Selection] = field(default_factory=dict, compare=False)
+
+    def select(self, sd_ops: SDOps | None) -> Selection:
+        """Tensors ``sd_ops`` keeps, in file order, with the keys it renames them to."""
+        if sd_ops is None:
+            return tuple((tensor_range, tensor_range.name) for tensor_range in self.tensors)
+        key = sd_ops_key(sd_ops)
+        selection = self.selections.get(key)
+        if selection is None:
+            selection = tuple(
+                (tensor_range, name)
+                for tensor_range in self.tensors
+                if (name := sd_ops.apply_to_key(tensor_range.name)) is not None
+            )
+            self.selections[key] = selection
+            if self.persist:
+                _write_index(self)
+        return selection
+
+
+def read_checkpoint_header(path: str | Path, persist: bool = True) -> CheckpointHeader:
+    """
+    Return the parsed header of a safetensors file. Headers are cached in memory by path, size and
+    modification time, so builders sharing a checkpoint parse it once, and a replaced file is read again.
+    With ``persist``, the header and the key selections of :meth:`CheckpointHeader.select` are also kept in
+    a sidecar index, from which later processes read them without parsing the header or scanning its keys.
+    """
+    stat = Path(path).stat()
+    return _checkpoint_header(str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns, persist)
+
+
+def checkpoint_index_path(path: str | Path) -> Path:
+    """Sidecar index of a safetensors file, under ``checkpoint_index`` in :func:`~ltx_core.utils.get_cache_dir`."""
+    resolved = Path(path).resolve()
+    digest = hashlib.sha256(str(resolved).encode("utf-8")).hexdigest()[:16]
+    return get_cache_dir("checkpoint_index") / f"{resolved.stem}-{digest}.json"
+
+
+def sd_ops_key(sd_ops: SDOps) -> str:
+    """
+    Identify the key selection of ``sd_ops`` by its name and its matching and renaming rules, so that a
+    persisted selection is not reused once the rules change. Value operations do not select keys.
+    """
+    rules = [
+        repr(operation) for operation in sd_ops.mapping if isinstance(operation, (ContentMatching, ContentReplacement))
+    ]
+    digest = hashlib.sha256(json.dumps(rules).encode("utf-8")).hexdigest()[:16]
+    return f"{sd_ops.name}-{digest}"
+
+
+@functools.lru_cache(maxsize=32)
+def _checkpoint_header(path: str, size: int, mtime_ns: int, persist: bool) -> CheckpointHeader:
+    # size and mtime_ns are part of the cache key, so a replaced file is read again
+    header = _read_index(path, size, mtime_ns) if persist else None
+    if header is not None:
+        return header
+    metadata, tensors = parse_safetensors_header(path)
+    header = CheckpointHeader(
+        path=path,
+        size=size,
+        mtime_ns=mtime_ns,
+        metadata=metadata,
+        config=json.loads(metadata["config"]) if "config" in metadata else {},
+        tensors=tuple(tensors),
+        persist=persist,
+    )
+    if persist:
+        _write_index(header)
+    return header
+
+
+def _read_index(path: str, size: int, mtime_ns: int) -> CheckpointHeader | None:
+    try:
+        index_path = checkpoint_index_path(path)
+        if not index_path.is_file():
+            return None
+        index = json.loads(index_path.read_text())
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable checkpoint index of {path}: {e}")
+        return None
+    if index.get("format_version") != CHECKPOINT_INDEX_FORMAT_VERSION or (
+        index.get("path"),
+        index.get("size"),
+        index.get("mtime_ns"),
+    ) != (path, size, mtime_ns):
+        return None
+
+    tensors = tuple(
+        TensorRange(path=path, name=name, dtype=getattr(torch, dtype), shape=tuple(shape), start=start, end=end)
+        for name, dtype, shape, start, end in index["tensors"]
+    )
+    metadata = index["metadata"]
+    return CheckpointHeader(
+        path=path,
+        size=size,
+        mtime_ns=mtime_ns,
+        metadata=metadata,
+        config=json.loads(metadata["config"]) if "config" in metadata else {},
+        tensors=tensors,
+        selections={
+            key: tuple((tensors[i], name) for i, name in selection) for key, selection in index["selections"].items()
+        },
+    )
+
+
+def _write_index(header: CheckpointHeader) -> None:
+    positions = {tensor_range.name: i for i, tensor_range in enumerate(header.tensors)}
+    index = {
+        "format_version": CHECKPOINT_INDEX_FORMAT_VERSION,
+        "path": header.path,
+        "size": header.size,
+        "mtime_ns": header.mtime_ns,
+        "metadata": header.metadata,
+        "tensors": [
+            [r.name, str(r.dtype).removeprefix("torch."), list(r.shape), r.start, r.end] for r in header.tensors
+        ],
+        "selections": {
+            key: [[positions[tensor_range.name], name] for tensor_range, name in selection]
+            for key, selection in list(header.selections.items())
+        },
+    }
+    try:
+        index_path = checkpoint_index_path(header.path)
+        tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(index))
+        tmp_path.replace(index_path)
+    except OSError as e:
+        logger.warning(f"Could not write the checkpoint index of {header.path}: {e}")
@@ -0,0 +1,236 @@
+import functools
+import hashlib
+import json
+import logging
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+import safetensors
+import safetensors.torch
+import torch
+
+from ltx_core.loader.checkpoint_index import read_checkpoint_header
+from ltx_core.loader.parallel_io import load_tensor_ranges
+from ltx_core.loader.primitives import StateDict, StateDictLoader
+from ltx_core.loader.sd_ops import SDOps
+from ltx_core.utils import get_cache_dir
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+CONVERTED_FORMAT_VERSION = 1
+CONVERTED_INDEX_NAME = "index.json"
+
+
+@dataclass(frozen=True)
+class ConvertedComponent:
+    """
+    One component of a converted checkpoint, see :func:`convert_checkpoint`.
+    Attributes:
+        path: Path of the component's ``.safetensors`` file.
+        sd_ops: Name of the :class:`SDOps` whose key renaming and value operations were applied.
+        dtype: Dtype floating point tensors were cast to, or None if they were kept as produced by ``sd_ops``.
+        transposed: Keys stored as the contiguous transpose of a transposed view (e.g. FP8 weights in
+            cuBLAS layout); they are transposed back to the same view on load.
+    """
+
+    path: Path
+    sd_ops: str
+    dtype: torch.dtype | None
+    transposed: frozenset[str]
+
+
+def converted_checkpoint_dirs(checkpoint_path: str | Path) -> tuple[Path, ...]:
+    """
+    Directories searched for a converted copy of ``checkpoint_path``, in order of preference:
+    ``<stem>.converted`` next to the checkpoint, then ``converted/<stem>`` under
+    :func:`~ltx_core.utils.get_cache_dir` for checkpoints on read-only storage.
+    """
+    path = Path(checkpoint_path)
+    return path.with_name(f"{path.stem}.converted"), get_cache_dir("converted") / path.stem
+
+
+def find_converted_component(
+    paths: list[str], sd_ops: SDOps | None, dtype: torch.dtype | None = None
+) -> ConvertedComponent | None:
+    """
+    Return the converted file holding ``paths`` loaded with ``sd_ops`` and stored in ``dtype``, or None if
+    there is none. A component stored in another dtype than the one requested is not used, since casting it
+    back would not restore the original values (e.g. a float32 load of a bfloat16 conversion).
+    Only single-file checkpoints are converted. An index whose source fingerprint does not match the
+    checkpoint (e.g. the checkpoint was replaced after conversion) is ignored with a warning.
+    """
+    if sd_ops is None or len(paths) != 1 or not Path(paths[0]).is_file():
+        return None
+    checkpoint_path = Path(paths[0]).resolve()
+    stat = checkpoint_path.stat()
+    index_mtimes = tuple(
+        _mtime_ns(directory / CONVERTED_INDEX_NAME) for directory in converted_checkpoint_dirs(checkpoint_path)
+    )
+    components = _converted_components(str(checkpoint_path), stat.st_size, stat.st_mtime_ns, index_mtimes)
+    component = components.get(sd_ops.name)
+    if component is None:
+        return None
+    if component.dtype != dtype:
+        logger.info(
+            f"Not using converted {component.path}: stored in {component.dtype}, {dtype} requested. "
+            "Run ltx-convert with the same --dtype to use it."
+        )
+        return None
+    return component
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _converted_components(
+    checkpoint_path: str,
+    size: int,  # noqa: ARG001
+    mtime_ns: int,  # noqa: ARG001
+    index_mtimes_ns: tuple[int | None, ...],  # noqa: ARG001
+) -> dict[str, ConvertedComponent]:
+    # The checkpoint's size and mtime and the mtimes of the indexes are part of the cache key, so a replaced
+    # checkpoint and an index written (or removed) by another process are checked again
+    for directory in converted_checkpoint_dirs(checkpoint_path):
+        index_path = directory / CONVERTED_INDEX_NAME
+        if not index_path.is_file():
+            continue
+        index = json.loads(index_path.read_text())
+        if index.get("format_version") != CONVERTED_FORMAT_VERSION:
+            logger.warning(f"Ignoring converted checkpoint {directory}: unsupported format version")
+            continue
+        if index.get("source_fingerprint") != safetensors_header_fingerprint(checkpoint_path):
+            logger.warning(f"Ignoring converted checkpoint {directory}: it was created from a different checkpoint")
+            continue
+        return {
+            entry["sd_ops"]: ConvertedComponent(
+                path=directory / entry["file"],
+                sd_ops=entry["sd_ops"],
+                dtype=getattr(torch, entry["dtype"]) if entry["dtype"] is not None else None,
+                transposed=frozenset(entry["transposed"]),
+            )
+            for entry in index["components"].values()
+        }
+    return {}
+
+
+def convert_checkpoint(
+    checkpoint_path: str,
+    components: dict[str, tuple[SDOps, torch.dtype | None]],
+    loader: StateDictLoader,
+    output_dir: Path | None = None,
+) -> Path:
+    """
+    Split a single-file checkpoint into one load-ready ``.safetensors`` file per component.
+    Each component is loaded with its ``sd_ops`` (key renaming, filtering and value operations such
+    as FP8 downcasting), cast to its dtype and written with a JSON index. Loaders that find the
+    index in one of :func:`converted_checkpoint_dirs` read only the component's own file and skip
+    the key remapping.
+    Args:
+        checkpoint_path: Source ``.safetensors`` checkpoint.
+        components: Component name mapped to the ``sd_ops`` its builder loads it with and the dtype to
+            store floating point tensors in (None keeps the dtype produced by ``sd_ops``).
+        loader: Loader used to read the source; it must not itself prefer converted files.
+        output_dir: Output directory. Defaults to the first of :func:`converted_checkpoint_dirs`.
+    Returns:
+        Path of the written index.
+    """
+    output_dir = output_dir or converted_checkpoint_dirs(checkpoint_path)[0]
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Loaders must not pick up a directory whose files are being replaced
+    (output_dir / CONVERTED_INDEX_NAME).unlink(missing_ok=True)
+    entries = {}
+    for name, (sd_ops, dtype) in components.items():
+        state_dict = loader.load(checkpoint_path, sd_ops=sd_ops, device=torch.device("cpu"))
+        entries[name] = save_converted_component(output_dir, name, state_dict, sd_ops, dtype)
+        del state_dict
+        logger.info(
+            f"Converted {name}: {entries[name]['num_tensors']} tensors, {entries[name]['nbytes'] / 2**30:.2f} GiB"
+        )
+    return write_converted_index(output_dir, checkpoint_path, entries)
+
+
+def load_converted_component(component: ConvertedComponent, device: torch.device) -> StateDict:
+    """
+    Load a converted component as is: keys are final and tensors are read in file order, through
+    :func:`~ltx_core.loader.parallel_io.load_tensor_ranges` when ``device`` is a CUDA device.
+    """
+    ranges = list(read_checkpoint_header(component.path, persist=False).tensors)
+    if device.type == "cuda":
+        values = load_tensor_ranges(ranges, device)
+    else:
+        with safetensors.safe_open(str(component.path), framework="pt", device=str(device)) as f:
+            values = [f.get_tensor(r.name) for r in ranges]
+
+    sd = {}
+    size = 0
+    dtype = set()
+    for tensor_range, value in zip(ranges, values, strict=True):
+        size += value.nbytes
+        dtype.add(value.dtype)
+        sd[tensor_range.name] = value.t() if tensor_range.name in component.transposed else value
+    return StateDict(sd=sd, device=device, size=size, dtype=dtype)
+
+
+def save_converted_component(
+    output_dir: Path, name: str, state_dict: StateDict, sd_ops: SDOps, dtype: torch.dtype | None
+) -> dict:
+    """Write one component of a converted checkpoint and return its index entry."""
+    tensors, transposed = storage_layout(state_dict.sd, dtype)
+    file_name = f"{name}.safetensors"
+    tmp_path = output_dir / f"{file_name}.{os.getpid()}.tmp"
+    safetensors.torch.save_file(tensors, str(tmp_path), metadata={"sd_ops": sd_ops.name})
+    tmp_path.replace(output_dir / file_name)
+    return {
+        "file": file_name,
+        "sd_ops": sd_ops.name,
+        "dtype": str(dtype).removeprefix("torch.") if dtype is not None else None,
+        "transposed": sorted(transposed),
+        "num_tensors": len(tensors),
+        "nbytes": sum(t.nbytes for t in tensors.values()),
+    }
+
+
+def storage_layout(sd: dict[str, torch.Tensor], dtype: torch.dtype | None) -> tuple[dict[str, torch.Tensor], list[str]]:
+    """
+    Prepare a state dict for ``safetensors`` so that :func:`load_converted_component` restores the same
+    tensors. Floating point tensors are cast to ``dtype`` unless it is None. Tensors that are a transposed
+    view of contiguous storage are returned as that storage and their keys listed as transposed, everything
+    else is made contiguous.
+    """
+    tensors = {}
+    transposed = []
+    for key, value in sd.items():
+        tensor = value.to(dtype=dtype) if dtype is not None and value.is_floating_point() else value
+        if tensor.ndim == 2 and not tensor.is_contiguous() and tensor.t().is_contiguous():
+            transposed.append(key)
+            tensor = tensor.t()
+        tensors[key] = tensor.contiguous()
+    return tensors, transposed
+
+
+def write_converted_index(output_dir: Path, checkpoint_path: str, components: dict[str, dict]) -> Path:
+    """Write the JSON index of a converted checkpoint; loaders only use the directory once it exists."""
+    index = {
+        "format_version": CONVERTED_FORMAT_VERSION,
+        "source": Path(checkpoint_path).name,
+        "source_fingerprint": safetensors_header_fingerprint(checkpoint_path),
+        "components": components,
+    }
+    index_path = output_dir / CONVERTED_INDEX_NAME
+    index_path.write_text(json.dumps(index, indent=2))
+    _converted_components.cache_clear()
+    return index_path
+
+
+def safetensors_header_fingerprint(path: str | Path) -> str:
+    """SHA-256 of a safetensors header, which covers tensor names, dtypes, shapes, offsets and metadata."""
+    with Path(path).open("rb") as f:
+        (header_size,) = struct.unpack("<Q", f.read(8))
+        return hashlib.sha256(f.read(header_size)).hexdigest()
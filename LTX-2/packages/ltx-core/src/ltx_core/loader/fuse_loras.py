@@ -1,36 +1,65 @@
+from typing import Iterator
+
 import torch
 
 from ltx_core.loader.primitives import LoraStateDictWithStrength, StateDict
 from ltx_core.quantization.fp8_cast import calculate_weight_float8
 from ltx_core.quantization.fp8_scaled_mm import quantize_weight_to_fp8_per_tensor
 
+DEFAULT_FUSION_CHUNK_BYTES = 512 * 2**20
+
+# Device and delta dtype of the weight, and per contributing LoRA: its index in ``lora_sd_and_strengths`` and the
+# shapes and dtypes of its A/B factors
+LoraSignature = tuple[
+    torch.device, torch.dtype, tuple[tuple[int, torch.Size, torch.Size, torch.dtype, torch.dtype], ...]
+]
+FP8_DTYPES = (torch.float8_e4m3fn, torch.float8_e5m2)
+
 
 def apply_loras(
     model_sd: StateDict,
     lora_sd_and_strengths: list[LoraStateDictWithStrength],
     dtype: torch.dtype | None = None,
     destination_sd: StateDict | None = None,
+    chunk_bytes: int = DEFAULT_FUSION_CHUNK_BYTES,
 ) -> StateDict:
+    """
+    Fuse LoRAs into the weights of ``model_sd``.
+    Weights whose LoRA factors have the same shapes are fused together: their ``B @ A`` products are
+    computed with one ``bmm`` per LoRA over chunks of at most ``chunk_bytes`` of deltas, and the factors of
+    the next chunk are copied to the device on a side stream while the current chunk is fused. Each product
+    is cast to the delta dtype before the products of several LoRAs are summed, as when fusing weight by
+    weight, so the fused weights are the same. For that reason products are not accumulated with
+    ``addmm_``/``baddbmm_``: those add a product to the weight, or to the products of other LoRAs, before it is
+    rounded to the delta dtype, which changes the last bits of the fused weights. The base weight is instead
+    added in place into the buffer of its delta.
+    Args:
+        model_sd: Base weights.
+        lora_sd_and_strengths: LoRA state dicts and their strengths.
+        dtype: Dtype of the fused weights. Defaults to the dtype of each base weight.
+        destination_sd: State dict to write the fused weights into, e.g. ``model_sd`` when it is not shared.
+        chunk_bytes: Upper bound on the size of the deltas computed at once.
+    Returns:
+        The state dict with the fused weights. With ``destination_sd``, weights no LoRA affects are kept
+        as they are (cast only if their dtype differs) and fused weights replace theirs, so the peak
+        memory is the base weights plus one chunk of deltas; otherwise every weight is copied.
+    """
     sd = {}
     if destination_sd is not None:
         sd = destination_sd.sd
     size = 0
     device = torch.device("meta")
     inner_dtypes = set()
-    for key, weight in model_sd.sd.items():
-        if weight is None:
-            continue
-        # Skip scale keys - they are handled together with their weight keys
-        if key.endswith(".weight_scale"):
-            continue
+    # Skip scale keys - they are handled together with their weight keys
+    keys = [key for key, weight in model_sd.sd.items() if weight is not None and not key.endswith(".weight_scale")]
+    for key, deltas in _lora_deltas(keys, model_sd, lora_sd_and_strengths, dtype, chunk_bytes):
+        weight = model_sd.sd[key]
         device = weight.device
         target_dtype = dtype if dtype is not None else weight.dtype
-        deltas_dtype = target_dtype if target_dtype not in [torch.float8_e4m3fn, torch.float8_e5m2] else torch.bfloat16
 
         scale_key = key.replace(".weight", ".weight_scale") if key.endswith(".weight") else None
         is_scaled_fp8 = scale_key is not None and scale_key in model_sd.sd
 
-        deltas = _prepare_deltas(lora_sd_and_strengths, key, deltas_dtype, device)
         fused = _fuse_deltas(deltas, weight, key, sd, target_dtype, device, is_scaled_fp8, scale_key, model_sd)
 
         sd.update(fused)
@@ -39,30 +68,129 @@ def apply_loras(
             size += tensor.nbytes
 
     if destination_sd is not None:
-        return destination_sd
+        # Only fused and cast weights were replaced, so account for the whole state dict
+        tensors = [tensor for tensor in sd.values() if tensor is not None]
+        return StateDict(sd, destination_sd.device, sum(t.nbytes for t in tensors), {t.dtype for t in tensors})
     return StateDict(sd, device, size, inner_dtypes)
 
 
-def _prepare_deltas(
-    lora_sd_and_strengths: list[LoraStateDictWithStrength], key: str, dtype: torch.dtype, device: torch.device
-) -> torch.Tensor | None:
-    deltas = []
+def _lora_deltas(
+    keys: list[str],
+    model_sd: StateDict,
+    lora_sd_and_strengths: list[LoraStateDictWithStrength],
+    dtype: torch.dtype | None,
+    chunk_bytes: int,
+) -> Iterator[tuple[str, torch.Tensor | None]]:
+    """
+    Yield every key with the sum of its scaled LoRA products, each cast to the delta dtype (see
+    :func:`_deltas_dtype`) before they are summed, or None for keys no LoRA applies to. Keys are batched by
+    :data:`LoraSignature`.
+    """
+    groups: dict[LoraSignature, list[str]] = {}
+    for key in keys:
+        weight = model_sd.sd[key]
+        signature = _lora_signature(key, weight.device, _deltas_dtype(weight, dtype), lora_sd_and_strengths)
+        if signature is None:
+            yield key, None
+        else:
+            groups.setdefault(signature, []).append(key)
+
+    chunks = []
+    for signature, group_keys in groups.items():
+        _, deltas_dtype, ((_, a_shape, b_shape, _, b_dtype), *_) = signature
+        delta_bytes = b_shape[0] * a_shape[1] * max(b_dtype.itemsize, deltas_dtype.itemsize)
+        chunk_size = max(1, chunk_bytes // delta_bytes)
+        chunks.extend((signature, group_keys[i : i + chunk_size]) for i in range(0, len(group_keys), chunk_size))
+
+    copy_streams = {}
+    prefetched = _prefetch_factors(*chunks[0], lora_sd_and_strengths, copy_streams) if chunks else None
+    for i in range(len(chunks)):
+        chunk_keys, factors, copied = prefetched
+        if i + 1 < len(chunks):
+            prefetched = _prefetch_factors(*chunks[i + 1], lora_sd_and_strengths, copy_streams)
+        if copied is not None:
+            _wait_for_factors(factors, copied)
+        deltas_dtype = chunks[i][0][1]
+        products = [torch.bmm(b * coef, a).to(dtype=deltas_dtype) for a, b, coef in factors]
+        del factors
+        deltas = products[0] if len(products) == 1 else torch.sum(torch.stack(products, dim=0), dim=0)
+        del products
+        yield from zip(chunk_keys, deltas.unbind(0), strict=True)
+
+
+def _deltas_dtype(weight: torch.Tensor, dtype: torch.dtype | None) -> torch.dtype:
+    """Dtype the LoRA deltas of ``weight`` are summed and fused in: the target dtype, or bfloat16 for FP8."""
+    target_dtype = dtype if dtype is not None else weight.dtype
+    return target_dtype if target_dtype not in FP8_DTYPES else torch.bfloat16
+
+
+def _lora_signature(
+    key: str,
+    device: torch.device,
+    deltas_dtype: torch.dtype,
+    lora_sd_and_strengths: list[LoraStateDictWithStrength],
+) -> LoraSignature | None:
     prefix = key[: -len(".weight")]
     key_a = f"{prefix}.lora_A.weight"
     key_b = f"{prefix}.lora_B.weight"
-    for lsd, coef in lora_sd_and_strengths:
-        if key_a not in lsd.sd or key_b not in lsd.sd:
-            continue
-        a = lsd.sd[key_a].to(device=device)
-        b = lsd.sd[key_b].to(device=device)
-        product = torch.matmul(b * coef, a)
-        del a, b
-        deltas.append(product.to(dtype=dtype))
-    if len(deltas) == 0:
-        return None
-    elif len(deltas) == 1:
-        return deltas[0]
-    return torch.sum(torch.stack(deltas, dim=0), dim=0)
+    factors = tuple(
+        (index, lsd.sd[key_a].shape, lsd.sd[key_b].shape, lsd.sd[key_a].dtype, lsd.sd[key_b].dtype)
+        for index, (lsd, _) in enumerate(lora_sd_and_strengths)
+        if key_a in lsd.sd and key_b in lsd.sd
+    )
+    return (device, deltas_dtype, factors) if factors else None
+
+
+def _prefetch_factors(
+    signature: LoraSignature,
+    keys: list[str],
+    lora_sd_and_strengths: list[LoraStateDictWithStrength],
+    copy_streams: dict[torch.device, torch.cuda.Stream],
+) -> tuple[list[str], list[tuple[torch.Tensor, torch.Tensor, float]], torch.cuda.Event | None]:
+    """
+    Stack the LoRA factors of ``keys`` and start copying them to the device of the weights. On CUDA the
+    copies run on a side stream and the returned event marks their completion.
+    """
+    device, _, lora_factors = signature
+    prefixes = [key[: -len(".weight")] for key in keys]
+    if device.type != "cuda":
+        factors = [_stack_factors(lora_sd_and_strengths[index], prefixes, device) for index, *_ in lora_factors]
+        return keys, factors, None
+
+    copy_stream = copy_streams.setdefault(device, torch.cuda.Stream(device=device))
+    copy_stream.wait_stream(torch.cuda.current_stream(device))
+    with torch.cuda.stream(copy_stream):
+        factors = [_stack_factors(lora_sd_and_strengths[index], prefixes, device) for index, *_ in lora_factors]
+        copied = torch.cuda.Event()
+        copied.record(copy_stream)
+    return keys, factors, copied
+
+
+def _wait_for_factors(factors: list[tuple[torch.Tensor, torch.Tensor, float]], copied: torch.cuda.Event) -> None:
+    current_stream = torch.cuda.current_stream(factors[0][0].device)
+    current_stream.wait_event(copied)
+    # The factors were allocated on the copy stream but are used and freed on the current one
+    for a, b, _ in factors:
+        a.record_stream(current_stream)
+        b.record_stream(current_stream)
+
+
+def _stack_factors(
+    lora_sd_and_strength: LoraStateDictWithStrength, prefixes: list[str], device: torch.device
+) -> tuple[torch.Tensor, torch.Tensor, float]:
+    lsd, coef = lora_sd_and_strength
+    a = _stack([lsd.sd[f"{prefix}.lora_A.weight"] for prefix in prefixes], device)
+    b = _stack([lsd.sd[f"{prefix}.lora_B.weight"] for prefix in prefixes], device)
+    return a, b, coef
+
+
+def _stack(tensors: list[torch.Tensor], device: torch.device) -> torch.Tensor:
+    if device.type != "cuda" or all(t.device == device for t in tensors):
+        return torch.stack([t.to(device=device) for t in tensors])
+    # Stage host tensors in pinned memory so that the copy to the device is asynchronous
+    staged = torch.empty((len(tensors), *tensors[0].shape), dtype=tensors[0].dtype, pin_memory=True)
+    torch.stack([t.cpu() for t in tensors], out=staged)
+    return staged.to(device=device, non_blocking=True)
 
 
 def _fuse_deltas(
@@ -78,7 +206,8 @@ def _fuse_deltas(
 ) -> dict[str, torch.Tensor]:
     if deltas is None:
         if key in sd:
-            return {}
+            # sd is the model's own state dict (destination_sd), which no registry shares
+            return _alias_weight_without_lora(sd[key], key, target_dtype)
         fused = _copy_weight_without_lora(weight, key, target_dtype, device, is_scaled_fp8, scale_key, model_sd)
     elif weight.dtype == torch.float8_e4m3fn:
         if is_scaled_fp8:
@@ -93,6 +222,13 @@ def _fuse_deltas(
     return fused
 
 
+def _alias_weight_without_lora(weight: torch.Tensor, key: str, target_dtype: torch.dtype) -> dict[str, torch.Tensor]:
+    """Keep a weight no LoRA affects in place, only replacing it by its cast when the dtype differs."""
+    if weight.dtype == target_dtype:
+        return {}
+    return {key: weight.to(dtype=target_dtype)}
+
+
 def _copy_weight_without_lora(
     weight: torch.Tensor,
     key: str,
@@ -103,7 +239,7 @@ def _copy_weight_without_lora(
     model_sd: StateDict,
 ) -> dict[str, torch.Tensor]:
     """Copy original weight (and scale if applicable) when no LoRA affects this key."""
-    result = {key: weight.clone().to(dtype=target_dtype, device=device)}
+    result = {key: weight.to(dtype=target_dtype, device=device, copy=True)}
     if is_scaled_fp8:
         result[scale_key] = model_sd.sd[scale_key].clone()
     return result
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import safetensors.torch
+import torch
+
+from ltx_core.loader.checkpoint_index import read_checkpoint_header
+from ltx_core.loader.converted_checkpoint import ConvertedComponent, load_converted_component, storage_layout
+from ltx_core.loader.module_ops import ModuleOps
+from ltx_core.loader.primitives import LoraPathStrengthAndSDOps, StateDict
+from ltx_core.loader.sd_ops import SDOps
+from ltx_core.utils import get_cache_dir
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+FUSED_LORA_CACHE_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class FusedLoraCache:
+    """
+    On-disk cache of state dicts with LoRAs fused in, so that a model built from the same base
+    checkpoint and LoRAs (e.g. the stage 2 transformer with the distilled LoRA) is read back instead of
+    fused again. Entries are content addressed by :meth:`key` and evicted in least-recently-used order
+    once the cache exceeds ``max_bytes``.
+    Attributes:
+        directory: Directory holding one ``<key>.safetensors`` file per entry.
+        max_bytes: Size budget of the directory.
+    """
+
+    directory: Path
+    max_bytes: int
+
+    def key(
+        self,
+        model_paths: list[str],
+        model_sd_ops: SDOps | None,
+        module_ops: tuple[ModuleOps, ...],
+        loras: tuple[LoraPathStrengthAndSDOps, ...],
+        dtype: torch.dtype | None,
+    ) -> str:
+        """
+        Hash of everything the fused state dict depends on: the base checkpoint and LoRA files (path,
+        size and modification time), the LoRA strengths, the state dict operations, the module
+        operations (which include the quantization policy) and the dtype.
+        """
+        description = {
+            "format_version": FUSED_LORA_CACHE_FORMAT_VERSION,
+            "model": [_file_identity(path) for path in model_paths],
+            "model_sd_ops": model_sd_ops.name if model_sd_ops is not None else None,
+            "module_ops": [module_op.name for module_op in module_ops],
+            "loras": [
+                (_file_identity(lora.path), lora.strength, lora.sd_ops.name if lora.sd_ops is not None else None)
+                for lora in loras
+            ],
+            "dtype": str(dtype),
+        }
+        return hashlib.sha256(json.dumps(description).encode("utf-8")).hexdigest()
+
+    def load(self, key: str, device: torch.device) -> StateDict | None:
+        """Return the cached state dict for ``key``, or None if it is not cached."""
+        path = self.directory / f"{key}.safetensors"
+        if not path.is_file():
+            return None
+        transposed = frozenset(json.loads(read_checkpoint_header(path, persist=False).metadata["transposed"]))
+        # Mark the entry as recently used
+        os.utime(path)
+        logger.info(f"Loading fused LoRA weights from {path}")
+        return load_converted_component(ConvertedComponent(path, sd_ops="", dtype=None, transposed=transposed), device)
+
+    def save(self, key: str, state_dict: StateDict) -> None:
+        """Store ``state_dict`` under ``key`` and evict least recently used entries beyond the budget."""
+        if state_dict.size > self.max_bytes:
+            return
+        tensors, transposed = storage_layout(state_dict.sd, dtype=None)
+        path = self.directory / f"{key}.safetensors"
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        safetensors.torch.save_file(tensors, str(tmp_path), metadata={"transposed": json.dumps(transposed)})
+        tmp_path.replace(path)
+        self._evict(keep=path)
+
+    def _evict(self, keep: Path) -> None:
+        entries = sorted(
+            ((path, path.stat()) for path in self.directory.glob("*.safetensors")),
+            key=lambda entry: entry[1].st_mtime_ns,
+        )
+        total_bytes = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            logger.info(f"Evicting {stat.st_size / 2**30:.2f} GiB of fused LoRA weights from {self.directory}")
+            path.unlink(missing_ok=True)
+            total_bytes -= stat.st_size
+
+
+def fused_lora_cache_from_env() -> FusedLoraCache | None:
+    """
+    Cache under ``fused_loras`` in :func:`~ltx_core.utils.get_cache_dir` with a budget of
+    ``$LTX_FUSED_LORA_CACHE_GB`` gigabytes, or None (no caching) when the variable is unset or ``0``.
+    """
+    max_gb = float(os.environ.get("LTX_FUSED_LORA_CACHE_GB", "0"))
+    if max_gb <= 0:
+        return None
+    return FusedLoraCache(directory=get_cache_dir("fused_loras"), max_bytes=int(max_gb * 2**30))
+
+
+def _file_identity(path: str) -> tuple[str, int, int]:
+    stat = Path(path).stat()
+    return str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns
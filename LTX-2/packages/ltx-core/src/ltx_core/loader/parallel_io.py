@@ -0,0 +1,166 @@
+import json
+import mmap
+import queue
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import torch
+
+SAFETENSORS_DTYPES: dict[str, torch.dtype] = {
+    "F64": torch.float64,
+    "F32": torch.float32,
+    "F16": torch.float16,
+    "BF16": torch.bfloat16,
+    "F8_E4M3": torch.float8_e4m3fn,
+    "F8_E5M2": torch.float8_e5m2,
+    "I64": torch.int64,
+    "I32": torch.int32,
+    "I16": torch.int16,
+    "I8": torch.int8,
+    "U8": torch.uint8,
+    "BOOL": torch.bool,
+}
+
+DEFAULT_NUM_WORKERS = 8
+DEFAULT_BUFFER_BYTES = 32 * 2**20
+
+
+@dataclass(frozen=True)
+class TensorRange:
+    """
+    Location of one tensor in a safetensors file.
+    Attributes:
+        path: File holding the tensor.
+        name: Key of the tensor in the file.
+        dtype: Stored dtype.
+        shape: Stored shape.
+        start: Absolute byte offset of the tensor data in the file.
+        end: Absolute byte offset one past the tensor data.
+    """
+
+    path: str
+    name: str
+    dtype: torch.dtype
+    shape: tuple[int, ...]
+    start: int
+    end: int
+
+    @property
+    def nbytes(self) -> int:
+        return self.end - self.start
+
+
+def read_safetensors_header(path: str | Path) -> list[TensorRange]:
+    """Parse the header of a safetensors file and return its tensors in file order."""
+    return parse_safetensors_header(path)[1]
+
+
+def parse_safetensors_header(path: str | Path) -> tuple[dict[str, str], list[TensorRange]]:
+    """Parse the header of a safetensors file and return its metadata and its tensors in file order."""
+    with Path(path).open("rb") as f:
+        (header_size,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_size))
+    metadata = header.pop("__metadata__", None) or {}
+    data_start = 8 + header_size
+    ranges = [
+        TensorRange(
+            path=str(path),
+            name=name,
+            dtype=SAFETENSORS_DTYPES[info["dtype"]],
+            shape=tuple(info["shape"]),
+            start=data_start + info["data_offsets"][0],
+            end=data_start + info["data_offsets"][1],
+        )
+        for name, info in header.items()
+    ]
+    return metadata, sorted(ranges, key=lambda r: r.start)
+
+
+@dataclass
+class _StagingSlot:
+    buffer: torch.Tensor
+    stream: torch.cuda.Stream
+    event: torch.cuda.Event
+
+
+def load_tensor_ranges(
+    ranges: list[TensorRange],
+    device: torch.device,
+    num_workers: int = DEFAULT_NUM_WORKERS,
+    buffer_bytes: int = DEFAULT_BUFFER_BYTES,
+) -> list[torch.Tensor]:
+    """
+    Read tensors from memory-mapped safetensors files straight into CUDA memory.
+    Tensors are split into chunks of at most ``buffer_bytes``. A pool of ``num_workers`` threads copies
+    chunks out of the mapping (faulting the pages in, so reads are issued in parallel) into a ring of
+    ``2 * num_workers`` pinned staging buffers, and each buffer is copied to the device asynchronously
+    on its own stream. A buffer is reused once its previous copy has completed, so the host memory in
+    use is the ring rather than the model, and disk reads overlap with host-to-device transfers.
+    Args:
+        ranges: Tensors to read, as returned by :func:`read_safetensors_header`.
+        device: CUDA device to place the tensors on.
+        num_workers: Number of reader threads.
+        buffer_bytes: Size of each pinned staging buffer.
+    Returns:
+        Device tensors in the order of ``ranges``, with their stored dtype and shape.
+    """
+    outputs = [torch.empty(r.nbytes, dtype=torch.uint8, device=device) for r in ranges]
+    chunks = [
+        (r, out[offset : offset + buffer_bytes], offset)
+        for r, out in zip(ranges, outputs, strict=True)
+        for offset in range(0, r.nbytes, buffer_bytes)
+    ]
+
+    current_stream = torch.cuda.current_stream(device)
+    slots = [
+        _StagingSlot(
+            buffer=torch.empty(
+                min(buffer_bytes, max((r.nbytes for r in ranges), default=1)), dtype=torch.uint8
+            ).pin_memory(),
+            stream=torch.cuda.Stream(device=device),
+            event=torch.cuda.Event(),
+        )
+        for _ in range(2 * num_workers)
+    ]
+    free_slots: queue.SimpleQueue[_StagingSlot] = queue.SimpleQueue()
+    for slot in slots:
+        # Output allocations are ordered on the current stream
+        slot.stream.wait_stream(current_stream)
+        free_slots.put(slot)
+
+    with ExitStack() as stack:
+        mappings = {}
+        for path in {r.path for r in ranges}:
+            file = stack.enter_context(Path(path).open("rb"))
+            mappings[path] = stack.enter_context(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+        def copy_chunk(chunk: tuple[TensorRange, torch.Tensor, int]) -> None:
+            tensor_range, destination, offset = chunk
+            num_bytes = destination.numel()
+            slot = free_slots.get()
+            try:
+                slot.event.synchronize()
+                source = np.frombuffer(
+                    mappings[tensor_range.path], dtype=np.uint8, count=num_bytes, offset=tensor_range.start + offset
+                )
+                slot.buffer[:num_bytes].numpy()[:] = source
+                del source
+                with torch.cuda.stream(slot.stream):
+                    destination.copy_(slot.buffer[:num_bytes], non_blocking=True)
+                    slot.event.record(slot.stream)
+            finally:
+                free_slots.put(slot)
+
+        with ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="safetensors-loader") as pool:
+            # Consume the iterator so that worker exceptions are raised here
+            list(pool.map(copy_chunk, chunks))
+
+        for slot in slots:
+            slot.event.synchronize()
+            current_stream.wait_event(slot.event)
+
+    return [out.view(r.dtype).reshape(r.shape) for r, out in zip(ranges, outputs, strict=True)]
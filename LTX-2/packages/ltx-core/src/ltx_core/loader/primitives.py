@@ -41,9 +41,16 @@ class StateDictLoader(Protocol):
         Load metadata from path
         """
 
-    def load(self, path: str | list[str], sd_ops: SDOps | None = None, device: torch.device | None = None) -> StateDict:
+    def load(
+        self,
+        path: str | list[str],
+        sd_ops: SDOps | None = None,
+        device: torch.device | None = None,
+        dtype: torch.dtype | None = None,
+    ) -> StateDict:
         """
-        Load state dict from path or paths (for sharded model storage) and apply sd_ops
+        Load state dict from path or paths (for sharded model storage) and apply sd_ops. ``dtype`` is the dtype
+        the caller will cast floating point tensors to, if any; loaders may return tensors already in it.
         """
 
 
@@ -1,12 +1,20 @@
+import functools
 import hashlib
+import logging
+import os
 import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Protocol
+from typing import Callable, Protocol
+
+import torch
 
 from ltx_core.loader.primitives import StateDict
 from ltx_core.loader.sd_ops import SDOps
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 
 class Registry(Protocol):
     """
@@ -16,14 +24,26 @@ class Registry(Protocol):
     - add: Add a state dictionary to the registry
     - pop: Remove a state dictionary from the registry
     - get: Retrieve a state dictionary from the registry
+    - get_or_load: Retrieve a state dictionary, loading and adding it if missing, and hold a reference to it
+    - release: Drop a reference taken by get_or_load
     - clear: Clear all state dictionaries from the registry
+    Entries are keyed by ``paths``, ``sd_ops`` and the optional ``dtype`` the state dict was loaded for, since
+    pre-converted checkpoints (see :mod:`ltx_core.loader.converted_checkpoint`) store a dtype.
     """
 
-    def add(self, paths: list[str], sd_ops: SDOps | None, state_dict: StateDict) -> None: ...
+    def add(
+        self, paths: list[str], sd_ops: SDOps | None, state_dict: StateDict, dtype: torch.dtype | None = None
+    ) -> None: ...
+
+    def pop(self, paths: list[str], sd_ops: SDOps | None, dtype: torch.dtype | None = None) -> StateDict | None: ...
+
+    def get(self, paths: list[str], sd_ops: SDOps | None, dtype: torch.dtype | None = None) -> StateDict | None: ...
 
-    def pop(self, paths: list[str], sd_ops: SDOps | None) -> StateDict | None: ...
+    def get_or_load(
+        self, paths: list[str], sd_ops: SDOps | None, load: Callable[[], StateDict], dtype: torch.dtype | None = None
+    ) -> StateDict: ...
 
-    def get(self, paths: list[str], sd_ops: SDOps | None) -> StateDict | None: ...
+    def release(self, paths: list[str], sd_ops: SDOps | None, dtype: torch.dtype | None = None) -> None: ...
 
     def clear(self) -> None: ...
 
@@ -33,52 +53,165 @@ class DummyRegistry(Registry):
     Dummy registry that does not store state dictionaries.
     """
 
-    def add(self, paths: list[str], sd_ops: SDOps | None, state_dict: StateDict) -> None:
+    def add(
+        self, paths: list[str], sd_ops: SDOps | None, state_dict: StateDict, dtype: torch.dtype | None = None
+    ) -> None:
         pass
 
-    def pop(self, paths: list[str], sd_ops: SDOps | None) -> StateDict | None:
+    def pop(self, paths: list[str], sd_ops: SDOps | None, dtype: torch.dtype | None = None) -> StateDict | None:
         pass
 
-    def get(self, paths: list[str], sd_ops: SDOps | None) -> StateDict | None:
+    def get(self, paths: list[str], sd_ops: SDOps | None, dtype: torch.dtype | None = None) -> StateDict | None:
+        pass
+
+    def get_or_load(
+        self,
+        paths: list[str],  # noqa: ARG002
+        sd_ops: SDOps | None,  # noqa: ARG002
+        load: Callable[[], StateDict],
+        dtype: torch.dtype | None = None,  # noqa: ARG002
+    ) -> StateDict:
+        return load()
+
+    def release(self, paths: list[str], sd_ops: SDOps | None, dtype: torch.dtype | None = None) -> None:
         pass
 
     def clear(self) -> None:
         pass
 
 
+@dataclass
+class _RegistryEntry:
+    state_dict: StateDict
+    refcount: int = 0
+
+
 @dataclass
 class StateDictRegistry(Registry):
     """
     Registry that stores state dictionaries in a dictionary.
+    Entries are reference counted: :meth:`get_or_load` takes a reference that :meth:`release` drops,
+    and builders hold one while they build a model from the state dict. When the total
+    :meth:`StateDict.footprint` of the entries exceeds ``max_bytes``, unreferenced entries are evicted
+    in least-recently-used order. Entries in use are never evicted, so the budget can be exceeded
+    while they are.
+    Attributes:
+        max_bytes: Budget for the resident state dicts, or None for no limit.
     """
 
-    _state_dicts: dict[str, StateDict] = field(default_factory=dict)
+    max_bytes: int | None = None
+    _state_dicts: OrderedDict[str, _RegistryEntry] = field(default_factory=OrderedDict)
+    _loading: dict[str, threading.Event] = field(default_factory=dict)
     _lock: threading.Lock = field(default_factory=threading.Lock)
 
-    def _generate_id(self, paths: list[str], sd_ops: SDOps) -> str:
+    def _generate_id(self, paths: list[str], sd_ops: SDOps, dtype: torch.dtype | None) -> str:
         m = hashlib.sha256()
         parts = [str(Path(p).resolve()) for p in paths]
         if sd_ops is not None:
             parts.append(sd_ops.name)
+        if dtype is not None:
+            parts.append(str(dtype))
         m.update("\0".join(parts).encode("utf-8"))
         return m.hexdigest()
 
-    def add(self, paths: list[str], sd_ops: SDOps | None, state_dict: StateDict) -> str:
-        sd_id = self._generate_id(paths, sd_ops)
+    def add(
+        self, paths: list[str], sd_ops: SDOps | None, state_dict: StateDict, dtype: torch.dtype | None = None
+    ) -> str:
+        sd_id = self._generate_id(paths, sd_ops, dtype)
         with self._lock:
             if sd_id in self._state_dicts:
                 raise ValueError(f"State dict retrieved from {paths} with {sd_ops} already added, check with get first")
-            self._state_dicts[sd_id] = state_dict
+            self._state_dicts[sd_id] = _RegistryEntry(state_dict)
+            self._evict()
         return sd_id
 
-    def pop(self, paths: list[str], sd_ops: SDOps | None) -> StateDict | None:
+    def pop(self, paths: list[str], sd_ops: SDOps | None, dtype: torch.dtype | None = None) -> StateDict | None:
+        with self._lock:
+            entry = self._state_dicts.pop(self._generate_id(paths, sd_ops, dtype), None)
+        return entry.state_dict if entry is not None else None
+
+    def get(self, paths: list[str], sd_ops: SDOps | None, dtype: torch.dtype | None = None) -> StateDict | None:
         with self._lock:
-            return self._state_dicts.pop(self._generate_id(paths, sd_ops), None)
+            entry = self._state_dicts.get(self._generate_id(paths, sd_ops, dtype), None)
+        return entry.state_dict if entry is not None else None
+
+    def get_or_load(
+        self, paths: list[str], sd_ops: SDOps | None, load: Callable[[], StateDict], dtype: torch.dtype | None = None
+    ) -> StateDict:
+        """
+        Return the state dict for ``paths`` and ``sd_ops`` with a reference taken on it, calling ``load``
+        if it is not registered. Concurrent callers for the same key wait for a single load; if it fails,
+        one of them loads again.
+        """
+        sd_id = self._generate_id(paths, sd_ops, dtype)
+        while True:
+            with self._lock:
+                entry = self._state_dicts.get(sd_id)
+                if entry is not None:
+                    entry.refcount += 1
+                    self._state_dicts.move_to_end(sd_id)
+                    return entry.state_dict
+                loading = self._loading.get(sd_id)
+                if loading is None:
+                    loading = self._loading[sd_id] = threading.Event()
+                    break
+            loading.wait()
+
+        try:
+            state_dict = load()
+            with self._lock:
+                self._state_dicts[sd_id] = _RegistryEntry(state_dict, refcount=1)
+                self._evict()
+        finally:
+            with self._lock:
+                del self._loading[sd_id]
+            loading.set()
+        return state_dict
+
+    def release(self, paths: list[str], sd_ops: SDOps | None, dtype: torch.dtype | None = None) -> None:
+        with self._lock:
+            entry = self._state_dicts.get(self._generate_id(paths, sd_ops, dtype))
+            if entry is not None and entry.refcount > 0:
+                entry.refcount -= 1
+                self._evict()
 
-    def get(self, paths: list[str], sd_ops: SDOps | None) -> StateDict | None:
+    def resident_bytes(self) -> int:
         with self._lock:
-            return self._state_dicts.get(self._generate_id(paths, sd_ops), None)
+            return self._resident_bytes()
 
     def clear(self) -> None:
         with self._lock:
             self._state_dicts.clear()
+
+    def _resident_bytes(self) -> int:
+        return sum(entry.state_dict.footprint()[0] for entry in self._state_dicts.values())
+
+    def _evict(self) -> None:
+        if self.max_bytes is None:
+            return
+        resident_bytes = self._resident_bytes()
+        for sd_id, entry in list(self._state_dicts.items()):
+            if resident_bytes <= self.max_bytes:
+                break
+            if entry.refcount == 0:
+                size, device = entry.state_dict.footprint()
+                logger.info(f"Evicting {size / 2**30:.2f} GiB state dict on {device} from the registry")
+                del self._state_dicts[sd_id]
+                resident_bytes -= size
+
+
+@functools.cache
+def shared_registry() -> StateDictRegistry:
+    """
+    Process-wide :class:`StateDictRegistry` that model ledgers can share (``registry=shared_registry()``),
+    so pipelines served by one process load a checkpoint once. Its budget is ``$LTX_REGISTRY_MAX_GB``
+    gigabytes, or half of the physical memory when unset; ``0`` disables caching.
+    """
+    max_gb = os.environ.get("LTX_REGISTRY_MAX_GB")
+    if max_gb is not None:
+        return StateDictRegistry(max_bytes=int(float(max_gb) * 2**30))
+    try:
+        physical_memory = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return StateDictRegistry()
+    return StateDictRegistry(max_bytes=physical_memory // 2)
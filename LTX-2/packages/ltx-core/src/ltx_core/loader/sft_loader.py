@@ -1,8 +1,16 @@
-import json
+import copy
+from typing import Iterator
 
 import safetensors
 import torch
 
+from ltx_core.loader.checkpoint_index import read_checkpoint_header
+from ltx_core.loader.converted_checkpoint import find_converted_component, load_converted_component
+from ltx_core.loader.parallel_io import (
+    DEFAULT_BUFFER_BYTES,
+    DEFAULT_NUM_WORKERS,
+    load_tensor_ranges,
+)
 from ltx_core.loader.primitives import StateDict, StateDictLoader
 from ltx_core.loader.sd_ops import SDOps
 
@@ -12,37 +20,83 @@ class SafetensorsStateDictLoader(StateDictLoader):
     Loads weights from safetensors files without metadata support.
     Use this for loading raw weight files. For model files that include
     configuration metadata, use SafetensorsModelStateDictLoader instead.
+    If the checkpoint was split with :func:`~ltx_core.loader.converted_checkpoint.convert_checkpoint`,
+    the converted file matching ``sd_ops`` is loaded instead, unless ``use_converted`` is False.
+    Loading onto a CUDA device reads the memory-mapped files with ``num_workers`` threads through
+    pinned staging buffers of ``buffer_bytes`` (see :func:`~ltx_core.loader.parallel_io.load_tensor_ranges`).
+    The keys ``sd_ops`` selects come from :func:`~ltx_core.loader.checkpoint_index.read_checkpoint_header`,
+    so builders sharing a checkpoint do not parse its header and scan its keys again.
     """
 
+    def __init__(
+        self,
+        use_converted: bool = True,
+        num_workers: int = DEFAULT_NUM_WORKERS,
+        buffer_bytes: int = DEFAULT_BUFFER_BYTES,
+    ):
+        self.use_converted = use_converted
+        self.num_workers = num_workers
+        self.buffer_bytes = buffer_bytes
+
     def metadata(self, path: str) -> dict:
         raise NotImplementedError("Not implemented")
 
-    def load(self, path: str | list[str], sd_ops: SDOps, device: torch.device | None = None) -> StateDict:
+    def load(
+        self,
+        path: str | list[str],
+        sd_ops: SDOps,
+        device: torch.device | None = None,
+        dtype: torch.dtype | None = None,
+    ) -> StateDict:
         """
-        Load state dict from path or paths (for sharded model storage) and apply sd_ops
+        Load state dict from path or paths (for sharded model storage) and apply sd_ops. A converted copy of the
+        checkpoint is preferred when it was stored in ``dtype`` (see
+        :func:`~ltx_core.loader.converted_checkpoint.find_converted_component`).
         """
         sd = {}
         size = 0
-        dtype = set()
+        dtypes = set()
         device = device or torch.device("cpu")
         model_paths = path if isinstance(path, list) else [path]
+        converted = find_converted_component(model_paths, sd_ops, dtype) if self.use_converted else None
+        if converted is not None:
+            return load_converted_component(converted, device)
+
+        tensors = (
+            self._read_parallel(model_paths, sd_ops, device)
+            if device.type == "cuda"
+            else self._read_sequential(model_paths, sd_ops, device)
+        )
+        for expected_name, tensor in tensors:
+            key_value_pairs = ((expected_name, tensor),)
+            if sd_ops is not None:
+                key_value_pairs = sd_ops.apply_to_key_value(expected_name, tensor)
+            for key, value in key_value_pairs:
+                size += value.nbytes
+                dtypes.add(value.dtype)
+                sd[key] = value
+
+        return StateDict(sd=sd, device=device, size=size, dtype=dtypes)
+
+    def _read_sequential(
+        self, model_paths: list[str], sd_ops: SDOps | None, device: torch.device
+    ) -> Iterator[tuple[str, torch.Tensor]]:
         for shard_path in model_paths:
+            selection = read_checkpoint_header(shard_path).select(sd_ops)
             with safetensors.safe_open(shard_path, framework="pt", device=str(device)) as f:
-                safetensor_keys = f.keys()
-                for name in safetensor_keys:
-                    expected_name = name if sd_ops is None else sd_ops.apply_to_key(name)
-                    if expected_name is None:
-                        continue
-                    value = f.get_tensor(name).to(device=device, non_blocking=True, copy=False)
-                    key_value_pairs = ((expected_name, value),)
-                    if sd_ops is not None:
-                        key_value_pairs = sd_ops.apply_to_key_value(expected_name, value)
-                    for key, value in key_value_pairs:
-                        size += value.nbytes
-                        dtype.add(value.dtype)
-                        sd[key] = value
-
-        return StateDict(sd=sd, device=device, size=size, dtype=dtype)
+                for tensor_range, expected_name in selection:
+                    tensor = f.get_tensor(tensor_range.name)
+                    yield expected_name, tensor.to(device=device, non_blocking=True, copy=False)
+
+    def _read_parallel(
+        self, model_paths: list[str], sd_ops: SDOps | None, device: torch.device
+    ) -> Iterator[tuple[str, torch.Tensor]]:
+        selection = [
+            selected for shard_path in model_paths for selected in read_checkpoint_header(shard_path).select(sd_ops)
+        ]
+        ranges = [tensor_range for tensor_range, _ in selection]
+        values = load_tensor_ranges(ranges, device, num_workers=self.num_workers, buffer_bytes=self.buffer_bytes)
+        return zip((expected_name for _, expected_name in selection), values, strict=True)
 
 
 class SafetensorsModelStateDictLoader(StateDictLoader):
@@ -56,11 +110,14 @@ class SafetensorsModelStateDictLoader(StateDictLoader):
         self.weight_loader = weight_loader if weight_loader is not None else SafetensorsStateDictLoader()
 
     def metadata(self, path: str) -> dict:
-        with safetensors.safe_open(path, framework="pt") as f:
-            meta = f.metadata()
-            if meta is None or "config" not in meta:
-                return {}
-            return json.loads(meta["config"])
-
-    def load(self, path: str | list[str], sd_ops: SDOps | None = None, device: torch.device | None = None) -> StateDict:
-        return self.weight_loader.load(path, sd_ops, device)
+        # The parsed config is shared by every caller, so hand out a copy
+        return copy.deepcopy(read_checkpoint_header(path).config)
+
+    def load(
+        self,
+        path: str | list[str],
+        sd_ops: SDOps | None = None,
+        device: torch.device | None = None,
+        dtype: torch.dtype | None = None,
+    ) -> StateDict:
+        return self.weight_loader.load(path, sd_ops, device, dtype)
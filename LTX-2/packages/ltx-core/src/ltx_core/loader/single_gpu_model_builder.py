@@ -1,10 +1,12 @@
 import logging
+from contextlib import ExitStack
 from dataclasses import dataclass, field, replace
 from typing import Generic
 
 import torch
 
 from ltx_core.loader.fuse_loras import apply_loras
+from ltx_core.loader.fused_lora_cache import FusedLoraCache
 from ltx_core.loader.module_ops import ModuleOps
 from ltx_core.loader.primitives import (
     LoRAAdaptableProtocol,
@@ -35,10 +37,13 @@ class SingleGPUModelBuilder(Generic[ModelType], ModelBuilderProtocol[ModelType],
         model_loader: Strategy for loading state dicts from disk. Defaults to
             :class:`SafetensorsModelStateDictLoader`.
         registry: Cache for already-loaded state dicts. Defaults to :class:`DummyRegistry` (no caching).
+            References to the registry's entries are held while the model is built.
         lora_load_device: Device used when loading LoRA weight tensors from disk. Defaults to
             ``torch.device("cpu")``, which keeps LoRA weights in CPU memory and transfers them to
             the target GPU sequentially during fusion, reducing peak GPU memory usage compared to
             loading all LoRA weights directly onto the GPU at once.
+        fused_lora_cache: Optional on-disk cache of fused LoRA state dicts. When set, a build with LoRAs
+            reads the fused weights from it if present and stores them after fusing otherwise.
     """
 
     model_class_configurator: type[ModelConfigurator[ModelType]]
@@ -49,6 +54,7 @@ class SingleGPUModelBuilder(Generic[ModelType], ModelBuilderProtocol[ModelType],
     model_loader: StateDictLoader = field(default_factory=SafetensorsModelStateDictLoader)
     registry: Registry = field(default_factory=DummyRegistry)
     lora_load_device: torch.device = field(default_factory=lambda: torch.device("cpu"))
+    fused_lora_cache: FusedLoraCache | None = None
 
     def lora(self, lora_path: str, strength: float = 1.0, sd_ops: SDOps | None = None) -> "SingleGPUModelBuilder":
         return replace(self, loras=(*self.loras, LoraPathStrengthAndSDOps(lora_path, strength, sd_ops)))
@@ -66,13 +72,16 @@ class SingleGPUModelBuilder(Generic[ModelType], ModelBuilderProtocol[ModelType],
         return model
 
     def load_sd(
-        self, paths: list[str], registry: Registry, device: torch.device | None, sd_ops: SDOps | None = None
+        self,
+        paths: list[str],
+        registry: Registry,
+        device: torch.device | None,
+        sd_ops: SDOps | None = None,
+        dtype: torch.dtype | None = None,
     ) -> StateDict:
-        state_dict = registry.get(paths, sd_ops)
-        if state_dict is None:
-            state_dict = self.model_loader.load(paths, sd_ops=sd_ops, device=device)
-            registry.add(paths, sd_ops=sd_ops, state_dict=state_dict)
-        return state_dict
+        return registry.get_or_load(
+            paths, sd_ops, lambda: self.model_loader.load(paths, sd_ops=sd_ops, device=device, dtype=dtype), dtype=dtype
+        )
 
     def _return_model(self, meta_model: ModelType, device: torch.device) -> ModelType:
         uninitialized_params = [name for name, param in meta_model.named_parameters() if str(param.device) == "meta"]
@@ -88,29 +97,52 @@ class SingleGPUModelBuilder(Generic[ModelType], ModelBuilderProtocol[ModelType],
         config = self.model_config()
         meta_model = self.meta_model(config, self.module_ops)
         model_paths = list(self.model_path) if isinstance(self.model_path, tuple) else [self.model_path]
-        model_state_dict = self.load_sd(model_paths, sd_ops=self.model_sd_ops, registry=self.registry, device=device)
-
         lora_strengths = [lora.strength for lora in self.loras]
-        if not lora_strengths or (min(lora_strengths) == 0 and max(lora_strengths) == 0):
-            sd = model_state_dict.sd
-            if dtype is not None:
-                sd = {key: value.to(dtype=dtype) for key, value in model_state_dict.sd.items()}
-            meta_model.load_state_dict(sd, strict=False, assign=True)
-            return self._return_model(meta_model, device)
+        fuse_loras = bool(lora_strengths) and not (min(lora_strengths) == 0 and max(lora_strengths) == 0)
 
-        lora_state_dicts = [
-            self.load_sd([lora.path], sd_ops=lora.sd_ops, registry=self.registry, device=self.lora_load_device)
-            for lora in self.loras
-        ]
-        lora_sd_and_strengths = [
-            LoraStateDictWithStrength(sd, strength)
-            for sd, strength in zip(lora_state_dicts, lora_strengths, strict=True)
-        ]
-        final_sd = apply_loras(
-            model_sd=model_state_dict,
-            lora_sd_and_strengths=lora_sd_and_strengths,
-            dtype=dtype,
-            destination_sd=model_state_dict if isinstance(self.registry, DummyRegistry) else None,
-        )
-        meta_model.load_state_dict(final_sd.sd, strict=False, assign=True)
-        return self._return_model(meta_model, device)
+        fused_key = None
+        if fuse_loras and self.fused_lora_cache is not None:
+            fused_key = self.fused_lora_cache.key(model_paths, self.model_sd_ops, self.module_ops, self.loras, dtype)
+            fused_state_dict = self.fused_lora_cache.load(fused_key, device)
+            if fused_state_dict is not None:
+                meta_model.load_state_dict(fused_state_dict.sd, strict=False, assign=True)
+                return self._return_model(meta_model, device)
+
+        # Registry references are held until the model owns its weights
+        with ExitStack() as references:
+            model_state_dict = self.load_sd(
+                model_paths, sd_ops=self.model_sd_ops, registry=self.registry, device=device, dtype=dtype
+            )
+            references.callback(self.registry.release, model_paths, self.model_sd_ops, dtype)
+
+            if not fuse_loras:
+                sd = model_state_dict.sd
+                if dtype is not None and isinstance(self.registry, DummyRegistry):
+                    # The state dict is not shared, so cast into it and let each source tensor go right away
+                    for key, value in sd.items():
+                        sd[key] = value.to(dtype=dtype)
+                elif dtype is not None:
+                    sd = {key: value.to(dtype=dtype) for key, value in model_state_dict.sd.items()}
+                meta_model.load_state_dict(sd, strict=False, assign=True)
+                return self._return_model(meta_model, device)
+
+            lora_state_dicts = []
+            for lora in self.loras:
+                lora_state_dicts.append(
+                    self.load_sd([lora.path], sd_ops=lora.sd_ops, registry=self.registry, device=self.lora_load_device)
+                )
+                references.callback(self.registry.release, [lora.path], lora.sd_ops)
+            lora_sd_and_strengths = [
+                LoraStateDictWithStrength(sd, strength)
+                for sd, strength in zip(lora_state_dicts, lora_strengths, strict=True)
+            ]
+            final_sd = apply_loras(
+                model_sd=model_state_dict,
+                lora_sd_and_strengths=lora_sd_and_strengths,
+                dtype=dtype,
+                destination_sd=model_state_dict if isinstance(self.registry, DummyRegistry) else None,
+            )
+            if fused_key is not None:
+                self.fused_lora_cache.save(fused_key, final_sd)
+            meta_model.load_state_dict(final_sd.sd, strict=False, assign=True)
+            return self._return_model(meta_model, device)
@@ -1,6 +1,12 @@
 """Audio VAE model components."""
 
-from ltx_core.model.audio_vae.audio_vae import AudioDecoder, AudioEncoder, decode_audio, encode_audio
+from ltx_core.model.audio_vae.audio_vae import (
+    AudioDecoder,
+    AudioEncoder,
+    decode_audio,
+    decode_audio_chunks,
+    encode_audio,
+)
 from ltx_core.model.audio_vae.model_configurator import (
     AUDIO_VAE_DECODER_COMFY_KEYS_FILTER,
     AUDIO_VAE_ENCODER_COMFY_KEYS_FILTER,
@@ -10,7 +16,7 @@ from ltx_core.model.audio_vae.model_configurator import (
     VocoderConfigurator,
 )
 from ltx_core.model.audio_vae.ops import AudioProcessor
-from ltx_core.model.audio_vae.vocoder import Vocoder, VocoderWithBWE
+from ltx_core.model.audio_vae.vocoder import Vocoder, VocoderWithBWE, vocode_in_chunks
 
 __all__ = [
     "AUDIO_VAE_DECODER_COMFY_KEYS_FILTER",
@@ -25,5 +31,7 @@ __all__ = [
     "VocoderConfigurator",
     "VocoderWithBWE",
     "decode_audio",
+    "decode_audio_chunks",
     "encode_audio",
+    "vocode_in_chunks",
 ]
@@ -1,4 +1,4 @@
-from typing import Set, Tuple
+from typing import Iterator, Set, Tuple
 
 import torch
 import torch.nn.functional as F
@@ -11,7 +11,7 @@ from ltx_core.model.audio_vae.downsample import build_downsampling_path
 from ltx_core.model.audio_vae.ops import AudioProcessor, PerChannelStatistics
 from ltx_core.model.audio_vae.resnet import ResnetBlock
 from ltx_core.model.audio_vae.upsample import build_upsampling_path
-from ltx_core.model.audio_vae.vocoder import Vocoder
+from ltx_core.model.audio_vae.vocoder import DEFAULT_VOCODER_CHUNK_FRAMES, Vocoder, vocode_in_chunks
 from ltx_core.model.common.normalization import NormType, build_normalization_layer
 from ltx_core.types import Audio, AudioLatentShape
 
@@ -493,16 +493,45 @@ class AudioDecoder(torch.nn.Module):
         return torch.tanh(h) if self.tanh_out else h
 
 
-def decode_audio(latent: torch.Tensor, audio_decoder: "AudioDecoder", vocoder: "Vocoder") -> Audio:
+def decode_audio(
+    latent: torch.Tensor,
+    audio_decoder: "AudioDecoder",
+    vocoder: "Vocoder",
+    chunk_frames: int = DEFAULT_VOCODER_CHUNK_FRAMES,
+) -> Audio:
     """
     Decode an audio latent representation using the provided audio decoder and vocoder.
     Args:
         latent: Input audio latent tensor.
         audio_decoder: Model to decode the latent to waveform features.
         vocoder: Model to convert decoded features to audio waveform.
+        chunk_frames: Number of mel frames the vocoder processes at once, see :func:`decode_audio_chunks`.
     Returns:
         Decoded audio with waveform and sampling rate.
     """
+    chunks = [chunk.waveform for chunk in decode_audio_chunks(latent, audio_decoder, vocoder, chunk_frames)]
+    return Audio(waveform=torch.cat(chunks, dim=-1), sampling_rate=vocoder.output_sampling_rate)
+
+
+def decode_audio_chunks(
+    latent: torch.Tensor,
+    audio_decoder: "AudioDecoder",
+    vocoder: "Vocoder",
+    chunk_frames: int = DEFAULT_VOCODER_CHUNK_FRAMES,
+) -> Iterator[Audio]:
+    """
+    Decode an audio latent representation and yield the waveform as the vocoder produces it.
+    The vocoder runs on overlapping windows of the decoded mel spectrogram (see
+    :func:`~ltx_core.model.audio_vae.vocoder.vocode_in_chunks`), so its activations do not grow with the length of
+    the audio. Audio no longer than ``chunk_frames`` mel frames is vocoded at once.
+    Args:
+        latent: Input audio latent tensor.
+        audio_decoder: Model to decode the latent to waveform features.
+        vocoder: Model to convert decoded features to audio waveform.
+        chunk_frames: Number of mel frames the vocoder processes at once.
+    Yields:
+        Consecutive pieces of the decoded audio.
+    """
     decoded_audio = audio_decoder(latent)
-    waveform = vocoder(decoded_audio).squeeze(0).float()
-    return Audio(waveform=waveform, sampling_rate=vocoder.output_sampling_rate)
+    for waveform in vocode_in_chunks(vocoder, decoded_audio, chunk_frames=chunk_frames):
+        yield Audio(waveform=waveform.squeeze(0).float(), sampling_rate=vocoder.output_sampling_rate)
@@ -1,5 +1,5 @@
 import math
-from typing import List
+from typing import Iterator, List
 
 import einops
 import torch
@@ -8,6 +8,14 @@ from torch import nn
 
 from ltx_core.model.audio_vae.resnet import LRELU_SLOPE, ResBlock1
 
+# Mel frames vocoded per chunk by :func:`vocode_in_chunks` (about 10 s at 100 frames per second)
+DEFAULT_VOCODER_CHUNK_FRAMES = 1024
+# Mel frames on each side of a chunk that are vocoded for context and dropped, covering the receptive field of the
+# vocoder's convolution and resampling stacks
+DEFAULT_VOCODER_CONTEXT_FRAMES = 32
+# Mel frames over which consecutive chunks are crossfaded
+DEFAULT_VOCODER_CROSSFADE_FRAMES = 8
+
 
 def get_padding(kernel_size: int, dilation: int = 1) -> int:
     return int((kernel_size * dilation - dilation) / 2)
@@ -373,6 +381,11 @@ class Vocoder(torch.nn.Module):
             bias=use_bias_at_final,
         )
 
+    @property
+    def samples_per_frame(self) -> int:
+        """Number of output samples per input mel frame."""
+        return math.prod(up.stride[0] for up in self.ups)
+
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """
         Forward pass of the vocoder.
@@ -534,6 +547,11 @@ class VocoderWithBWE(nn.Module):
     def conv_post(self) -> nn.Conv1d:
         return self.vocoder.conv_post
 
+    @property
+    def samples_per_frame(self) -> int:
+        """Number of output samples per input mel frame."""
+        return self.vocoder.samples_per_frame * self.output_sampling_rate // self.input_sampling_rate
+
     def _compute_mel(self, audio: torch.Tensor) -> torch.Tensor:
         """Compute log-mel spectrogram from waveform using causal STFT bases.
         Args:
@@ -573,3 +591,52 @@ class VocoderWithBWE(nn.Module):
         assert residual.shape == skip.shape, f"residual {residual.shape} != skip {skip.shape}"
 
         return torch.clamp(residual + skip, -1, 1)[..., :output_length]
+
+
+def vocode_in_chunks(
+    vocoder: Vocoder | VocoderWithBWE,
+    mel_spec: torch.Tensor,
+    chunk_frames: int = DEFAULT_VOCODER_CHUNK_FRAMES,
+    context_frames: int = DEFAULT_VOCODER_CONTEXT_FRAMES,
+    crossfade_frames: int = DEFAULT_VOCODER_CROSSFADE_FRAMES,
+) -> Iterator[torch.Tensor]:
+    """Vocode a mel spectrogram chunk by chunk, so that activations stay bounded for long audio.
+    Each chunk is vocoded together with ``context_frames`` mel frames on both sides, which are cut from the output,
+    and consecutive chunks are linearly crossfaded over ``crossfade_frames`` frames to hide what the context does not
+    cover. Chunks are yielded as soon as they are vocoded.
+    Args:
+        vocoder: Vocoder to run on each chunk.
+        mel_spec: Mel spectrogram in the format of :meth:`Vocoder.forward`, with time on the second to last axis.
+        chunk_frames: Number of mel frames per chunk.
+        context_frames: Number of mel frames of context on each side of a chunk.
+        crossfade_frames: Number of mel frames over which consecutive chunks are crossfaded.
+    Yields:
+        Waveform tensors of shape (batch_size, out_channels, samples) that concatenate along the last axis to the
+        waveform of the whole spectrogram.
+    """
+    if chunk_frames <= crossfade_frames:
+        raise ValueError(f"chunk_frames ({chunk_frames}) must be greater than crossfade_frames ({crossfade_frames})")
+
+    frames = mel_spec.shape[-2]
+    samples_per_frame = vocoder.samples_per_frame
+    tail = None
+    for start in range(0, frames, chunk_frames):
+        stop = min(start + chunk_frames, frames)
+        # Each chunk also vocodes the crossfade region shared with the next chunk
+        fade_stop = min(stop + crossfade_frames, frames)
+        window_start = max(0, start - context_frames)
+        window_stop = min(frames, fade_stop + context_frames)
+
+        waveform = vocoder(mel_spec[..., window_start:window_stop, :])
+        waveform = waveform[
+            ..., (start - window_start) * samples_per_frame : (fade_stop - window_start) * samples_per_frame
+        ]
+
+        if tail is not None and tail.shape[-1] > 0:
+            head = waveform[..., : tail.shape[-1]]
+            fade_in = torch.linspace(0.0, 1.0, tail.shape[-1] + 2, device=head.device, dtype=head.dtype)[1:-1]
+            head.copy_(torch.lerp(tail, head, fade_in))
+
+        body_samples = (stop - start) * samples_per_frame
+        tail = waveform[..., body_samples:]
+        yield waveform[..., :body_samples]
@@ -1,15 +1,22 @@
 """Transformer model components."""
 
+from ltx_core.model.transformer.compiled_model import CompileConfig, CompiledX0Model
+from ltx_core.model.transformer.frozen_tokens import FrozenTokenCache
 from ltx_core.model.transformer.modality import Modality
 from ltx_core.model.transformer.model import LTXModel, X0Model
 from ltx_core.model.transformer.model_configurator import (
+    FUSED_QKV_MODULE_OPS,
     LTXV_MODEL_COMFY_RENAMING_MAP,
     LTXModelConfigurator,
     LTXVideoOnlyModelConfigurator,
 )
 
 __all__ = [
+    "FUSED_QKV_MODULE_OPS",
     "LTXV_MODEL_COMFY_RENAMING_MAP",
+    "CompileConfig",
+    "CompiledX0Model",
+    "FrozenTokenCache",
     "LTXModel",
     "LTXModelConfigurator",
     "LTXVideoOnlyModelConfigurator",
@@ -1,22 +1,37 @@
+import functools
 from enum import Enum
-from typing import Protocol
+from types import ModuleType
+from typing import Callable, Protocol
 
 import torch
+from torch.nn.attention import SDPBackend, sdpa_kernel
 
+from ltx_core.model.transformer.attention_mask import BlockAttentionBias
+from ltx_core.model.transformer.attention_registry import AttentionBackend, AttentionBackendRegistry
+from ltx_core.model.transformer.fused_ops import rms_norm_interleaved_rope_
 from ltx_core.model.transformer.rope import LTXRopeType, apply_rotary_emb
 
-memory_efficient_attention = None
-flash_attn_interface = None
-try:
-    from xformers.ops import memory_efficient_attention
-except ImportError:
-    memory_efficient_attention = None
-try:
+
+# xformers and FlashAttention3 are imported on first use, not when the model code is imported
+@functools.cache
+def _memory_efficient_attention() -> Callable[..., torch.Tensor] | None:
+    try:
+        from xformers.ops import memory_efficient_attention  # noqa: PLC0415
+    except ImportError:
+        return None
+    return memory_efficient_attention
+
+
+@functools.cache
+def _flash_attn_interface() -> ModuleType | None:
     # FlashAttention3 and XFormersAttention cannot be used together
-    if memory_efficient_attention is None:
-        import flash_attn_interface
-except ImportError:
-    flash_attn_interface = None
+    if _memory_efficient_attention() is not None:
+        return None
+    try:
+        import flash_attn_interface  # noqa: PLC0415
+    except ImportError:
+        return None
+    return flash_attn_interface
 
 
 class AttentionCallable(Protocol):
@@ -55,6 +70,7 @@ class XFormersAttention(AttentionCallable):
         heads: int,
         mask: torch.Tensor | None = None,
     ) -> torch.Tensor:
+        memory_efficient_attention = _memory_efficient_attention()
         if memory_efficient_attention is None:
             raise RuntimeError("XFormersAttention was selected but `xformers` is not installed.")
 
@@ -71,26 +87,42 @@ class XFormersAttention(AttentionCallable):
             # add a singleton heads dimension
             if mask.ndim == 3:
                 mask = mask.unsqueeze(1)
-            # pad to a multiple of 8
-            pad = 8 - mask.shape[-1] % 8
-            # the xformers docs says that it's allowed to have a mask of shape (1, Nq, Nk)
-            # but when using separated heads, the shape has to be (B, H, Nq, Nk)
-            # in flux, this matrix ends up being over 1GB
-            # here, we create a mask with the same batch/head size as the input mask (potentially singleton or full)
-            mask_out = torch.empty(
-                [mask.shape[0], mask.shape[1], q.shape[1], mask.shape[-1] + pad], dtype=q.dtype, device=q.device
-            )
-
-            mask_out[..., : mask.shape[-1]] = mask
-            # doesn't this remove the padding again??
-            mask = mask_out[..., : mask.shape[-1]]
-            mask = mask.expand(b, heads, -1, -1)
+            mask = _xformers_aligned_bias(mask, q.shape[1], q.dtype).expand(b, heads, -1, -1)
 
         out = memory_efficient_attention(q.to(v.dtype), k.to(v.dtype), v, attn_bias=mask, p=0.0)
         out = out.reshape(b, -1, heads * dim_head)
         return out
 
 
+def _xformers_aligned_bias(mask: torch.Tensor, q_len: int, dtype: torch.dtype) -> torch.Tensor:
+    """Return ``mask`` as a ``(..., q_len, k_len)`` bias whose rows start on 8-element boundaries.
+    xformers kernels require the bias row stride to be a multiple of 8. Broadcast query rows
+    (stride 0) and already aligned key lengths are returned as views without copying; otherwise
+    the bias is copied once into storage padded along the key dimension, and a view with the
+    original key length is returned, so the padding lives only in the row stride.
+    """
+    mask = mask.to(dtype).expand(*mask.shape[:-2], q_len, mask.shape[-1])
+    if mask.stride(-1) == 1 and mask.stride(-2) % 8 == 0:
+        return mask
+    k_len = mask.shape[-1]
+    padded = torch.empty((*mask.shape[:-1], k_len + (-k_len) % 8), dtype=dtype, device=mask.device)
+    padded[..., :k_len] = mask
+    return padded[..., :k_len]
+
+
+class PytorchSdpaKernelAttention(AttentionCallable):
+    """PyTorch SDPA restricted to a single kernel, so autoselection can compare SDPA kernels directly."""
+
+    def __init__(self, kernel: SDPBackend):
+        self.kernel = kernel
+
+    def __call__(
+        self, q: torch.Tensor, k: torch.Tensor, v: torch.Tensor, heads: int, mask: torch.Tensor | None = None
+    ) -> torch.Tensor:
+        with sdpa_kernel(self.kernel):
+            return PytorchAttention()(q, k, v, heads, mask)
+
+
 class FlashAttention3(AttentionCallable):
     def __call__(
         self,
@@ -100,6 +132,7 @@ class FlashAttention3(AttentionCallable):
         heads: int,
         mask: torch.Tensor | None = None,
     ) -> torch.Tensor:
+        flash_attn_interface = _flash_attn_interface()
         if flash_attn_interface is None:
             raise RuntimeError("FlashAttention3 was selected but `FlashAttention3` is not installed.")
 
@@ -116,11 +149,34 @@ class FlashAttention3(AttentionCallable):
         return out
 
 
+# Candidates for AttentionFunction.AUTO. Masks are additive biases, which SDPA's flash kernel
+# and FlashAttention3 cannot consume, so those only compete for mask-free calls.
+ATTENTION_BACKEND_REGISTRY = AttentionBackendRegistry(
+    backends=(
+        AttentionBackend("pytorch", PytorchAttention()),
+        AttentionBackend("pytorch_flash", PytorchSdpaKernelAttention(SDPBackend.FLASH_ATTENTION), supports_mask=False),
+        AttentionBackend("pytorch_efficient", PytorchSdpaKernelAttention(SDPBackend.EFFICIENT_ATTENTION)),
+        AttentionBackend("pytorch_cudnn", PytorchSdpaKernelAttention(SDPBackend.CUDNN_ATTENTION)),
+        AttentionBackend(
+            "xformers", XFormersAttention(), is_available=lambda: _memory_efficient_attention() is not None
+        ),
+        AttentionBackend(
+            "flash_attention_3",
+            FlashAttention3(),
+            supports_mask=False,
+            is_available=lambda: _flash_attn_interface() is not None,
+        ),
+    ),
+    fallback="pytorch",
+)
+
+
 class AttentionFunction(Enum):
     PYTORCH = "pytorch"
     XFORMERS = "xformers"
     FLASH_ATTENTION_3 = "flash_attention_3"
     DEFAULT = "default"
+    AUTO = "auto"
 
     def __call__(
         self, q: torch.Tensor, k: torch.Tensor, v: torch.Tensor, heads: int, mask: torch.Tensor | None = None
@@ -131,11 +187,14 @@ class AttentionFunction(Enum):
             return XFormersAttention()(q, k, v, heads, mask)
         elif self is AttentionFunction.FLASH_ATTENTION_3:
             return FlashAttention3()(q, k, v, heads, mask)
+        elif self is AttentionFunction.AUTO:
+            # Benchmarked once per (seq len bucket, head dim, dtype, mask kind), winner cached on disk
+            return ATTENTION_BACKEND_REGISTRY(q, k, v, heads, mask)
         else:
             # Default behavior: XFormers if installed else - PyTorch
             return (
                 XFormersAttention()(q, k, v, heads, mask)
-                if memory_efficient_attention is not None
+                if _memory_efficient_attention() is not None
                 else PytorchAttention()(q, k, v, heads, mask)
             )
 
@@ -177,15 +236,80 @@ class Attention(torch.nn.Module):
 
         self.to_out = torch.nn.Sequential(torch.nn.Linear(inner_dim, query_dim, bias=True), torch.nn.Identity())
 
+        # Concatenated Q/K/V projection set by fuse_qkv_projection(); to_q/to_k/to_v then hold views into it
+        self.register_buffer("qkv_weight", None, persistent=False)
+        self.register_buffer("qkv_bias", None, persistent=False)
+
+    def fuse_qkv_projection(self) -> bool:
+        """Concatenate the Q/K/V projections so self-attention runs a single GEMM.
+        ``to_q``, ``to_k`` and ``to_v`` are re-pointed at slices of the fused tensors, so weights are
+        not duplicated within the module and the state dict keys are unchanged. The fused tensors are new,
+        though, so the loaded Q/K/V tensors are only freed if nothing else (e.g. a caching registry) holds
+        them. Projections that are quantized or have a patched forward (see :mod:`ltx_core.quantization`)
+        are left untouched. Intended for inference: the re-pointed parameters do not require grad.
+        Returns:
+            Whether the projections were fused.
+        """
+        projections = (self.to_q, self.to_k, self.to_v)
+        if not all(_is_fusable_linear(p) for p in projections):
+            return False
+        weights = [p.weight for p in projections]
+        if len({(w.shape[1], w.dtype, w.device) for w in weights}) != 1:
+            return False
+        self.qkv_weight = torch.cat(weights)
+        self.qkv_bias = torch.cat([p.bias for p in projections])
+        self._tie_qkv_projection()
+        return True
+
+    def _tie_qkv_projection(self) -> None:
+        projections = (self.to_q, self.to_k, self.to_v)
+        for projection, weight, bias in zip(projections, self.qkv_weight.chunk(3), self.qkv_bias.chunk(3), strict=True):
+            projection.weight = torch.nn.Parameter(weight, requires_grad=False)
+            projection.bias = torch.nn.Parameter(bias, requires_grad=False)
+
+    def _apply(self, fn: Callable[[torch.Tensor], torch.Tensor], recurse: bool = True) -> "Attention":
+        super()._apply(fn, recurse)
+        # Moving or casting the module copies parameters and buffers separately, re-tie the views
+        if self.qkv_weight is not None:
+            self._tie_qkv_projection()
+        return self
+
+    def _fused_self_attention_qkv(
+        self, x: torch.Tensor, pe: tuple[torch.Tensor, torch.Tensor] | None
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        # q, k, v are strided views into one projection output; norm and RoPE write into them in place
+        q, k, v = torch.nn.functional.linear(x, self.qkv_weight, self.qkv_bias).chunk(3, dim=-1)
+        if pe is not None and self.rope_type == LTXRopeType.INTERLEAVED:
+            rms_norm_interleaved_rope_(q, self.q_norm.weight, self.q_norm.eps, *pe)
+            rms_norm_interleaved_rope_(k, self.k_norm.weight, self.k_norm.eps, *pe)
+            return q, k, v
+
+        q = self.q_norm(q)
+        k = self.k_norm(k)
+        if pe is not None:
+            q = apply_rotary_emb(q, pe, self.rope_type)
+            k = apply_rotary_emb(k, pe, self.rope_type)
+        return q, k, v
+
+    def project_kv(
+        self, context: torch.Tensor, k_pe: tuple[torch.Tensor, torch.Tensor] | None = None
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Keys (after RMSNorm and RoPE) and values of ``context``, in the form accepted as ``extra_kv``."""
+        k = self.k_norm(self.to_k(context))
+        if k_pe is not None:
+            k = apply_rotary_emb(k, k_pe, self.rope_type)
+        return k, self.to_v(context)
+
     def forward(
         self,
         x: torch.Tensor,
         context: torch.Tensor | None = None,
-        mask: torch.Tensor | None = None,
+        mask: torch.Tensor | BlockAttentionBias | None = None,
         pe: torch.Tensor | None = None,
         k_pe: torch.Tensor | None = None,
         perturbation_mask: torch.Tensor | None = None,
         all_perturbed: bool = False,
+        extra_kv: tuple[torch.Tensor, torch.Tensor] | None = None,
     ) -> torch.Tensor:
         """Multi-head attention with optional RoPE, perturbation masking, and per-head gating.
         When ``perturbation_mask`` is all zeros, the expensive query/key path
@@ -196,7 +320,9 @@ class Attention(torch.nn.Module):
             context: Key/value context tensor of shape ``(B, S, context_dim)``.
                 Falls back to ``x`` (self-attention) when *None*.
             mask: Optional attention mask. Interpretation depends on the attention
-                backend (additive bias for xformers/PyTorch SDPA).
+                backend (additive bias for xformers/PyTorch SDPA). A
+                :class:`BlockAttentionBias` is dispatched to FlexAttention when available and the
+                attention function is ``DEFAULT`` or ``AUTO``.
             pe: Rotary positional embeddings applied to both ``q`` and ``k``.
             k_pe: Separate rotary positional embeddings for ``k`` only. When
                 *None*, ``pe`` is reused for keys.
@@ -208,28 +334,51 @@ class Attention(torch.nn.Module):
                 *None* or all-ones means standard attention; all-zeros skips
                 the query/key path entirely for efficiency.
             all_perturbed: Whether all perturbations are active for this block.
+            extra_kv: Precomputed keys and values (see :meth:`project_kv`) appended after the
+                ones projected from ``context``, e.g. cached keys/values of frozen tokens.
+        When the projections were fused with :meth:`fuse_qkv_projection`, self-attention without
+        autograd takes a fast path: one QKV GEMM followed by in-place RMSNorm and RoPE.
         Returns:
             Output tensor of shape ``(B, T, query_dim)``.
         """
+        use_fused_qkv = self.qkv_weight is not None and context is None and k_pe is None and not torch.is_grad_enabled()
         context = x if context is None else context
         use_attention = not all_perturbed
 
-        v = self.to_v(context)
-
         if not use_attention:
-            out = v
+            out = self.to_v(context)
         else:
-            q = self.to_q(x)
-            k = self.to_k(context)
-
-            q = self.q_norm(q)
-            k = self.k_norm(k)
-
-            if pe is not None:
-                q = apply_rotary_emb(q, pe, self.rope_type)
-                k = apply_rotary_emb(k, pe if k_pe is None else k_pe, self.rope_type)
-
-            out = self.attention_function(q, k, v, self.heads, mask)  # (B, T, H*D)
+            if use_fused_qkv:
+                q, k, v = self._fused_self_attention_qkv(x, pe)
+            else:
+                v = self.to_v(context)
+                q = self.to_q(x)
+                k = self.to_k(context)
+
+                q = self.q_norm(q)
+                k = self.k_norm(k)
+
+                if pe is not None:
+                    q = apply_rotary_emb(q, pe, self.rope_type)
+                    k = apply_rotary_emb(k, pe if k_pe is None else k_pe, self.rope_type)
+
+            keys, values = k, v
+            if extra_kv is not None:
+                keys = torch.cat((k, extra_kv[0]), dim=1)
+                values = torch.cat((v, extra_kv[1]), dim=1)
+
+            if isinstance(mask, BlockAttentionBias):
+                # FlexAttention replaces the default backends only; an explicitly selected one is kept
+                out = mask.attend(
+                    q,
+                    keys,
+                    values,
+                    self.heads,
+                    self.attention_function,
+                    allow_flex_attention=self.attention_function in (AttentionFunction.DEFAULT, AttentionFunction.AUTO),
+                )
+            else:
+                out = self.attention_function(q, keys, values, self.heads, mask)  # (B, T, H*D)
 
             if perturbation_mask is not None:
                 out = out * perturbation_mask + v * (1 - perturbation_mask)
@@ -247,3 +396,15 @@ class Attention(torch.nn.Module):
             out = out.view(b, t, self.heads * self.dim_head)
 
         return self.to_out(out)
+
+
+def _is_fusable_linear(layer: torch.nn.Module) -> bool:
+    """Plain, loaded, non-quantized ``nn.Linear`` with a bias whose forward has not been patched."""
+    return (
+        type(layer) is torch.nn.Linear
+        and "forward" not in vars(layer)
+        and layer.bias is not None
+        and layer.weight.device.type != "meta"
+        and layer.weight.dtype.is_floating_point
+        and layer.weight.dtype.itemsize >= 2
+    )
@@ -0,0 +1,176 @@
+import functools
+import logging
+import threading
+from dataclasses import dataclass, field, replace
+from typing import Callable
+
+import torch
+
+from ltx_core.types import BlockAttentionMask
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+AttentionWithBias = Callable[[torch.Tensor, torch.Tensor, torch.Tensor, int, torch.Tensor | None], torch.Tensor]
+
+
+def additive_attention_bias(attention_mask: torch.Tensor, dtype: torch.dtype) -> torch.Tensor:
+    """Convert a ``(B, T, T)`` mask with values in ``[0, 1]`` to a ``(B, 1, T, T)`` additive log-space bias.
+    ``1.0`` maps to ``0.0`` (full attention) and entries ``<= 0`` map to the dtype's minimum representable
+    value (fully masked). Strictly positive entries are converted via log-space for smooth attenuation,
+    with small values clamped for numerical stability.
+    """
+    finfo = torch.finfo(dtype)
+    eps = finfo.tiny
+
+    bias = torch.full_like(attention_mask, finfo.min, dtype=dtype)
+    positive = attention_mask > 0
+    if positive.any():
+        bias[positive] = torch.log(attention_mask[positive].clamp(min=eps)).to(dtype)
+
+    return bias.unsqueeze(1)  # (B, 1, T, T) for head broadcast
+
+
+@functools.lru_cache(maxsize=1)
+def _compiled_flex_attention() -> Callable[..., torch.Tensor] | None:
+    try:
+        from torch.nn.attention.flex_attention import flex_attention  # noqa: PLC0415
+    except ImportError:
+        return None
+    return torch.compile(flex_attention, dynamic=False)
+
+
+# Set once FlexAttention has failed (e.g. an unsupported head dim or dtype, or an older torch or triton), after
+# which block masks use the dense bias for the rest of the process
+_flex_attention_failed = threading.Event()
+
+
+@dataclass
+class BlockAttentionBias:
+    """
+    Self-attention bias for one forward pass, prepared from a :class:`~ltx_core.types.BlockAttentionMask`.
+    On CUDA with FlexAttention available, and unless a specific attention backend was selected, attention runs
+    with a block mask derived from the group layout, so tiles that are fully masked (e.g. between different
+    reference groups) are skipped and nothing of size ``T x T`` is allocated; cross weights are applied as a
+    score modification. Otherwise, or if FlexAttention fails, the dense additive bias is materialized once, on
+    first use, shared by every transformer block and passed to the configured attention function.
+    Attributes:
+        mask: Structured ``[0, 1]`` mask.
+        dtype: Dtype of the dense fallback bias.
+        device: Device of the attention inputs.
+        query_index: Mask token of each query, or None when queries are all tokens in order.
+        key_index: Mask token of each key, or None when keys are all tokens in order.
+    """
+
+    mask: BlockAttentionMask
+    dtype: torch.dtype
+    device: torch.device
+    query_index: torch.Tensor | None = None
+    key_index: torch.Tensor | None = None
+    _dense_bias: torch.Tensor | None = field(default=None, init=False, repr=False)
+    _flex_args: dict | None = field(default=None, init=False, repr=False)
+
+    def attend(
+        self,
+        q: torch.Tensor,
+        k: torch.Tensor,
+        v: torch.Tensor,
+        heads: int,
+        attention_function: AttentionWithBias,
+        allow_flex_attention: bool = True,
+    ) -> torch.Tensor:
+        if q.shape[1] != self.num_queries or k.shape[1] != self.num_keys:
+            raise ValueError(
+                f"Block attention mask covers {self.num_queries}/{self.num_keys} query/key tokens, "
+                f"got q/k lengths {q.shape[1]}/{k.shape[1]}"
+            )
+        use_flex_attention = allow_flex_attention and q.is_cuda and not _flex_attention_failed.is_set()
+        flex_attention = _compiled_flex_attention() if use_flex_attention else None
+        if flex_attention is not None:
+            try:
+                return self._flex_attend(flex_attention, q, k, v, heads)
+            except torch.cuda.OutOfMemoryError:
+                raise
+            except Exception as e:
+                if not _flex_attention_failed.is_set():
+                    _flex_attention_failed.set()
+                    logger.warning(f"FlexAttention failed, using the dense attention bias instead: {e}")
+        return attention_function(q, k, v, heads, self.dense_bias())
+
+    def _flex_attend(
+        self,
+        flex_attention: Callable[..., torch.Tensor],
+        q: torch.Tensor,
+        k: torch.Tensor,
+        v: torch.Tensor,
+        heads: int,
+    ) -> torch.Tensor:
+        b, _, inner_dim = q.shape
+        q, k, v = (t.view(b, -1, heads, inner_dim // heads).transpose(1, 2) for t in (q, k, v))
+        out = flex_attention(q, k, v, **self._flex_attention_args(b))
+        return out.transpose(1, 2).reshape(b, -1, inner_dim)
+
+    @property
+    def num_queries(self) -> int:
+        return self.query_index.numel() if self.query_index is not None else self.mask.num_tokens
+
+    @property
+    def num_keys(self) -> int:
+        return self.key_index.numel() if self.key_index is not None else self.mask.num_tokens
+
+    def select(self, query_index: torch.Tensor, key_index: torch.Tensor) -> "BlockAttentionBias":
+        """Restrict the bias to a subset of query tokens and a reordering or subset of key tokens."""
+        return replace(self, query_index=query_index, key_index=key_index)
+
+    def dense_bias(self) -> torch.Tensor:
+        if self._dense_bias is None:
+            bias = additive_attention_bias(self.mask.to_dense(self.device, self.dtype), self.dtype)
+            if self.query_index is not None:
+                bias = bias.index_select(-2, self.query_index)
+            if self.key_index is not None:
+                bias = bias.index_select(-1, self.key_index)
+            self._dense_bias = bias
+        return self._dense_bias
+
+    def _flex_attention_args(self, batch_size: int) -> dict:
+        if self._flex_args is not None:
+            return self._flex_args
+
+        from torch.nn.attention.flex_attention import create_block_mask  # noqa: PLC0415
+
+        num_noisy = self.mask.num_noisy_tokens
+        group_ids = self.mask.group_ids(self.device)
+        weights = self.mask.token_weights(self.device, torch.float32).expand(batch_size, -1)
+        allowed = weights > 0
+        log_weights = weights.clamp(min=torch.finfo(torch.float32).tiny).log()
+        query_index, key_index = self.query_index, self.key_index
+
+        def mask_mod(b: torch.Tensor, h: torch.Tensor, q_idx: torch.Tensor, kv_idx: torch.Tensor) -> torch.Tensor:  # noqa: ARG001
+            if query_index is not None:
+                q_idx = query_index[q_idx]
+            if key_index is not None:
+                kv_idx = key_index[kv_idx]
+            q_group, kv_group = group_ids[q_idx], group_ids[kv_idx]
+            noisy_to_group = (q_idx < num_noisy) & (kv_group > 0) & allowed[b, kv_idx]
+            group_to_noisy = (kv_idx < num_noisy) & (q_group > 0) & allowed[b, q_idx]
+            return (q_group == kv_group) | noisy_to_group | group_to_noisy
+
+        def score_mod(
+            score: torch.Tensor,
+            b: torch.Tensor,
+            h: torch.Tensor,  # noqa: ARG001
+            q_idx: torch.Tensor,
+            kv_idx: torch.Tensor,
+        ) -> torch.Tensor:
+            # Pairs excluded by mask_mod never reach the softmax, so only the cross weights remain
+            if query_index is not None:
+                q_idx = query_index[q_idx]
+            if key_index is not None:
+                kv_idx = key_index[kv_idx]
+            q_in_group, kv_in_group = group_ids[q_idx] > 0, group_ids[kv_idx] > 0
+            bias = torch.where(kv_in_group & ~q_in_group, log_weights[b, kv_idx], 0.0)
+            return score + bias + torch.where(q_in_group & ~kv_in_group, log_weights[b, q_idx], 0.0)
+
+        block_mask = create_block_mask(mask_mod, batch_size, None, self.num_queries, self.num_keys, device=self.device)
+        has_cross_weights = bool((weights[allowed] != 1).any())
+        self._flex_args = {"block_mask": block_mask, "score_mod": score_mod if has_cross_weights else None}
+        return self._flex_args
@@ -0,0 +1,279 @@
+import csv
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+import torch
+
+from ltx_core.utils import get_cache_dir
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+AttentionFn = Callable[..., torch.Tensor]
+
+MASK_KIND_NONE = "none"
+MASK_KIND_DENSE = "dense"
+
+
+class AttentionBackend(NamedTuple):
+    """
+    A named attention implementation that can take part in autoselection.
+    Attributes:
+        name: Unique backend name, used as the key in the on-disk cache and in exported tables.
+        fn: Callable with the ``AttentionCallable`` signature ``(q, k, v, heads, mask)``.
+        supports_mask: Whether the backend accepts an additive attention bias.
+        is_available: Returns whether the backend can run in this process (dependency installed, etc.).
+            It is only called when backends are selected, so optional dependencies are imported lazily.
+    """
+
+    name: str
+    fn: AttentionFn
+    supports_mask: bool = True
+    is_available: Callable[[], bool] = lambda: True
+
+
+class AttentionBackendKey(NamedTuple):
+    """
+    Shape signature under which a benchmark winner is cached.
+    Sequence lengths are rounded up to the next power of two so that nearby resolutions
+    share a single measurement.
+    """
+
+    q_len_bucket: int
+    kv_len_bucket: int
+    head_dim: int
+    dtype: str
+    mask_kind: str
+
+    def as_string(self) -> str:
+        return f"q{self.q_len_bucket}/kv{self.kv_len_bucket}/d{self.head_dim}/{self.dtype}/{self.mask_kind}"
+
+
+@dataclass
+class AttentionBenchmarkResult:
+    """Per-key benchmark outcome: mean milliseconds per call for each backend (None = failed/unsupported)."""
+
+    winner: str
+    timings_ms: dict[str, float | None]
+
+
+def seq_len_bucket(seq_len: int) -> int:
+    """Round a sequence length up to the next power of two."""
+    return 1 << max(seq_len - 1, 0).bit_length()
+
+
+def mask_kind(mask: torch.Tensor | None) -> str:
+    return MASK_KIND_NONE if mask is None else MASK_KIND_DENSE
+
+
+def _device_signature(device: torch.device) -> str:
+    if device.type == "cuda":
+        return f"{torch.cuda.get_device_name(device)}|torch-{torch.__version__}"
+    return f"{device.type}|torch-{torch.__version__}"
+
+
+@dataclass
+class AttentionBackendRegistry:
+    """
+    Registry that picks the fastest attention backend per call shape.
+    The first call for a given :class:`AttentionBackendKey` microbenchmarks every available
+    backend that supports the call's mask kind on the actual inputs, records the timings and
+    dispatches to the winner. Winners are persisted as JSON in ``cache_path`` (keyed by GPU
+    name and torch version) so later processes skip the measurement. Because the mask kind is
+    part of the key, mask-free self-attention and masked cross-attention resolve independently.
+    Attributes:
+        backends: Candidate backends, in order of preference when timings tie.
+        fallback: Backend name used on non-CUDA devices, where no benchmark is run.
+        cache_path: JSON file for persisted winners. Defaults to ``attention/backends.json`` under
+            :func:`~ltx_core.utils.get_cache_dir`, resolved on first use.
+        persist: Whether winners are read from and written to ``cache_path``.
+        warmup_iters: Untimed calls per backend before measuring.
+        timed_iters: Timed calls per backend.
+    """
+
+    backends: tuple[AttentionBackend, ...]
+    fallback: str
+    cache_path: Path | None = None
+    persist: bool = True
+    warmup_iters: int = 1
+    timed_iters: int = 3
+    _results: dict[str, dict[str, AttentionBenchmarkResult]] = field(default_factory=dict)
+    _pinned: dict[str, str] = field(default_factory=dict)
+    _loaded: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def available_backends(self, kind: str) -> list[AttentionBackend]:
+        return [b for b in self.backends if b.is_available() and (kind == MASK_KIND_NONE or b.supports_mask)]
+
+    def pin(self, kind: str, backend_name: str) -> None:
+        """Force a backend for all calls of a mask kind, bypassing benchmarking."""
+        if backend_name not in {b.name for b in self.backends}:
+            raise ValueError(f"Unknown attention backend: {backend_name}")
+        self._pinned[kind] = backend_name
+
+    def __call__(
+        self, q: torch.Tensor, k: torch.Tensor, v: torch.Tensor, heads: int, mask: torch.Tensor | None = None
+    ) -> torch.Tensor:
+        return self.select(q, k, v, heads, mask).fn(q, k, v, heads, mask)
+
+    def select(
+        self, q: torch.Tensor, k: torch.Tensor, v: torch.Tensor, heads: int, mask: torch.Tensor | None = None
+    ) -> AttentionBackend:
+        kind = mask_kind(mask)
+        if kind in self._pinned:
+            return self._backend(self._pinned[kind])
+        if q.device.type != "cuda":
+            return self._backend(self.fallback)
+
+        key = AttentionBackendKey(
+            q_len_bucket=seq_len_bucket(q.shape[1]),
+            kv_len_bucket=seq_len_bucket(k.shape[1]),
+            head_dim=q.shape[-1] // heads,
+            dtype=str(q.dtype).removeprefix("torch."),
+            mask_kind=kind,
+        )
+        device_results = self._device_results(q.device)
+        result = device_results.get(key.as_string())
+        # Re-measure when a cached winner is no longer installed (e.g. xformers was removed).
+        if result is None or not self._is_usable(result.winner):
+            result = self._benchmark(q, k, v, heads, mask)
+            with self._lock:
+                device_results[key.as_string()] = result
+            self._save()
+            logger.info(f"Attention autoselect {key.as_string()}: {result.winner} ({result.timings_ms})")
+        return self._backend(result.winner)
+
+    def results_table(self) -> list[dict[str, str | float | None]]:
+        """Flatten all known benchmark results into rows (one per device and shape key)."""
+        self._load()
+        names = [b.name for b in self.backends]
+        rows = []
+        with self._lock:
+            for device, results in sorted(self._results.items()):
+                for key, result in sorted(results.items()):
+                    rows.append(
+                        {"device": device, "key": key, "winner": result.winner}
+                        | {name: result.timings_ms.get(name) for name in names}
+                    )
+        return rows
+
+    def export_table(self, path: str | Path) -> None:
+        """Write the benchmark results as Markdown (``.md``) or CSV (any other suffix)."""
+        rows = self.results_table()
+        columns = ["device", "key", "winner", *[b.name for b in self.backends]]
+        path = Path(path)
+        with open(path, "w", newline="") as f:
+            if path.suffix == ".md":
+                f.write("| " + " | ".join(columns) + " |\n")
+                f.write("|" + "---|" * len(columns) + "\n")
+                for row in rows:
+                    cells = [_format_cell(row[c]) for c in columns]
+                    f.write("| " + " | ".join(cells) + " |\n")
+            else:
+                writer = csv.DictWriter(f, fieldnames=columns)
+                writer.writeheader()
+                writer.writerows(rows)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+        self._save()
+
+    def _is_usable(self, name: str) -> bool:
+        return any(b.name == name and b.is_available() for b in self.backends)
+
+    def _backend(self, name: str) -> AttentionBackend:
+        for backend in self.backends:
+            if backend.name == name:
+                return backend
+        raise ValueError(f"Unknown attention backend: {name}")
+
+    def _device_results(self, device: torch.device) -> dict[str, AttentionBenchmarkResult]:
+        self._load()
+        with self._lock:
+            return self._results.setdefault(_device_signature(device), {})
+
+    @torch.compiler.disable
+    def _benchmark(
+        self, q: torch.Tensor, k: torch.Tensor, v: torch.Tensor, heads: int, mask: torch.Tensor | None
+    ) -> AttentionBenchmarkResult:
+        timings: dict[str, float | None] = {}
+        for backend in self.available_backends(mask_kind(mask)):
+            timings[backend.name] = self._time_backend(backend, q, k, v, heads, mask)
+        measured = {name: ms for name, ms in timings.items() if ms is not None}
+        winner = min(measured, key=measured.get) if measured else self.fallback
+        return AttentionBenchmarkResult(winner=winner, timings_ms=timings)
+
+    def _time_backend(
+        self,
+        backend: AttentionBackend,
+        q: torch.Tensor,
+        k: torch.Tensor,
+        v: torch.Tensor,
+        heads: int,
+        mask: torch.Tensor | None,
+    ) -> float | None:
+        try:
+            for _ in range(self.warmup_iters):
+                backend.fn(q, k, v, heads, mask)
+            start = torch.cuda.Event(enable_timing=True)
+            end = torch.cuda.Event(enable_timing=True)
+            start.record()
+            for _ in range(self.timed_iters):
+                backend.fn(q, k, v, heads, mask)
+            end.record()
+            end.synchronize()
+        except (RuntimeError, NotImplementedError, ValueError) as e:
+            logger.debug(f"Attention backend {backend.name} failed during benchmark: {e}")
+            return None
+        return start.elapsed_time(end) / self.timed_iters
+
+    def _cache_file(self) -> Path | None:
+        if not self.persist:
+            return None
+        if self.cache_path is None:
+            self.cache_path = get_cache_dir("attention") / "backends.json"
+        return self.cache_path
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        cache_file = self._cache_file()
+        with self._lock:
+            self._loaded = True
+            if cache_file is None or not cache_file.exists():
+                return
+            try:
+                raw = json.loads(cache_file.read_text())
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable attention backend cache {cache_file}: {e}")
+                return
+            for device, results in raw.items():
+                self._results.setdefault(device, {}).update(
+                    {key: AttentionBenchmarkResult(**value) for key, value in results.items()}
+                )
+
+    def _save(self) -> None:
+        cache_file = self._cache_file()
+        if cache_file is None:
+            return
+        with self._lock:
+            raw = {
+                device: {key: {"winner": r.winner, "timings_ms": r.timings_ms} for key, r in results.items()}
+                for device, results in self._results.items()
+            }
+        tmp_path = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(raw, indent=2, sort_keys=True))
+        tmp_path.replace(cache_file)
+
+
+def _format_cell(value: str | float | None) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return str(value)
@@ -0,0 +1,191 @@
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import torch
+
+from ltx_core.guidance.perturbations import BatchedPerturbationConfig
+from ltx_core.model.transformer.modality import Modality
+from ltx_core.model.transformer.model import LTXModel, X0Model
+from ltx_core.types import BlockAttentionMask
+from ltx_core.utils import get_cache_dir
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Latent, context and context mask shapes, attention mask type and layout, and whether the modality is enabled
+ModalityBucket = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...] | None, tuple | None, bool]
+ShapeBucket = tuple[ModalityBucket | None, ModalityBucket | None, torch.dtype]
+
+
+@dataclass(frozen=True)
+class CompileConfig:
+    """
+    Settings for :class:`CompiledX0Model`.
+    Attributes:
+        cuda_graphs: Capture the per-step call as a CUDA graph (``reduce-overhead`` / ``max-autotune``
+            modes), which removes kernel launch overhead at the cost of static input/output buffers.
+        max_autotune: Let Inductor benchmark kernel configurations; slower first compile, faster steps.
+        fullgraph: Fail instead of splitting the forward into several graphs on unsupported code.
+        cache_dir: Directory for compiled artifacts shared across processes. Defaults to ``compile``
+            under :func:`~ltx_core.utils.get_cache_dir`.
+    """
+
+    cuda_graphs: bool = False
+    max_autotune: bool = False
+    fullgraph: bool = False
+    cache_dir: Path | None = None
+
+    def torch_compile_mode(self) -> str:
+        if self.cuda_graphs:
+            return "max-autotune" if self.max_autotune else "reduce-overhead"
+        return "max-autotune-no-cudagraphs" if self.max_autotune else "default"
+
+
+class CompiledX0Model(X0Model):
+    """
+    :class:`X0Model` whose forward runs through ``torch.compile`` with static shapes.
+    Shapes are constant for a whole denoising loop, so each bucket of latent, text context and attention
+    mask shapes (see :func:`_shape_bucket`) is compiled once on its first call and replayed for every
+    later step. Inductor and Triton caches are pointed at ``config.cache_dir`` and, when supported by
+    the installed torch, the compiled artifacts are saved there after each new bucket and loaded on
+    start, so restarted workers skip most of the compilation. If a compiled call fails, the model logs
+    a warning and runs that bucket eagerly from then on.
+    With ``cuda_graphs`` the outputs of a replay live in static buffers that the next replay
+    overwrites; they are cloned, since guiders hold several transformer outputs per step.
+    The velocity model must not have a :class:`~ltx_core.model.transformer.FrozenTokenCache`: its bookkeeping
+    (data-dependent shapes, tensor identities, Python state) cannot be compiled, and CUDA graph replays would
+    overwrite the keys/values it caches.
+    """
+
+    def __init__(self, velocity_model: LTXModel, config: CompileConfig | None = None):
+        super().__init__(velocity_model)
+        self.config = config or CompileConfig()
+        self._cache_dir = self.config.cache_dir or get_cache_dir("compile")
+        self._warm_buckets: set[ShapeBucket] = set()
+        self._eager_buckets: set[ShapeBucket] = set()
+        _configure_compile_caches(self._cache_dir)
+        self._load_artifacts()
+        self._compiled_forward = torch.compile(
+            self._eager_forward,
+            mode=self.config.torch_compile_mode(),
+            fullgraph=self.config.fullgraph,
+            dynamic=False,
+        )
+
+    def forward(
+        self,
+        video: Modality | None,
+        audio: Modality | None,
+        perturbations: BatchedPerturbationConfig,
+    ) -> tuple[torch.Tensor | None, torch.Tensor | None]:
+        bucket = _shape_bucket(video, audio)
+        if bucket in self._eager_buckets:
+            return self._eager_forward(video, audio, perturbations)
+
+        start = time.perf_counter()
+        try:
+            outputs = self._run_compiled(video, audio, perturbations)
+        except torch.cuda.OutOfMemoryError:
+            raise
+        except Exception as e:
+            logger.warning(f"Compiled transformer failed for shape bucket {bucket}, running it eagerly: {e}")
+            self._eager_buckets.add(bucket)
+            return self._eager_forward(video, audio, perturbations)
+
+        if bucket in self._warm_buckets:
+            return outputs
+        self._warm_buckets.add(bucket)
+        logger.info(f"Compiled transformer for shape bucket {bucket} in {time.perf_counter() - start:.1f}s")
+        self._save_artifacts()
+        return outputs
+
+    def _eager_forward(
+        self,
+        video: Modality | None,
+        audio: Modality | None,
+        perturbations: BatchedPerturbationConfig,
+    ) -> tuple[torch.Tensor | None, torch.Tensor | None]:
+        return super().forward(video, audio, perturbations)
+
+    def _run_compiled(
+        self,
+        video: Modality | None,
+        audio: Modality | None,
+        perturbations: BatchedPerturbationConfig,
+    ) -> tuple[torch.Tensor | None, torch.Tensor | None]:
+        if not self.config.cuda_graphs:
+            return self._compiled_forward(video, audio, perturbations)
+        torch.compiler.cudagraph_mark_step_begin()
+        denoised_video, denoised_audio = self._compiled_forward(video, audio, perturbations)
+        return (
+            denoised_video.clone() if denoised_video is not None else None,
+            denoised_audio.clone() if denoised_audio is not None else None,
+        )
+
+    def _artifacts_path(self) -> Path:
+        device = torch.cuda.get_device_name() if torch.cuda.is_available() else "cpu"
+        signature = re.sub(r"[^A-Za-z0-9.]+", "_", f"{device}-torch-{torch.__version__}")
+        return self._cache_dir / f"x0_model-{signature}.bin"
+
+    def _load_artifacts(self) -> None:
+        path = self._artifacts_path()
+        if not hasattr(torch.compiler, "load_cache_artifacts") or not path.exists():
+            return
+        try:
+            torch.compiler.load_cache_artifacts(path.read_bytes())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable compile artifacts {path}: {e}")
+
+    def _save_artifacts(self) -> None:
+        if not hasattr(torch.compiler, "save_cache_artifacts"):
+            return
+        artifacts = torch.compiler.save_cache_artifacts()
+        if artifacts is None:
+            return
+        path = self._artifacts_path()
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(artifacts[0])
+        tmp_path.replace(path)
+
+
+def _shape_bucket(video: Modality | None, audio: Modality | None) -> ShapeBucket:
+    """Everything compiled graphs are specialized on: the shapes of all inputs, the mask type and the dtype."""
+    reference = video if video is not None else audio
+    return (
+        _modality_bucket(video),
+        _modality_bucket(audio),
+        reference.latent.dtype if reference is not None else torch.float32,
+    )
+
+
+def _modality_bucket(modality: Modality | None) -> ModalityBucket | None:
+    if modality is None:
+        return None
+    mask = modality.attention_mask
+    if isinstance(mask, BlockAttentionMask):
+        # Token counts are Python ints, which the graphs are specialized on as well
+        mask_layout = (BlockAttentionMask, mask.num_noisy_tokens, mask.num_base_tokens, mask.group_sizes, mask.shape)
+    elif mask is not None:
+        mask_layout = (torch.Tensor, tuple(mask.shape), mask.dtype)
+    else:
+        mask_layout = None
+    return (
+        tuple(modality.latent.shape),
+        tuple(modality.context.shape),
+        tuple(modality.context_mask.shape) if modality.context_mask is not None else None,
+        mask_layout,
+        modality.enabled,
+    )
+
+
+def _configure_compile_caches(cache_dir: Path) -> None:
+    """Persist Inductor and Triton caches under ``cache_dir`` unless the environment already chose a location."""
+    os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", str(cache_dir / "inductor"))
+    os.environ.setdefault("TRITON_CACHE_DIR", str(cache_dir / "triton"))
+    import torch._inductor.config as inductor_config  # noqa: PLC0415
+
+    inductor_config.fx_graph_cache = True
+    inductor_config.autotune_local_cache = True
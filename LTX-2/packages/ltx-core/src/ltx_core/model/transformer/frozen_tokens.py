@@ -0,0 +1,184 @@
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING
+
+import torch
+
+from ltx_core.guidance.perturbations import BatchedPerturbationConfig
+from ltx_core.model.transformer.attention_mask import BlockAttentionBias
+from ltx_core.model.transformer.modality import Modality
+
+if TYPE_CHECKING:
+    from ltx_core.model.transformer.attention import Attention
+    from ltx_core.model.transformer.transformer_args import TransformerArgs
+
+KeyValue = tuple[torch.Tensor, torch.Tensor]
+PassKey = tuple[int, int | None, tuple[int, ...], bool, tuple]
+
+
+@dataclass
+class FrozenTokens:
+    """
+    Keys and values of the frozen video tokens (``denoise_mask == 0`` everywhere in the batch) for one
+    kind of transformer pass, e.g. the positive, negative or perturbed guidance pass.
+    The first pass runs on all tokens and records, per block, the self-attention keys/values of the
+    frozen tokens (after RMSNorm and RoPE) and their keys/values as context of the video-to-audio
+    cross-attention. Later passes run only the active tokens as queries, through the feed-forward
+    and the output projection, and attend to the recorded keys/values in place of the frozen tokens.
+    Attributes:
+        frozen_index: Positions of the frozen tokens, shape ``(F,)``.
+        active_index: Positions of the remaining tokens, shape ``(A,)``.
+        self_attention_kv: Per-block keys/values of the frozen tokens for ``attn1``.
+        video_to_audio_kv: Per-block keys/values of the frozen tokens for ``video_to_audio_attn``.
+        recording: Whether the current pass runs on all tokens and fills the per-block keys/values.
+    """
+
+    frozen_index: torch.Tensor
+    active_index: torch.Tensor
+    self_attention_kv: dict[int, KeyValue] = field(default_factory=dict)
+    video_to_audio_kv: dict[int, KeyValue] = field(default_factory=dict)
+    recording: bool = True
+
+    def select_frozen(self, x: torch.Tensor, dim: int = 1) -> torch.Tensor:
+        return x.index_select(dim, self.frozen_index)
+
+    def select_frozen_pe(
+        self, pe: tuple[torch.Tensor, torch.Tensor] | None
+    ) -> tuple[torch.Tensor, torch.Tensor] | None:
+        # Both RoPE layouts, (B, T, D) and (B, H, T, D // 2), keep tokens in the second to last dimension
+        return tuple(self.select_frozen(freqs, dim=-2) for freqs in pe) if pe is not None else None
+
+    def extra_kv(
+        self,
+        store: dict[int, KeyValue],
+        block_idx: int,
+        attn: "Attention",
+        context: torch.Tensor,
+        k_pe: tuple[torch.Tensor, torch.Tensor] | None,
+    ) -> KeyValue | None:
+        """
+        On a recording pass, project and store the keys/values of the frozen tokens of ``context``
+        (which holds all tokens) and return None; otherwise return the stored ones for ``attn``.
+        """
+        if not self.recording:
+            return store.get(block_idx)
+        store[block_idx] = attn.project_kv(self.select_frozen(context), self.select_frozen_pe(k_pe))
+        return None
+
+    def active_args(self, args: "TransformerArgs") -> "TransformerArgs":
+        """Attach this state to ``args``, keeping only the active tokens unless the pass is recording."""
+        if self.recording:
+            return replace(args, frozen_tokens=self)
+
+        num_tokens = args.x.shape[1]
+
+        def select(x: torch.Tensor | None, dim: int = 1) -> torch.Tensor | None:
+            if x is None or x.shape[dim] != num_tokens:
+                return x
+            return x.index_select(dim, self.active_index)
+
+        def select_pe(pe: tuple[torch.Tensor, torch.Tensor] | None) -> tuple[torch.Tensor, torch.Tensor] | None:
+            return tuple(select(freqs, dim=-2) for freqs in pe) if pe is not None else None
+
+        return replace(
+            args,
+            x=select(args.x),
+            timesteps=select(args.timesteps),
+            embedded_timestep=select(args.embedded_timestep),
+            positional_embeddings=select_pe(args.positional_embeddings),
+            cross_positional_embeddings=select_pe(args.cross_positional_embeddings),
+            self_attention_mask=self._select_self_attention_mask(args.self_attention_mask),
+            frozen_tokens=self,
+        )
+
+    def full_output(self, x: torch.Tensor) -> torch.Tensor:
+        """Scatter the velocity of the active tokens into all tokens; frozen tokens get zero velocity."""
+        if self.recording:
+            return x
+        num_tokens = self.frozen_index.numel() + self.active_index.numel()
+        out = x.new_zeros(x.shape[0], num_tokens, *x.shape[2:])
+        out[:, self.active_index] = x
+        return out
+
+    def _select_self_attention_mask(
+        self, mask: torch.Tensor | BlockAttentionBias | None
+    ) -> torch.Tensor | BlockAttentionBias | None:
+        # Queries are the active tokens; keys are the active tokens followed by the recorded frozen ones
+        key_index = torch.cat((self.active_index, self.frozen_index))
+        if mask is None:
+            return None
+        if isinstance(mask, BlockAttentionBias):
+            return mask.select(self.active_index, key_index)
+        return mask.index_select(-2, self.active_index).index_select(-1, key_index)
+
+
+class FrozenTokenCache:
+    """
+    Opt-in cache that excludes frozen conditioning tokens from the queries, feed-forward and output
+    projection of :class:`~ltx_core.model.transformer.model.LTXModel`; see :class:`FrozenTokens`.
+    Tokens with zero denoise strength (image-to-video and keyframe conditionings, the preserved
+    region of a retake) keep their latent, so their velocity is irrelevant: :class:`X0Model` maps a
+    zero velocity at ``timestep == 0`` back to the input latent. The approximation is that their
+    keys/values are computed once, on the first step, while in the full model they would follow the
+    evolving noisy tokens. The memory cost is one key/value pair per frozen token, block and pass kind.
+    Entries are keyed by the text context tensors and the perturbations of the pass. An entry is
+    dropped as soon as one of its context tensors is freed, when a pass with another latent shape
+    starts (e.g. the second stage of a two-stage pipeline), or in least-recently-used order beyond
+    ``max_entries``. The cache runs eagerly only and cannot be used with
+    :class:`~ltx_core.model.transformer.CompiledX0Model`.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[PassKey, FrozenTokens] = OrderedDict()
+
+    def get(
+        self, video: Modality, audio: Modality | None, perturbations: BatchedPerturbationConfig | None
+    ) -> FrozenTokens | None:
+        """Return the frozen-token state for this pass, or None if it has no frozen and active tokens."""
+        if torch.is_grad_enabled() or not video.enabled or video.timesteps.shape[1] != video.latent.shape[1]:
+            return None
+
+        batch_size, num_tokens = video.timesteps.shape[:2]
+        frozen_mask = (video.timesteps.reshape(batch_size, num_tokens, -1) == 0).all(dim=-1).all(dim=0)
+        audio_enabled = audio is not None and audio.enabled
+        key = (
+            id(video.context),
+            id(audio.context) if audio is not None else None,
+            tuple(video.latent.shape),
+            audio_enabled,
+            _perturbation_signature(perturbations),
+        )
+        frozen_index = frozen_mask.nonzero().squeeze(1)
+        active_index = (~frozen_mask).nonzero().squeeze(1)
+        if frozen_index.numel() == 0 or active_index.numel() == 0:
+            return None
+
+        frozen = self._entries.get(key)
+        if frozen is not None and torch.equal(frozen.frozen_index, frozen_index):
+            self._entries.move_to_end(key)
+            return frozen
+
+        for stale_key in [k for k in self._entries if k[2] != key[2]]:
+            del self._entries[stale_key]
+        frozen = FrozenTokens(frozen_index=frozen_index, active_index=active_index)
+        self._entries[key] = frozen
+        # Ids in the key stay unique while the contexts live, and the entry must not outlive them
+        for context in (video.context,) if audio is None else (video.context, audio.context):
+            weakref.finalize(context, self._entries.pop, key, None)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return frozen
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _perturbation_signature(perturbations: BatchedPerturbationConfig | None) -> tuple:
+    if perturbations is None:
+        return ()
+    return tuple(
+        tuple((p.type, tuple(p.blocks) if p.blocks is not None else None) for p in config.perturbations or ())
+        for config in perturbations.perturbations
+    )
@@ -0,0 +1,108 @@
+import functools
+
+import torch
+
+
+@functools.lru_cache(maxsize=1)
+def _triton_available() -> bool:
+    try:
+        # Lazy import triton - only available on CUDA platforms
+        import triton  # noqa: F401, PLC0415
+    except ImportError:
+        return False
+    return True
+
+
+def rms_norm_(x: torch.Tensor, weight: torch.Tensor | None, eps: float | None) -> torch.Tensor:
+    """
+    In-place RMSNorm over the last dimension of ``x``.
+    Only the per-row statistics are materialized; the squared input never is, because
+    the reduction is done by ``vector_norm`` with a float32 accumulator.
+    """
+    eps = torch.finfo(x.dtype).eps if eps is None else eps
+    rstd = torch.linalg.vector_norm(x, dim=-1, keepdim=True, dtype=torch.float32)
+    rstd.square_().div_(x.shape[-1]).add_(eps).rsqrt_()
+    x.mul_(rstd)
+    if weight is not None:
+        x.mul_(weight)
+    return x
+
+
+def apply_interleaved_rotary_emb_(x: torch.Tensor, cos_freqs: torch.Tensor, sin_freqs: torch.Tensor) -> torch.Tensor:
+    """
+    In-place equivalent of :func:`~ltx_core.model.transformer.rope.apply_interleaved_rotary_emb`.
+    Works on strided views of the ``(x[2i], x[2i + 1])`` pairs, so the only temporary is a
+    single half-width product instead of the rotated copy, the stacked copy and the output.
+    """
+    a, b = x.unflatten(-1, (-1, 2)).unbind(-1)
+    cos_a, cos_b = cos_freqs.unflatten(-1, (-1, 2)).unbind(-1)
+    sin_a, sin_b = sin_freqs.unflatten(-1, (-1, 2)).unbind(-1)
+
+    a_sin = a * sin_b
+    a.mul_(cos_a).addcmul_(b, sin_a, value=-1)
+    b.mul_(cos_b).add_(a_sin)
+    return x
+
+
+def rms_norm_interleaved_rope_(
+    x: torch.Tensor,
+    weight: torch.Tensor | None,
+    eps: float | None,
+    cos_freqs: torch.Tensor,
+    sin_freqs: torch.Tensor,
+) -> torch.Tensor:
+    """
+    Apply RMSNorm and interleaved rotary embedding to ``x`` in place.
+    On CUDA with Triton installed both steps run as a single kernel that reads and writes each
+    row once. Otherwise the allocation-light PyTorch ops :func:`rms_norm_` and
+    :func:`apply_interleaved_rotary_emb_` are used. ``x`` may be a strided view, e.g. the query
+    or key slice of a fused QKV projection, as long as its last dimension is contiguous.
+    Args:
+        x: Tensor of shape ``(B, T, D)``, modified in place.
+        weight: RMSNorm scale of shape ``(D,)``, or None.
+        eps: RMSNorm epsilon; None uses the dtype's machine epsilon like :class:`torch.nn.RMSNorm`.
+        cos_freqs: Cosine frequencies broadcastable to ``(B, T, D)``.
+        sin_freqs: Sine frequencies broadcastable to ``(B, T, D)``.
+    Returns:
+        ``x``.
+    """
+    if x.is_cuda and x.ndim == 3 and weight is not None and _triton_available():
+        batch, seq_len, dim = x.shape
+        cos_freqs = cos_freqs.expand(batch, seq_len, dim)
+        sin_freqs = sin_freqs.expand(batch, seq_len, dim)
+        if x.stride(-1) == 1 and cos_freqs.stride() == sin_freqs.stride() and cos_freqs.stride(-1) == 1:
+            return _rms_norm_interleaved_rope_triton_(x, weight, eps, cos_freqs, sin_freqs)
+
+    rms_norm_(x, weight, eps)
+    return apply_interleaved_rotary_emb_(x, cos_freqs, sin_freqs)
+
+
+def _rms_norm_interleaved_rope_triton_(
+    x: torch.Tensor,
+    weight: torch.Tensor,
+    eps: float | None,
+    cos_freqs: torch.Tensor,
+    sin_freqs: torch.Tensor,
+) -> torch.Tensor:
+    import triton  # noqa: PLC0415
+
+    from ltx_core.model.transformer.kernels import rms_norm_interleaved_rope_kernel  # noqa: PLC0415
+
+    batch, seq_len, dim = x.shape
+    block_half = triton.next_power_of_2(dim // 2)
+    rms_norm_interleaved_rope_kernel[(batch * seq_len,)](
+        x,
+        weight.contiguous(),
+        cos_freqs,
+        sin_freqs,
+        seq_len,
+        x.stride(0),
+        x.stride(1),
+        cos_freqs.stride(0),
+        cos_freqs.stride(1),
+        torch.finfo(x.dtype).eps if eps is None else eps,
+        DIM=dim,
+        BLOCK_HALF=block_half,
+        num_warps=8 if block_half >= 1024 else 4,
+    )
+    return x
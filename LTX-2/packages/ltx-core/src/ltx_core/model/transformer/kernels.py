@@ -0,0 +1,57 @@
+# ruff: noqa: ANN001, ANN201, N803, PLR0913, PLR0917
+import triton
+import triton.language as tl
+
+
+@triton.jit
+def rms_norm_interleaved_rope_kernel(
+    x_ptr,
+    weight_ptr,
+    cos_ptr,
+    sin_ptr,
+    seq_len,
+    stride_x_batch,
+    stride_x_token,
+    stride_freqs_batch,
+    stride_freqs_token,
+    eps,
+    DIM: tl.constexpr,
+    BLOCK_HALF: tl.constexpr,
+):
+    """
+    In-place RMSNorm followed by interleaved rotary embedding, one token row per program.
+    Element pairs ``(x[2i], x[2i + 1])`` are loaded separately so that the rotation
+    ``(a, b) -> (a * cos - b * sin, b * cos + a * sin)`` needs no temporary buffer.
+    The row may be a strided view (e.g. a slice of a fused QKV projection); only the
+    last dimension has to be contiguous. Accumulation is done in float32.
+    """
+    row = tl.program_id(axis=0)
+    batch = row // seq_len
+    token = row % seq_len
+
+    x_row = x_ptr + batch * stride_x_batch + token * stride_x_token
+    cos_row = cos_ptr + batch * stride_freqs_batch + token * stride_freqs_token
+    sin_row = sin_ptr + batch * stride_freqs_batch + token * stride_freqs_token
+
+    half = tl.arange(0, BLOCK_HALF)
+    mask = half < DIM // 2
+    even = 2 * half
+    odd = even + 1
+
+    a = tl.load(x_row + even, mask=mask, other=0.0).to(tl.float32)
+    b = tl.load(x_row + odd, mask=mask, other=0.0).to(tl.float32)
+    rstd = 1.0 / tl.sqrt((tl.sum(a * a, axis=0) + tl.sum(b * b, axis=0)) / DIM + eps)
+
+    a = a * rstd * tl.load(weight_ptr + even, mask=mask, other=0.0).to(tl.float32)
+    b = b * rstd * tl.load(weight_ptr + odd, mask=mask, other=0.0).to(tl.float32)
+
+    cos_a = tl.load(cos_row + even, mask=mask, other=1.0).to(tl.float32)
+    cos_b = tl.load(cos_row + odd, mask=mask, other=1.0).to(tl.float32)
+    sin_a = tl.load(sin_row + even, mask=mask, other=0.0).to(tl.float32)
+    sin_b = tl.load(sin_row + odd, mask=mask, other=0.0).to(tl.float32)
+
+    out_a = a * cos_a - b * sin_a
+    out_b = b * cos_b + a * sin_b
+
+    tl.store(x_row + even, out_a.to(x_ptr.dtype.element_ty), mask=mask)
+    tl.store(x_row + odd, out_b.to(x_ptr.dtype.element_ty), mask=mask)
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 
 import torch
 
+from ltx_core.types import BlockAttentionMask
+
 
 @dataclass(frozen=True)
 class Modality:
@@ -23,7 +25,8 @@ class Modality:
             Values in ``[0, 1]`` where ``1`` = full attention and ``0`` = no
             attention. ``None`` means unrestricted (full) attention between
             all tokens. Built incrementally by conditioning items; see
-            :class:`~ltx_core.conditioning.types.attention_strength_wrapper.ConditioningItemAttentionStrengthWrapper`.
+            :class:`~ltx_core.conditioning.types.attention_strength_wrapper.ConditioningItemAttentionStrengthWrapper`,
+            which produce the compact :class:`~ltx_core.types.BlockAttentionMask` form.
     """
 
     latent: (
@@ -37,4 +40,4 @@ class Modality:
     context: torch.Tensor
     enabled: bool = True
     context_mask: torch.Tensor | None = None
-    attention_mask: torch.Tensor | None = None
+    attention_mask: torch.Tensor | BlockAttentionMask | None = None
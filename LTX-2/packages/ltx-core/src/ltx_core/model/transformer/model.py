@@ -5,6 +5,7 @@ import torch
 from ltx_core.guidance.perturbations import BatchedPerturbationConfig
 from ltx_core.model.transformer.adaln import AdaLayerNormSingle, adaln_embedding_coefficient
 from ltx_core.model.transformer.attention import AttentionCallable, AttentionFunction
+from ltx_core.model.transformer.frozen_tokens import FrozenTokenCache
 from ltx_core.model.transformer.modality import Modality
 from ltx_core.model.transformer.rope import LTXRopeType
 from ltx_core.model.transformer.transformer import BasicAVTransformerBlock, TransformerConfig
@@ -66,6 +67,7 @@ class LTXModel(torch.nn.Module):
     ):
         super().__init__()
         self._enable_gradient_checkpointing = False
+        self._frozen_token_cache: FrozenTokenCache | None = None
         self.cross_attention_adaln = cross_attention_adaln
         self.use_middle_indices_grid = use_middle_indices_grid
         self.rope_type = rope_type
@@ -336,6 +338,17 @@ class LTXModel(torch.nn.Module):
         """
         self._enable_gradient_checkpointing = enable
 
+    def set_frozen_token_cache(self, cache: FrozenTokenCache | None) -> None:
+        """Enable or disable skipping frozen video tokens during inference.
+        With a cache set, video tokens whose timestep is zero across the batch are excluded from the
+        queries, feed-forward and output projection after the first pass; their keys/values are
+        computed once and reused (see :class:`~ltx_core.model.transformer.frozen_tokens.FrozenTokenCache`).
+        Their velocity is returned as zero. This is an approximation of the full forward.
+        Args:
+            cache: Cache to use, or None to run every token
+        """
+        self._frozen_token_cache = cache
+
     def _process_transformer_blocks(
         self,
         video: TransformerArgs | None,
@@ -401,6 +414,13 @@ class LTXModel(torch.nn.Module):
 
         video_args = self.video_args_preprocessor.prepare(video, audio) if video is not None else None
         audio_args = self.audio_args_preprocessor.prepare(audio, video) if audio is not None else None
+        frozen = (
+            self._frozen_token_cache.get(video, audio, perturbations)
+            if self._frozen_token_cache is not None and video is not None
+            else None
+        )
+        if frozen is not None:
+            video_args = frozen.active_args(video_args)
         # Process transformer blocks
         video_out, audio_out = self._process_transformer_blocks(
             video=video_args,
@@ -416,6 +436,9 @@ class LTXModel(torch.nn.Module):
             if video_out is not None
             else None
         )
+        if frozen is not None:
+            vx = frozen.full_output(vx)
+            frozen.recording = False
         ax = (
             self._process_output(
                 self.audio_scale_shift_table,
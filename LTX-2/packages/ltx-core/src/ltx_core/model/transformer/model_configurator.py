@@ -1,8 +1,9 @@
 import torch
 
+from ltx_core.loader.module_ops import ModuleOps
 from ltx_core.loader.sd_ops import SDOps
 from ltx_core.model.model_protocol import ModelConfigurator
-from ltx_core.model.transformer.attention import AttentionFunction
+from ltx_core.model.transformer.attention import Attention, AttentionFunction
 from ltx_core.model.transformer.model import LTXModel, LTXModelType
 from ltx_core.model.transformer.rope import LTXRopeType
 from ltx_core.model.transformer.text_projection import create_caption_projection
@@ -150,3 +151,29 @@ LTXV_MODEL_COMFY_RENAMING_MAP = (
     .with_matching(prefix="model.diffusion_model.")
     .with_replacement("model.diffusion_model.", "")
 )
+
+
+SELF_ATTENTION_MODULE_NAMES = ("attn1", "audio_attn1")
+
+
+def _fuse_qkv_after_load(module: Attention, _incompatible_keys: object) -> None:
+    module.fuse_qkv_projection()
+
+
+def _register_qkv_fusion(model: LTXModel) -> LTXModel:
+    """
+    Fuse the Q/K/V projections of every self-attention block once its weights are loaded.
+    The model is still on the meta device here, so fusion is deferred to a load_state_dict post-hook,
+    which runs after LoRAs are fused into the state dict and after quantization has replaced layers.
+    """
+    for name, module in model.named_modules():
+        if isinstance(module, Attention) and name.rsplit(".", 1)[-1] in SELF_ATTENTION_MODULE_NAMES:
+            module.register_load_state_dict_post_hook(_fuse_qkv_after_load)
+    return model
+
+
+FUSED_QKV_MODULE_OPS = ModuleOps(
+    name="fuse_self_attention_qkv",
+    matcher=lambda model: isinstance(model, LTXModel),
+    mutator=_register_qkv_fusion,
+)
@@ -221,6 +221,7 @@ class BasicAVTransformerBlock(torch.nn.Module):
                 if not all_perturbed and not none_perturbed
                 else None
             )
+            frozen = video.frozen_tokens
             vx = (
                 vx
                 + self.attn1(
@@ -229,6 +230,11 @@ class BasicAVTransformerBlock(torch.nn.Module):
                     mask=video.self_attention_mask,
                     perturbation_mask=v_mask,
                     all_perturbed=all_perturbed,
+                    extra_kv=frozen.extra_kv(
+                        frozen.self_attention_kv, self.idx, self.attn1, norm_vx, video.positional_embeddings
+                    )
+                    if frozen is not None
+                    else None,
                 )
                 * vgate_msa
             )
@@ -341,12 +347,22 @@ class BasicAVTransformerBlock(torch.nn.Module):
                 vx_scaled = vx_norm3 * (1 + scale_ca_video_v2a) + shift_ca_video_v2a
                 del scale_ca_video_v2a, shift_ca_video_v2a
                 v2a_mask = perturbations.mask_like(PerturbationType.SKIP_V2A_CROSS_ATTN, self.idx, ax)
+                frozen = video.frozen_tokens
                 ax = ax + (
                     self.video_to_audio_attn(
                         ax_scaled,
                         context=vx_scaled,
                         pe=audio.cross_positional_embeddings,
                         k_pe=video.cross_positional_embeddings,
+                        extra_kv=frozen.extra_kv(
+                            frozen.video_to_audio_kv,
+                            self.idx,
+                            self.video_to_audio_attn,
+                            vx_scaled,
+                            video.cross_positional_embeddings,
+                        )
+                        if frozen is not None
+                        else None,
                     )
                     * gate_out_v2a
                     * v2a_mask
@@ -3,6 +3,8 @@ from dataclasses import dataclass, replace
 import torch
 
 from ltx_core.model.transformer.adaln import AdaLayerNormSingle
+from ltx_core.model.transformer.attention_mask import BlockAttentionBias, additive_attention_bias
+from ltx_core.model.transformer.frozen_tokens import FrozenTokens
 from ltx_core.model.transformer.modality import Modality
 from ltx_core.model.transformer.rope import (
     LTXRopeType,
@@ -10,6 +12,7 @@ from ltx_core.model.transformer.rope import (
     generate_freq_grid_pytorch,
     precompute_freqs_cis,
 )
+from ltx_core.types import BlockAttentionMask
 
 
 @dataclass(frozen=True)
@@ -25,9 +28,10 @@ class TransformerArgs:
     cross_gate_timestep: torch.Tensor | None
     enabled: bool
     prompt_timestep: torch.Tensor | None = None
-    self_attention_mask: torch.Tensor | None = (
-        None  # Additive log-space self-attention bias (B, 1, T, T), None = full attention
+    self_attention_mask: torch.Tensor | BlockAttentionBias | None = (
+        None  # Additive log-space self-attention bias (B, 1, T, T) or its block form, None = full attention
     )
+    frozen_tokens: FrozenTokens | None = None  # Cached keys/values of frozen video tokens, see FrozenTokenCache
 
 
 class TransformerArgsPreprocessor:
@@ -95,32 +99,22 @@ class TransformerArgsPreprocessor:
         ) * torch.finfo(x_dtype).max
 
     def _prepare_self_attention_mask(
-        self, attention_mask: torch.Tensor | None, x_dtype: torch.dtype
-    ) -> torch.Tensor | None:
+        self, attention_mask: torch.Tensor | BlockAttentionMask | None, x: torch.Tensor
+    ) -> torch.Tensor | BlockAttentionBias | None:
         """Prepare self-attention mask by converting [0,1] values to additive log-space bias.
         Input shape: (B, T, T) with values in [0, 1].
         Output shape: (B, 1, T, T) with 0.0 for full attention and a large negative value
-        for masked positions.
-        Positions with attention_mask <= 0 are fully masked (mapped to the dtype's minimum
-        representable value). Strictly positive entries are converted via log-space for
-        smooth attenuation, with small values clamped for numerical stability.
+        for masked positions (see :func:`additive_attention_bias`).
+        A :class:`~ltx_core.types.BlockAttentionMask` is kept in block form as a
+        :class:`BlockAttentionBias`, which materializes the dense bias only if the
+        attention backend needs it.
         Returns None if input is None (no masking).
         """
         if attention_mask is None:
             return None
-
-        # Convert [0, 1] attention mask to additive log-space bias:
-        #   1.0 -> log(1.0) = 0.0  (no bias, full attention)
-        #   0.0 -> finfo.min        (fully masked)
-        finfo = torch.finfo(x_dtype)
-        eps = finfo.tiny
-
-        bias = torch.full_like(attention_mask, finfo.min, dtype=x_dtype)
-        positive = attention_mask > 0
-        if positive.any():
-            bias[positive] = torch.log(attention_mask[positive].clamp(min=eps)).to(x_dtype)
-
-        return bias.unsqueeze(1)  # (B, 1, T, T) for head broadcast
+        if isinstance(attention_mask, BlockAttentionMask):
+            return BlockAttentionBias(mask=attention_mask, dtype=x.dtype, device=x.device)
+        return additive_attention_bias(attention_mask, x.dtype)
 
     def _prepare_positional_embeddings(
         self,
@@ -171,7 +165,7 @@ class TransformerArgsPreprocessor:
             num_attention_heads=self.num_attention_heads,
             x_dtype=modality.latent.dtype,
         )
-        self_attention_mask = self._prepare_self_attention_mask(modality.attention_mask, modality.latent.dtype)
+        self_attention_mask = self._prepare_self_attention_mask(modality.attention_mask, modality.latent)
         return TransformerArgs(
             x=x,
             context=context,
@@ -1,10 +1,44 @@
+import itertools
+import logging
+import math
+from typing import NamedTuple
+
 import torch
 from einops import rearrange
 
 from ltx_core.model.upsampler.pixel_shuffle import PixelShuffleND
 from ltx_core.model.upsampler.res_block import ResBlock
 from ltx_core.model.upsampler.spatial_rational_resampler import SpatialRationalResampler
-from ltx_core.model.video_vae import VideoEncoder
+from ltx_core.model.video_vae import PerChannelStatistics, TilingConfig
+from ltx_core.model.video_vae.tiling_planner import (
+    ActivationStage,
+    TilingPlanner,
+    available_memory,
+    default_tiling_planner,
+    plan_tiling,
+)
+from ltx_core.types import VIDEO_SCALE_FACTORS, VideoLatentShape
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class _TileRegion(NamedTuple):
+    """
+    Tile of :meth:`LatentUpsampler.tiled_forward`. Slices are per latent axis (B, C, F, H, W), and None slices cover
+    untiled axes.
+    Attributes:
+        cut: Tile with its halo, in the latent.
+        core: Tile without its halo, in latents from the start of ``cut``.
+        output: Upsampled core, in the output.
+    """
+
+    cut: tuple[slice, ...]
+    core: tuple[slice, ...]
+    output: tuple[slice, ...]
+
+
+class _StatisticsCollected(Exception):  # noqa: N818
+    """Stops the forward of a tile once the normalization whose statistics are being collected has seen it."""
 
 
 class LatentUpsampler(torch.nn.Module):
@@ -124,19 +158,340 @@ class LatentUpsampler(torch.nn.Module):
 
         return x
 
+    def activation_stages(self) -> tuple[ActivationStage, ...]:
+        """Channels and sizes of the activations between the upsampler's layers, relative to the video voxels."""
+        latent_voxels = 1 / (VIDEO_SCALE_FACTORS.time * VIDEO_SCALE_FACTORS.height * VIDEO_SCALE_FACTORS.width)
+        upsampled_voxels = latent_voxels
+        if self.spatial_upsample:
+            upsampled_voxels *= self.spatial_scale**2
+        if self.temporal_upsample:
+            upsampled_voxels *= 2
+        # The upsampler's convolution output holds as many values as the shuffled activation
+        return (
+            ActivationStage(self.in_channels, latent_voxels),
+            ActivationStage(self.mid_channels, latent_voxels),
+            ActivationStage(self.mid_channels, upsampled_voxels),
+            ActivationStage(self.mid_channels, upsampled_voxels),
+            ActivationStage(self.in_channels, upsampled_voxels),
+        )
+
+    def plan_tiling(self, latent_shape: torch.Size, planner: TilingPlanner | None = None) -> TilingConfig | None:
+        """
+        Largest tiling of a latent of ``latent_shape`` whose tiles, with their halos (see :meth:`tiled_forward`), fit
+        in the free memory of the upsampler's device, or None when the whole latent fits. Only the memory is
+        planned: the halos and the statistics passes of 3D models multiply the compute (see :meth:`tiled_forward`),
+        and the largest tiles that fit keep that overhead smallest. 2D models are only split along time.
+        Args:
+            latent_shape: Shape of the latent to upsample.
+            planner: Planner holding the memory measurements. Defaults to
+                :func:`~ltx_core.model.video_vae.tiling_planner.default_tiling_planner`.
+        """
+        planner = planner or default_tiling_planner()
+        parameter = next(self.parameters())
+        bytes_per_voxel = planner.bytes_per_voxel(
+            self,
+            self.activation_stages(),
+            lambda: torch.randn((1, self.in_channels, 2, 8, 8), device=parameter.device, dtype=parameter.dtype),
+            example_video_voxels=9 * 256 * 256,
+        )
+        video_shape = VideoLatentShape.from_torch_shape(latent_shape).upscale(VIDEO_SCALE_FACTORS)
+        halo_frames, halo_pixels = self._halo_in_latents()
+        return plan_tiling(
+            video_shape.frames,
+            video_shape.height,
+            video_shape.width,
+            bytes_per_voxel * video_shape.batch,
+            available_memory(parameter.device, planner.memory_fraction),
+            spatial_overlap_in_pixels=0,
+            temporal_overlap_in_frames=0,
+            temporal=not self.temporal_upsample,
+            spatial=self.dims == 3,
+            tile_halo_in_frames=halo_frames * VIDEO_SCALE_FACTORS.time,
+            tile_halo_in_pixels=halo_pixels * VIDEO_SCALE_FACTORS.height,
+        )
+
+    def tiled_forward(self, latent: torch.Tensor, tiling_config: TilingConfig | None = None) -> torch.Tensor:
+        """
+        Upsample ``latent`` tile by tile, so that the peak memory follows the tile size instead of the latent size.
+        Tile sizes of ``tiling_config`` are in pixels and frames of the video the latent decodes to, as for the
+        video VAE; overlaps are ignored. The result is the same as :meth:`forward` up to floating point rounding.
+        2D models convolve and normalize every frame on its own, so they are split into chunks of frames, which are
+        upsampled as they are; their spatial tiles are only used without temporal ones.
+        3D models mix neighbouring frames and pixels, and normalize over the whole latent. Each tile is upsampled
+        with a halo of the receptive field of the convolutions on every side (see :meth:`_halo_in_latents`), which
+        is cropped, so the convolutions see the same values as in :meth:`forward`. Group normalization statistics
+        are collected over the whole latent first, one normalization at a time in forward order, with a pass over
+        the tiles each that stops at that normalization, and the final pass normalizes every tile with them. This
+        is expensive: the default configuration has 17 group normalizations, so the passes add up to about ten
+        forwards, and halos of 18 latent frames and 15 latent rows and columns, which can multiply the voxels of
+        small tiles several times. Tiling can then cost tens of times the compute of :meth:`forward`, and the
+        estimate is logged. Overlapping tiles blended like those of the video VAE would cost less, but every tile
+        would be normalized with its own statistics, so the result would differ from :meth:`forward` across whole
+        tiles, not only at the seams.
+        Spatial tiling needs an integer ``spatial_scale`` and temporal tiling a model without ``temporal_upsample``;
+        the other axes are not tiled.
+        Args:
+            latent: Input latent tensor of shape [B, C, F, H, W].
+            tiling_config: Tiling of the latent. With :meth:`TilingConfig.auto`, tiles are planned from the free
+                memory (see :meth:`plan_tiling`). None upsamples the whole latent at once.
+        Returns:
+            torch.Tensor: Upsampled latent tensor, as returned by :meth:`forward`.
+        """
+        if tiling_config is not None and tiling_config.automatic:
+            tiling_config = self.plan_tiling(latent.shape)
+        regions = self._tile_regions(latent.shape, tiling_config)
+        if len(regions) == 1:
+            return self.forward(latent)
+        if self.dims == 2 and regions[0].cut[3].start is None:
+            return torch.cat([self.forward(latent[region.cut]) for region in regions], dim=2)
+
+        norms = [module for module in self.modules() if isinstance(module, torch.nn.GroupNorm)]
+        tile_voxels = sum(
+            math.prod(_slice_length(cut, length) for cut, length in zip(region.cut[2:], latent.shape[2:], strict=True))
+            for region in regions
+        )
+        # Statistics pass k of n runs the model up to its k-th normalization, about k / n of a forward
+        forwards = (len(norms) + 1) / 2 + 1
+        logger.info(
+            f"Upsampling the latent in {len(regions)} tiles with {len(norms)} statistics passes, about "
+            f"{forwards * tile_voxels / math.prod(latent.shape[2:]):.0f}x the compute of an untiled forward"
+        )
+        group_norm = _WholeLatentGroupNorm(batch_size=latent.shape[0], num_frames=latent.shape[2])
+        handles = [norm.register_forward_hook(group_norm) for norm in norms]
+        try:
+            for _ in norms:
+                for region in regions:
+                    group_norm.region = region
+                    try:
+                        self.forward(latent[region.cut])
+                    except _StatisticsCollected:
+                        pass
+                if not group_norm.finish():
+                    break
+
+            output = None
+            for region in regions:
+                group_norm.region = region
+                upsampled = self.forward(latent[region.cut])
+                if output is None:
+                    output = torch.empty(
+                        _upsampled_shape(latent.shape, region, upsampled.shape),
+                        device=upsampled.device,
+                        dtype=upsampled.dtype,
+                    )
+                output[region.output] = upsampled[_scaled_core(region, latent[region.cut].shape, upsampled.shape)]
+                del upsampled
+        finally:
+            for handle in handles:
+                handle.remove()
+        return output
+
+    def _halo_in_latents(self) -> tuple[int, int]:
+        """
+        Latents a tile of :meth:`tiled_forward` is extended by on each side, in frames and in rows and columns: the
+        reach of all convolutions, those after the upsampling counted in latents before it.
+        """
+        before = [self.initial_conv, *self.res_blocks, self.upsampler]
+        after = [*self.post_upsample_res_blocks, self.final_conv]
+        time_scale = 2 if self.temporal_upsample else 1
+        space_scale = self.spatial_scale if self.spatial_upsample else 1.0
+        frames = _conv_reach(before, 0) + _conv_reach(after, 0) / time_scale
+        pixels = _conv_reach(before, -1) + _conv_reach(after, -1) / space_scale
+        if isinstance(self.upsampler, SpatialRationalResampler) and self.upsampler.blur_down.stride > 1:
+            # The blur runs after the pixel shuffle, on the upsampled-by-num grid
+            pixels += (self.upsampler.blur_down.kernel_size // 2) / self.upsampler.num
+        return math.ceil(frames), math.ceil(pixels)
+
+    def _tile_regions(self, latent_shape: torch.Size, tiling_config: TilingConfig | None) -> list[_TileRegion]:
+        halo_frames, halo_pixels = self._halo_in_latents()
+        # (axis, tile size in latents, halo, upsampling factor of the axis)
+        axes = []
+        temporal_config = tiling_config.temporal_config if tiling_config is not None else None
+        temporal = temporal_config is not None and not self.temporal_upsample
+        spatial_config = tiling_config.spatial_config if tiling_config is not None else None
+        # Chunks of frames need no statistics passes for 2D models, so they are not tiled spatially as well
+        spatial = spatial_config is not None and not (self.dims == 2 and temporal)
+        if spatial and (not self.spatial_upsample or self.spatial_scale.is_integer()):
+            scale = int(self.spatial_scale) if self.spatial_upsample else 1
+            size = spatial_config.tile_size_in_pixels // VIDEO_SCALE_FACTORS.height
+            axes += [(3, size, halo_pixels, scale), (4, size, halo_pixels, scale)]
+        if temporal:
+            axes.append((2, temporal_config.tile_size_in_frames // VIDEO_SCALE_FACTORS.time, halo_frames, 1))
+
+        intervals = []
+        for axis, size, halo, scale in axes:
+            length = latent_shape[axis]
+            count = -(-length // size)
+            bounds = [length * index // count for index in range(count + 1)]
+            intervals.append([(axis, start, stop, halo, scale) for start, stop in itertools.pairwise(bounds)])
+
+        regions = []
+        for combination in itertools.product(*intervals):
+            cut, core, output = ([slice(None)] * len(latent_shape) for _ in range(3))
+            for axis, start, stop, halo, scale in combination:
+                cut_start = max(0, start - halo)
+                cut[axis] = slice(cut_start, min(latent_shape[axis], stop + halo))
+                core[axis] = slice(start - cut_start, stop - cut_start)
+                output[axis] = slice(start * scale, stop * scale)
+            regions.append(_TileRegion(tuple(cut), tuple(core), tuple(output)))
+        return regions
+
+
+class _WholeLatentGroupNorm:
+    """
+    Forward hook of the group normalizations of :meth:`LatentUpsampler.tiled_forward`, which makes them use the
+    statistics of the whole latent. The first normalization without statistics accumulates them from the core of
+    every tile (with Chan's parallel variance update) and stops the forward; normalizations with statistics
+    normalize the tiles with them. Statistics are per group and per sample of the normalization: per latent for 3D
+    models, per frame for 2D ones, whose normalizations see one frame at a time.
+    Attributes:
+        region: Tile being upsampled.
+    """
+
+    def __init__(self, batch_size: int, num_frames: int):
+        self.batch_size = batch_size
+        self.num_frames = num_frames
+        self.region: _TileRegion | None = None
+        self._statistics: dict[torch.nn.GroupNorm, tuple[torch.Tensor, torch.Tensor]] = {}
+        self._pending: tuple[torch.nn.GroupNorm, torch.Tensor, torch.Tensor, torch.Tensor] | None = None
+
+    def __call__(self, module: torch.nn.GroupNorm, inputs: tuple[torch.Tensor, ...], _: torch.Tensor) -> torch.Tensor:
+        x = inputs[0]
+        statistics = self._statistics.get(module)
+        if statistics is not None:
+            return self._normalize(module, x, *statistics)
+        self._accumulate(module, x)
+        raise _StatisticsCollected
+
+    def finish(self) -> bool:
+        """Keep the statistics accumulated in the last pass. Returns False if there were none left to collect."""
+        if self._pending is None:
+            return False
+        module, count, mean, m2 = self._pending
+        self._statistics[module] = (mean.float(), (m2 / count).float())
+        self._pending = None
+        return True
+
+    def _accumulate(self, module: torch.nn.GroupNorm, x: torch.Tensor) -> None:
+        if self._pending is None:
+            frames = self.num_frames if x.dim() == 4 else 1
+            shape = (self.batch_size, frames, module.num_groups)
+            zeros = [torch.zeros(shape, device=x.device, dtype=torch.float64) for _ in range(3)]
+            self._pending = (module, *zeros)
+        pending_module, count, mean, m2 = self._pending
+        if pending_module is not module:
+            raise RuntimeError("Group normalizations ran in another order than in the previous statistics pass")
+
+        core = x[self._core(x)]
+        core = core.reshape(core.shape[0], module.num_groups, -1).float()
+        core_var, core_mean = torch.var_mean(core, dim=-1, correction=0)
+        core_count = core.shape[-1]
+        del core
+        core_var = core_var.view(self.batch_size, -1, module.num_groups).double()
+        core_mean = core_mean.view(self.batch_size, -1, module.num_groups).double()
+
+        slot = self._frames(x)
+        total = count[:, slot] + core_count
+        delta = core_mean - mean[:, slot]
+        m2[:, slot] += core_var * core_count + delta.square() * count[:, slot] * core_count / total
+        mean[:, slot] += delta * core_count / total
+        count[:, slot] = total
+
+    def _normalize(
+        self, module: torch.nn.GroupNorm, x: torch.Tensor, mean: torch.Tensor, var: torch.Tensor
+    ) -> torch.Tensor:
+        slot = self._frames(x)
+        mean = mean[:, slot].reshape(x.shape[0], module.num_groups, 1)
+        var = var[:, slot].reshape(x.shape[0], module.num_groups, 1)
+        groups = x.reshape(x.shape[0], module.num_groups, -1).float()
+        normalized = ((groups - mean) * torch.rsqrt(var + module.eps)).view(x.shape)
+        if module.affine:
+            channels = (1, -1) + (1,) * (x.dim() - 2)
+            normalized = normalized * module.weight.view(channels) + module.bias.view(channels)
+        return normalized.to(dtype=x.dtype)
+
+    def _frames(self, x: torch.Tensor) -> slice:
+        # 2D models normalize frames as samples; a tile's frames have no temporal halo, so all of them are core
+        return self.region.cut[2] if x.dim() == 4 else slice(None)
+
+    def _core(self, x: torch.Tensor) -> tuple[slice, ...]:
+        # 2D models fold frames into the batch, leaving (B * F, C, H, W)
+        axes = (2, 3, 4) if x.dim() == 5 else (3, 4)
+        core = [slice(None)] * x.dim()
+        for index, axis in enumerate(axes, start=x.dim() - len(axes)):
+            cut_length = _slice_length(self.region.cut[axis], None)
+            core[index] = _scale_slice(self.region.core[axis], x.shape[index] // cut_length if cut_length else 1)
+        return tuple(core)
+
+
+def _conv_reach(modules: list[torch.nn.Module], axis: int) -> int:
+    """Neighbours the convolutions in ``modules`` reach on each side along ``axis``; 0 is time for 3D ones."""
+    convs = [
+        conv
+        for module in modules
+        for conv in module.modules()
+        if isinstance(conv, torch.nn.Conv3d) or (isinstance(conv, torch.nn.Conv2d) and axis != 0)
+    ]
+    return sum((conv.kernel_size[axis] - 1) // 2 * conv.dilation[axis] for conv in convs)
+
+
+def _slice_length(axis_slice: slice, length: int | None) -> int | None:
+    if axis_slice.start is None:
+        return length
+    return axis_slice.stop - axis_slice.start
+
+
+def _scale_slice(axis_slice: slice, scale: int) -> slice:
+    if axis_slice.start is None:
+        return axis_slice
+    return slice(axis_slice.start * scale, axis_slice.stop * scale)
+
+
+def _scaled_core(region: _TileRegion, cut_shape: torch.Size, upsampled_shape: torch.Size) -> tuple[slice, ...]:
+    """Core of an upsampled tile, whose tiled axes are upsampled by an integer factor."""
+    return tuple(
+        _scale_slice(core, out_size // in_size)
+        for core, in_size, out_size in zip(region.core, cut_shape, upsampled_shape, strict=True)
+    )
+
+
+def _upsampled_shape(latent_shape: torch.Size, region: _TileRegion, upsampled_shape: torch.Size) -> list[int]:
+    """Shape of the whole upsampled latent: untiled axes as in the tile, tiled ones scaled like the tile."""
+    cut_shape = [_slice_length(cut, length) for cut, length in zip(region.cut, latent_shape, strict=True)]
+    return [
+        out_size if cut.start is None else length * (out_size // in_size)
+        for cut, length, in_size, out_size in zip(region.cut, latent_shape, cut_shape, upsampled_shape, strict=True)
+    ]
+
 
-def upsample_video(latent: torch.Tensor, video_encoder: VideoEncoder, upsampler: "LatentUpsampler") -> torch.Tensor:
+def upsample_video(
+    latent: torch.Tensor,
+    per_channel_statistics: PerChannelStatistics,
+    upsampler: "LatentUpsampler",
+    tiling_config: TilingConfig | None = None,
+) -> torch.Tensor:
     """
     Apply upsampling to the latent representation using the provided upsampler,
-    with normalization and un-normalization based on the video encoder's per-channel statistics.
+    with normalization and un-normalization based on the video latents' per-channel statistics.
     Args:
         latent: Input latent tensor of shape [B, C, F, H, W].
-        video_encoder: VideoEncoder with per_channel_statistics for normalization.
+        per_channel_statistics: Per-channel statistics of the video VAE, e.g. from
+            :class:`~ltx_core.model.video_vae.PerChannelStatisticsConfigurator` or a video encoder's
+            ``per_channel_statistics``.
         upsampler: LatentUpsampler module to perform upsampling.
+        tiling_config: Optional tiling of the upsampling, see :meth:`LatentUpsampler.tiled_forward`. Tiles of 3D
+            models cost a statistics pass per group normalization and halos, often tens of times the compute of an
+            untiled forward (logged when it runs), so the latent is only tiled when it does not fit in the free
+            memory as a whole (see :meth:`LatentUpsampler.plan_tiling`), with the planned tiles for
+            :meth:`TilingConfig.auto` and with the given ones otherwise. Chunks of frames of 2D models cost nothing
+            extra.
     Returns:
         torch.Tensor: Upsampled and re-normalized latent tensor.
     """
-    latent = video_encoder.per_channel_statistics.un_normalize(latent)
-    latent = upsampler(latent)
-    latent = video_encoder.per_channel_statistics.normalize(latent)
+    latent = per_channel_statistics.un_normalize(latent)
+    if tiling_config is not None and upsampler.plan_tiling(latent.shape) is not None:
+        latent = upsampler.tiled_forward(latent, tiling_config)
+    else:
+        latent = upsampler(latent)
+    latent = per_channel_statistics.normalize(latent)
     return latent
@@ -3,22 +3,39 @@
 from ltx_core.model.video_vae.model_configurator import (
     VAE_DECODER_COMFY_KEYS_FILTER,
     VAE_ENCODER_COMFY_KEYS_FILTER,
+    VAE_PER_CHANNEL_STATISTICS_KEYS_FILTER,
+    PerChannelStatisticsConfigurator,
     VideoDecoderConfigurator,
     VideoEncoderConfigurator,
 )
+from ltx_core.model.video_vae.ops import PerChannelStatistics
 from ltx_core.model.video_vae.tiling import SpatialTilingConfig, TemporalTilingConfig, TilingConfig
-from ltx_core.model.video_vae.video_vae import VideoDecoder, VideoEncoder, decode_video, get_video_chunks_number
+from ltx_core.model.video_vae.tiling_planner import TilingPlanner, default_tiling_planner, plan_tiling
+from ltx_core.model.video_vae.video_vae import (
+    VideoDecoder,
+    VideoEncoder,
+    decode_video,
+    decode_video_preview,
+    get_video_chunks_number,
+)
 
 __all__ = [
     "VAE_DECODER_COMFY_KEYS_FILTER",
     "VAE_ENCODER_COMFY_KEYS_FILTER",
+    "VAE_PER_CHANNEL_STATISTICS_KEYS_FILTER",
+    "PerChannelStatistics",
+    "PerChannelStatisticsConfigurator",
     "SpatialTilingConfig",
     "TemporalTilingConfig",
     "TilingConfig",
+    "TilingPlanner",
     "VideoDecoder",
     "VideoDecoderConfigurator",
     "VideoEncoder",
     "VideoEncoderConfigurator",
     "decode_video",
+    "decode_video_preview",
+    "default_tiling_planner",
     "get_video_chunks_number",
+    "plan_tiling",
 ]
@@ -1,6 +1,7 @@
 from ltx_core.loader.sd_ops import SDOps
 from ltx_core.model.model_protocol import ModelConfigurator
 from ltx_core.model.video_vae.enums import LogVarianceType, NormLayerType, PaddingModeType
+from ltx_core.model.video_vae.ops import PerChannelStatistics
 from ltx_core.model.video_vae.video_vae import VideoDecoder, VideoEncoder
 
 
@@ -62,6 +63,18 @@ class VideoDecoderConfigurator(ModelConfigurator[VideoDecoder]):
         )
 
 
+class PerChannelStatisticsConfigurator(ModelConfigurator[PerChannelStatistics]):
+    """
+    Configurator for creating the per-channel statistics of the video latents on their own, for code that
+    only normalizes or un-normalizes latents (e.g. :func:`~ltx_core.model.upsampler.upsample_video`).
+    """
+
+    @classmethod
+    def from_config(cls: type[PerChannelStatistics], config: dict) -> PerChannelStatistics:
+        config = config.get("vae", {})
+        return PerChannelStatistics(latent_channels=config.get("latent_channels", 128))
+
+
 VAE_DECODER_COMFY_KEYS_FILTER = (
     SDOps("VAE_DECODER_COMFY_KEYS_FILTER")
     .with_matching(prefix="vae.decoder.")
@@ -77,3 +90,9 @@ VAE_ENCODER_COMFY_KEYS_FILTER = (
     .with_replacement("vae.encoder.", "")
     .with_replacement("vae.per_channel_statistics.", "per_channel_statistics.")
 )
+
+VAE_PER_CHANNEL_STATISTICS_KEYS_FILTER = (
+    SDOps("VAE_PER_CHANNEL_STATISTICS_KEYS_FILTER")
+    .with_matching(prefix="vae.per_channel_statistics.")
+    .with_replacement("vae.per_channel_statistics.", "")
+)
@@ -75,10 +75,14 @@ class SpatialTilingConfig:
     Args:
         tile_size_in_pixels (int): Size of each tile in pixels. Must be at least 64 and divisible by 32.
         tile_overlap_in_pixels (int, optional): Overlap between tiles in pixels. Must be divisible by 32. Defaults to 0.
+        tile_batch_size (int, optional): Maximum number of tiles of the same shape the decoder decodes in one
+            forward. Decoder activations grow with the batch, so larger values trade the memory bound of tiling
+            for speed. :meth:`TilingConfig.auto` picks it from the free memory. Defaults to 1.
     """
 
     tile_size_in_pixels: int
     tile_overlap_in_pixels: int = 0
+    tile_batch_size: int = 1
 
     def __post_init__(self) -> None:
         if self.tile_size_in_pixels < 64:
@@ -91,6 +95,8 @@ class SpatialTilingConfig:
             raise ValueError(
                 f"Overlap must be less than tile size, got {self.tile_overlap_in_pixels} and {self.tile_size_in_pixels}"
             )
+        if self.tile_batch_size < 1:
+            raise ValueError(f"tile_batch_size must be at least 1, got {self.tile_batch_size}")
 
 
 @dataclass(frozen=True)
@@ -124,10 +130,17 @@ class TilingConfig:
     Attributes:
         spatial_config: Configuration for splitting spatial dimensions into tiles.
         temporal_config: Configuration for splitting temporal dimension into tiles.
+        automatic: Let the encoder or decoder plan the tiles from the free memory of its device when it runs, see
+            :mod:`~ltx_core.model.video_vae.tiling_planner`. Small videos are then not tiled at all.
     """
 
     spatial_config: SpatialTilingConfig | None = None
     temporal_config: TemporalTilingConfig | None = None
+    automatic: bool = False
+
+    def __post_init__(self) -> None:
+        if self.automatic and (self.spatial_config is not None or self.temporal_config is not None):
+            raise ValueError("An automatic tiling config must not set spatial_config or temporal_config")
 
     @classmethod
     def default(cls) -> "TilingConfig":
@@ -136,6 +149,11 @@ class TilingConfig:
             temporal_config=TemporalTilingConfig(tile_size_in_frames=64, tile_overlap_in_frames=24),
         )
 
+    @classmethod
+    def auto(cls) -> "TilingConfig":
+        """Tiles planned from the free memory when decoding or encoding."""
+        return cls(automatic=True)
+
 
 @dataclass(frozen=True)
 class DimensionIntervals:
@@ -239,6 +257,31 @@ class Tile(NamedTuple):
         return combined_mask
 
 
+def blend_weights_1d(tiles: List[Tile], axis: int, length: int) -> torch.Tensor:
+    """
+    Sum of the 1D masks of the distinct output intervals of ``tiles`` along ``axis``.
+    Tiles form a grid over the axes (see :func:`create_tiles_from_intervals_and_mappers`) and their blend masks
+    are separable, so the sum of the blend masks of all tiles is the outer product of these sums over the axes.
+    Args:
+        tiles: Tiles of one tensor.
+        axis: Axis to sum the masks along.
+        length: Length of the output along ``axis``.
+    Returns:
+        A 1D tensor of shape `(length,)`.
+    """
+    weights = torch.zeros(length)
+    seen = set()
+    for tile in tiles:
+        out_slice = tile.out_coords[axis]
+        interval = out_slice.indices(length)
+        if interval in seen:
+            continue
+        seen.add(interval)
+        mask_1d = tile.masks_1d[axis]
+        weights[out_slice] += mask_1d if mask_1d is not None else 1.0
+    return weights
+
+
 def create_tiles_from_intervals_and_mappers(
     intervals: TensorTilingSpec,
     mappers: List[MappingOperation],
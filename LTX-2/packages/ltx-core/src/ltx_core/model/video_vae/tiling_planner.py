@@ -0,0 +1,277 @@
+import functools
+import hashlib
+import itertools
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+import torch
+from torch import nn
+
+from ltx_core.model.video_vae.tiling import (
+    SpatialTilingConfig,
+    TemporalTilingConfig,
+    TilingConfig,
+)
+from ltx_core.utils import get_cache_dir
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+CALIBRATION_FORMAT_VERSION = 1
+
+# Free memory kept in reserve for the allocator's fragmentation and for whatever runs next to the VAE
+DEFAULT_MEMORY_FRACTION = 0.9
+# Live memory around the widest layer relative to its input and output, which share it with one temporary
+# for the normalization, activation or residual
+ACTIVATION_OVERHEAD = 1.5
+# Candidate tile sizes, largest first
+SPATIAL_TILE_SIZES_IN_PIXELS = (1024, 768, 512, 384, 256)
+TEMPORAL_TILE_SIZES_IN_FRAMES = (256, 192, 128, 96, 64, 48, 32)
+
+
+class ActivationStage(NamedTuple):
+    """
+    Activation between two layers of a VAE encoder or decoder.
+    Attributes:
+        channels: Number of channels of the activation.
+        voxels_per_video_voxel: Number of voxels of the activation per voxel (frame x pixel) of the video.
+    """
+
+    channels: int
+    voxels_per_video_voxel: float
+
+
+def estimate_bytes_per_voxel(stages: tuple[ActivationStage, ...], dtype: torch.dtype) -> float:
+    """
+    Peak activation memory per video voxel, estimated from the channel widths of ``stages``: the widest pair of
+    consecutive activations (a layer's input and output), times :data:`ACTIVATION_OVERHEAD`.
+    """
+    widest = max(
+        a.channels * a.voxels_per_video_voxel + b.channels * b.voxels_per_video_voxel
+        for a, b in itertools.pairwise(stages)
+    )
+    return ACTIVATION_OVERHEAD * dtype.itemsize * widest
+
+
+def available_memory(device: torch.device, memory_fraction: float = DEFAULT_MEMORY_FRACTION) -> int:
+    """
+    Memory the VAE can allocate on ``device``: free device memory plus memory the caching allocator holds but
+    does not use, or the available host memory on CPU, times ``memory_fraction``.
+    """
+    if device.type == "cuda":
+        free, _ = torch.cuda.mem_get_info(device)
+        reusable = torch.cuda.memory_reserved(device) - torch.cuda.memory_allocated(device)
+        return int((free + reusable) * memory_fraction)
+    return int(os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_AVPHYS_PAGES") * memory_fraction)
+
+
+def plan_tiling(
+    frames: int,
+    height: int,
+    width: int,
+    bytes_per_voxel: float,
+    available_bytes: int,
+    spatial_overlap_in_pixels: int = 64,
+    temporal_overlap_in_frames: int = 24,
+    temporal: bool = True,
+    spatial: bool = True,
+    tile_halo_in_frames: int = 0,
+    tile_halo_in_pixels: int = 0,
+) -> TilingConfig | None:
+    """
+    Pick the tiling of a video of ``frames`` x ``height`` x ``width`` whose tiles are the largest that fit in
+    ``available_bytes`` at ``bytes_per_voxel``.
+    Args:
+        frames: Number of video frames.
+        height: Video height in pixels.
+        width: Video width in pixels.
+        bytes_per_voxel: Peak memory per video voxel, see :meth:`TilingPlanner.bytes_per_voxel`.
+        available_bytes: Memory budget, see :func:`available_memory`.
+        spatial_overlap_in_pixels: Overlap of spatial tiles.
+        temporal_overlap_in_frames: Overlap of temporal tiles.
+        temporal: Whether the video may be split along time.
+        spatial: Whether the video may be split along height and width.
+        tile_halo_in_frames: Frames each temporal tile is extended by on both sides while it is processed, budgeted
+            with every temporal tile.
+        tile_halo_in_pixels: Pixels each spatial tile is extended by on all sides while it is processed, budgeted
+            with every spatial tile. Halos are weighed for their memory only, not for the compute they add, which
+            the largest tiles that fit also keep smallest.
+    Returns:
+        None when the whole video fits, otherwise the tiling config. Spatial tiles of the same shape are batched
+        (see :class:`SpatialTilingConfig`) as far as the budget allows.
+    """
+    if bytes_per_voxel * frames * height * width <= available_bytes:
+        return None
+
+    temporal_sizes = [None]
+    if temporal:
+        temporal_sizes += [
+            size for size in TEMPORAL_TILE_SIZES_IN_FRAMES if size < frames and size > temporal_overlap_in_frames
+        ]
+    spatial_sizes = [None]
+    if spatial:
+        spatial_sizes += [size for size in SPATIAL_TILE_SIZES_IN_PIXELS if size < max(height, width)]
+
+    best = None
+    for temporal_size in temporal_sizes:
+        tile_frames = frames if temporal_size is None else min(frames, temporal_size + 2 * tile_halo_in_frames)
+        for spatial_size in spatial_sizes:
+            if spatial_size is None:
+                tile_area = height * width
+            else:
+                halo_size = spatial_size + 2 * tile_halo_in_pixels
+                tile_area = min(halo_size, height) * min(halo_size, width)
+            tile_bytes = bytes_per_voxel * tile_frames * tile_area
+            # Sizes are tried largest first, so the first tile that fits is the largest for this temporal size
+            if tile_bytes <= available_bytes:
+                if best is None or tile_frames * tile_area > best[0]:
+                    best = (tile_frames * tile_area, temporal_size, spatial_size, tile_bytes)
+                break
+
+    if best is None:
+        logger.warning(
+            f"No VAE tiling of {frames}x{height}x{width} fits in {available_bytes / 2**30:.2f} GiB, "
+            "using the smallest tiles"
+        )
+        temporal_size = temporal_sizes[-1] if len(temporal_sizes) > 1 else None
+        best = (0, temporal_size, spatial_sizes[-1], float("inf"))
+    _, temporal_size, spatial_size, tile_bytes = best
+
+    spatial_config = None
+    if spatial_size is not None:
+        spatial_config = SpatialTilingConfig(
+            tile_size_in_pixels=spatial_size,
+            tile_overlap_in_pixels=spatial_overlap_in_pixels,
+            tile_batch_size=max(1, int(available_bytes // tile_bytes)),
+        )
+    temporal_config = None
+    if temporal_size is not None:
+        temporal_config = TemporalTilingConfig(
+            tile_size_in_frames=temporal_size, tile_overlap_in_frames=temporal_overlap_in_frames
+        )
+    return TilingConfig(spatial_config=spatial_config, temporal_config=temporal_config)
+
+
+@dataclass
+class TilingPlanner:
+    """
+    Measures how much memory a VAE needs per video voxel on a GPU and plans tilings from it.
+    The first plan for a model on a GPU runs it once on a small input and records the peak memory it allocates
+    per voxel. Measurements are persisted as JSON in ``cache_path``, keyed by GPU name, torch version, model
+    architecture (its :class:`ActivationStage` list) and dtype, so later processes skip them. Without CUDA the
+    memory is estimated from the channel widths (see :func:`estimate_bytes_per_voxel`).
+    Attributes:
+        cache_path: JSON file for persisted measurements. Defaults to ``vae_tiling/calibration.json`` under
+            :func:`~ltx_core.utils.get_cache_dir`, resolved on first use.
+        persist: Whether measurements are read from and written to ``cache_path``.
+        memory_fraction: Fraction of the free memory tiles may use, see :func:`available_memory`.
+    """
+
+    cache_path: Path | None = None
+    persist: bool = True
+    memory_fraction: float = DEFAULT_MEMORY_FRACTION
+    _calibrations: dict[str, float] = field(default_factory=dict)
+    _loaded: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def bytes_per_voxel(
+        self,
+        model: nn.Module,
+        stages: tuple[ActivationStage, ...],
+        example_input: Callable[[], torch.Tensor],
+        example_video_voxels: int,
+    ) -> float:
+        """
+        Peak memory ``model`` allocates per video voxel.
+        Args:
+            model: VAE encoder or decoder.
+            stages: Activations of ``model``, which identify its architecture.
+            example_input: Builds a small input of ``model`` on its device, used to measure the memory.
+            example_video_voxels: Number of video voxels the example input corresponds to.
+        """
+        parameter = next(model.parameters())
+        if parameter.device.type != "cuda":
+            return estimate_bytes_per_voxel(stages, parameter.dtype)
+
+        key = _calibration_key(model, stages, parameter.device, parameter.dtype)
+        self._load()
+        with self._lock:
+            measured = self._calibrations.get(key)
+        if measured is None:
+            measured = _measure_bytes_per_voxel(model, example_input, example_video_voxels)
+            with self._lock:
+                self._calibrations[key] = measured
+            self._save()
+            logger.info(f"VAE tiling calibration {key}: {measured:.1f} bytes per voxel")
+        return measured
+
+    def _cache_file(self) -> Path | None:
+        if not self.persist:
+            return None
+        if self.cache_path is None:
+            self.cache_path = get_cache_dir("vae_tiling") / "calibration.json"
+        return self.cache_path
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            self._loaded = True
+            try:
+                cache_file = self._cache_file()
+                if cache_file is None or not cache_file.exists():
+                    return
+                raw = json.loads(cache_file.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable VAE tiling calibration: {e}")
+                return
+            if raw.get("format_version") == CALIBRATION_FORMAT_VERSION:
+                self._calibrations.update(raw["bytes_per_voxel"])
+
+    def _save(self) -> None:
+        with self._lock:
+            raw = {"format_version": CALIBRATION_FORMAT_VERSION, "bytes_per_voxel": dict(self._calibrations)}
+        try:
+            cache_file = self._cache_file()
+            if cache_file is None:
+                return
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_text(json.dumps(raw, indent=2))
+            tmp_file.replace(cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write the VAE tiling calibration: {e}")
+
+
+@functools.cache
+def default_tiling_planner() -> TilingPlanner:
+    """Process-wide :class:`TilingPlanner`, persisting its measurements in the cache directory."""
+    return TilingPlanner()
+
+
+def _calibration_key(
+    model: nn.Module, stages: tuple[ActivationStage, ...], device: torch.device, dtype: torch.dtype
+) -> str:
+    architecture = hashlib.sha256(json.dumps([list(stage) for stage in stages]).encode("utf-8")).hexdigest()[:16]
+    device_name = torch.cuda.get_device_name(device)
+    return f"{device_name}|torch-{torch.__version__}|{type(model).__name__}-{architecture}|{dtype}"
+
+
+@torch.inference_mode()
+def _measure_bytes_per_voxel(
+    model: nn.Module, example_input: Callable[[], torch.Tensor], example_video_voxels: int
+) -> float:
+    device = next(model.parameters()).device
+    torch.cuda.synchronize(device)
+    torch.cuda.reset_peak_memory_stats(device)
+    baseline = torch.cuda.memory_allocated(device)
+    # The example input and the noise the model injects must not advance the random state of the caller
+    with torch.random.fork_rng(devices=[device]):
+        output = model(example_input())
+    torch.cuda.synchronize(device)
+    peak = torch.cuda.max_memory_allocated(device) - baseline
+    del output
+    return peak / example_video_voxels
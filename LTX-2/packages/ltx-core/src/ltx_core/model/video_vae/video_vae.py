@@ -1,4 +1,6 @@
+import functools
 import logging
+import math
 from dataclasses import replace
 from typing import Any, Callable, Iterator, List, Tuple
 
@@ -8,7 +10,7 @@ from torch import nn
 
 from ltx_core.model.common.normalization import PixelNorm
 from ltx_core.model.transformer.timestep_embedding import PixArtAlphaCombinedTimestepSizeEmbeddings
-from ltx_core.model.video_vae.convolution import make_conv_nd
+from ltx_core.model.video_vae.convolution import CausalConv3d, make_conv_nd
 from ltx_core.model.video_vae.enums import LogVarianceType, NormLayerType, PaddingModeType
 from ltx_core.model.video_vae.ops import PerChannelStatistics, patchify, unpatchify
 from ltx_core.model.video_vae.resnet import ResnetBlock3D, UNetMidBlock3D
@@ -21,14 +23,25 @@ from ltx_core.model.video_vae.tiling import (
     SplitOperation,
     Tile,
     TilingConfig,
+    blend_weights_1d,
     compute_rectangular_mask_1d,
     compute_trapezoidal_mask_1d,
     create_tiles,
 )
+from ltx_core.model.video_vae.tiling_planner import (
+    ActivationStage,
+    TilingPlanner,
+    available_memory,
+    default_tiling_planner,
+    plan_tiling,
+)
 from ltx_core.types import VIDEO_SCALE_FACTORS, SpatioTemporalScaleFactors, VideoLatentShape
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Latents decoded on each side of a preview region, so that the border pixels see most of their receptive field
+PREVIEW_CONTEXT_IN_LATENTS = 2
+
 
 def _make_encoder_block(
     block_name: str,
@@ -319,6 +332,65 @@ class VideoEncoder(nn.Module):
         means, _ = torch.chunk(sample, 2, dim=1)
         return self.per_channel_statistics.normalize(means)
 
+    def activation_stages(self) -> tuple[ActivationStage, ...]:
+        """Channels and sizes of the activations between the encoder's layers, from the video to the latent."""
+        voxels = 1 / self.patch_size**2
+        stages = [
+            ActivationStage(self.conv_in.in_channels // self.patch_size**2, 1.0),
+            ActivationStage(self.conv_in.in_channels, voxels),
+            ActivationStage(self.conv_in.out_channels, voxels),
+        ]
+        for down_block in self.down_blocks:
+            if isinstance(down_block, SpaceToDepthDownsample):
+                downscale = math.prod(down_block.stride)
+                stages.append(ActivationStage(down_block.conv.out_channels, voxels))
+                voxels /= downscale
+                stages.append(ActivationStage(down_block.conv.out_channels * downscale, voxels))
+            elif isinstance(down_block, ResnetBlock3D):
+                stages.append(ActivationStage(down_block.out_channels, voxels))
+            elif isinstance(down_block, UNetMidBlock3D):
+                stages.append(ActivationStage(down_block.res_blocks[-1].out_channels, voxels))
+            else:
+                # Strided convolution
+                conv = down_block.conv if isinstance(down_block, CausalConv3d) else down_block
+                voxels /= math.prod(conv.stride)
+                stages.append(ActivationStage(conv.out_channels, voxels))
+        stages.append(ActivationStage(self.conv_out.out_channels, voxels))
+        return tuple(stages)
+
+    def plan_tiling(
+        self,
+        video_shape: torch.Size,
+        temporal: bool = True,
+        planner: TilingPlanner | None = None,
+    ) -> TilingConfig | None:
+        """
+        Largest tiling of a video of ``video_shape`` (B, 3, F, H, W) whose tiles fit in the free memory of the
+        encoder's device, or None when the whole video fits.
+        Args:
+            video_shape: Shape of the video to encode.
+            temporal: Whether the video may also be split along time.
+            planner: Planner holding the memory measurements. Defaults to :func:`default_tiling_planner`.
+        """
+        planner = planner or default_tiling_planner()
+        parameter = next(self.parameters())
+        bytes_per_voxel = planner.bytes_per_voxel(
+            self,
+            self.activation_stages(),
+            lambda: torch.zeros((1, 3, 9, 256, 256), device=parameter.device, dtype=parameter.dtype),
+            example_video_voxels=9 * 256 * 256,
+        )
+        batch, _, frames, height, width = video_shape
+        return plan_tiling(
+            frames,
+            height,
+            width,
+            bytes_per_voxel * batch,
+            available_memory(parameter.device, planner.memory_fraction),
+            temporal_overlap_in_frames=16,
+            temporal=temporal,
+        )
+
     def tiled_encode(
         self,
         video: torch.Tensor,
@@ -332,11 +404,14 @@ class VideoEncoder(nn.Module):
             - Output latent is returned on model's device
         Args:
             video: Input video tensor (B, 3, F, H, W) in range [-1, 1]
-            tiling_config: Tiling configuration for the video tensor
+            tiling_config: Tiling configuration for the video tensor. With :meth:`TilingConfig.auto`, tiles are
+                planned from the free memory (see :meth:`plan_tiling`).
         Returns:
             Latent tensor (B, 128, F', H', W') on model's device
             where F' = 1 + (F-1)/8, H' = H/32, W' = W/32
         """
+        if tiling_config is not None and tiling_config.automatic:
+            tiling_config = self.plan_tiling(video.shape)
         # Detect model device and dtype
         model_device = next(self.parameters()).device
         model_dtype = next(self.parameters()).dtype
@@ -696,17 +771,7 @@ class VideoDecoder(nn.Module):
 
         # Add noise if timestep conditioning is enabled
         if self.timestep_conditioning:
-            noise = (
-                torch.randn(
-                    sample.size(),
-                    generator=generator,
-                    dtype=sample.dtype,
-                    device=sample.device,
-                )
-                * self.decode_noise_scale
-            )
-
-            sample = noise + (1.0 - self.decode_noise_scale) * sample
+            sample = self._add_decode_noise(sample, generator)
 
         # Denormalize latents
         sample = self.per_channel_statistics.un_normalize(sample)
@@ -767,37 +832,167 @@ class VideoDecoder(nn.Module):
 
         return sample
 
+    def _add_decode_noise(self, sample: torch.Tensor, generator: torch.Generator | None) -> torch.Tensor:
+        noise = (
+            torch.randn(
+                sample.size(),
+                generator=generator,
+                dtype=sample.dtype,
+                device=sample.device,
+            )
+            * self.decode_noise_scale
+        )
+        return noise + (1.0 - self.decode_noise_scale) * sample
+
+    def activation_stages(self) -> tuple[ActivationStage, ...]:
+        """Channels and sizes of the activations between the decoder's layers, from the latent to the video."""
+        factors = self.video_downscale_factors
+        voxels = 1 / (factors.time * factors.height * factors.width)
+        stages = [ActivationStage(self.conv_in.in_channels, voxels), ActivationStage(self.conv_in.out_channels, voxels)]
+        for up_block in self.up_blocks:
+            if isinstance(up_block, DepthToSpaceUpsample):
+                upscale = math.prod(up_block.stride)
+                stages.append(ActivationStage(up_block.out_channels, voxels))
+                voxels *= upscale
+                stages.append(ActivationStage(up_block.out_channels // upscale, voxels))
+            elif isinstance(up_block, ResnetBlock3D):
+                stages.append(ActivationStage(up_block.out_channels, voxels))
+            else:
+                stages.append(ActivationStage(up_block.res_blocks[-1].out_channels, voxels))
+        stages.append(ActivationStage(self.conv_out.out_channels, voxels))
+        return tuple(stages)
+
+    def plan_tiling(self, latent_shape: torch.Size, planner: TilingPlanner | None = None) -> TilingConfig | None:
+        """
+        Largest tiling of a latent of ``latent_shape`` whose tiles fit in the free memory of the decoder's device,
+        or None when the whole latent fits.
+        Args:
+            latent_shape: Shape of the latent to decode.
+            planner: Planner holding the memory measurements. Defaults to :func:`default_tiling_planner`.
+        """
+        planner = planner or default_tiling_planner()
+        parameter = next(self.parameters())
+        bytes_per_voxel = planner.bytes_per_voxel(
+            self,
+            self.activation_stages(),
+            lambda: torch.randn((1, self.conv_in.in_channels, 2, 8, 8), device=parameter.device, dtype=parameter.dtype),
+            example_video_voxels=9 * 256 * 256,
+        )
+        video_shape = VideoLatentShape.from_torch_shape(latent_shape).upscale(self.video_downscale_factors)
+        return plan_tiling(
+            video_shape.frames,
+            video_shape.height,
+            video_shape.width,
+            bytes_per_voxel * video_shape.batch,
+            available_memory(parameter.device, planner.memory_fraction),
+        )
+
+    def _frames_before_end_padding(self, num_latent_frames: int) -> int:
+        """
+        Number of leading frames a forward over ``num_latent_frames`` latent frames decodes without the padding at
+        the end of the latent reaching them. Unless the decoder is ``causal``, every temporal convolution looks at
+        ``(kernel_size - 1) // 2`` later frames and pads the end with copies of the last one.
+        """
+        upsamplers = {id(module.conv): module for module in self.modules() if isinstance(module, DepthToSpaceUpsample)}
+        frames = num_latent_frames
+        for module in self.modules():
+            if not isinstance(module, CausalConv3d) or frames == 0:
+                continue
+            context = module.time_kernel_size - 1
+            left_pad = context if self.causal else context // 2
+            frames = max(0, frames + left_pad - context)
+            upsampler = upsamplers.get(id(module))
+            if upsampler is not None and upsampler.stride[0] == 2 and frames > 0:
+                # The first frame of a temporal upsampling is dropped
+                frames = 2 * frames - 1
+        return frames
+
+    def decode_preview(
+        self,
+        latent: torch.Tensor,
+        num_latent_frames: int | None = 1,
+        region: tuple[slice, slice] | None = None,
+        look_ahead_in_latents: int | None = None,
+        timestep: torch.Tensor | None = None,
+        generator: torch.Generator | None = None,
+    ) -> torch.Tensor:
+        """
+        Decode the first frames of a latent, optionally in a spatial region only, for previews and thumbnails.
+        A prefix of the latent is decoded with :meth:`tiled_decode` and :meth:`TilingConfig.auto`, so a preview
+        needs no more memory than the full decode, and decoding stops at the temporal tile holding the last
+        requested frame.
+        The prefix is not a cheap exact decode. Unless the decoder is ``causal``, its convolutions look at later
+        frames: the default LTX-2 decoder needs about 20 latent frames after a frame before the padding at the end
+        of the latent no longer reaches it (see :meth:`_frames_before_end_padding`). With
+        ``look_ahead_in_latents=None`` the prefix includes that whole look-ahead and the frames match the full
+        decode, up to tile seams and the noise the decoder draws for the shape it decodes. For clips of up to about
+        20 latent frames this costs as much as the full decode. ``look_ahead_in_latents`` opts into an
+        approximation instead: the prefix extends that many latents past the requested frames only, which costs a
+        fraction of the full decode, but its last frames see the padding instead of the frames that follow them.
+        A region is decoded with :data:`PREVIEW_CONTEXT_IN_LATENTS` latents of context on each side, which are
+        cropped from the output, and its border pixels can differ slightly from the full decode.
+        Args:
+            latent: Input latent tensor (B, C, F', H', W').
+            num_latent_frames: Number of latent frames to decode, ``(num_latent_frames - 1) * 8 + 1`` video frames.
+                None decodes all of them.
+            region: Rows and columns of the latent to decode, e.g. ``(slice(0, 16), slice(8, 24))``. None decodes
+                the whole frame.
+            look_ahead_in_latents: Latent frames decoded past the requested ones for an approximate preview, or
+                None for the exact look-ahead of the decoder.
+            timestep: Optional timestep for decoder conditioning.
+            generator: Optional random generator for deterministic decoding.
+        Returns:
+            Video (B, 3, F, H, W).
+        """
+        total_latent_frames = latent.shape[2]
+        if num_latent_frames is None or num_latent_frames > total_latent_frames:
+            num_latent_frames = total_latent_frames
+        num_frames = (num_latent_frames - 1) * self.video_downscale_factors.time + 1
+        if look_ahead_in_latents is None:
+            # Latents whose forward outputs the first num_frames frames before the padding at its end reaches them
+            end = num_latent_frames
+            while end < total_latent_frames and self._frames_before_end_padding(end) < num_frames:
+                end += 1
+        elif look_ahead_in_latents < 0:
+            raise ValueError(f"look_ahead_in_latents must not be negative, got {look_ahead_in_latents}")
+        else:
+            end = min(total_latent_frames, num_latent_frames + look_ahead_in_latents)
+        latent = latent[:, :, :end]
+
+        crops = [slice(None), slice(None)]
+        if region is not None:
+            padded_slices = []
+            crops = []
+            for axis_slice, size, scale in zip(
+                region,
+                latent.shape[3:],
+                (self.video_downscale_factors.height, self.video_downscale_factors.width),
+                strict=True,
+            ):
+                start, stop, step = axis_slice.indices(size)
+                if step != 1 or start >= stop:
+                    raise ValueError(f"Preview region must be a non-empty contiguous slice, got {axis_slice}")
+                padded_start = max(0, start - PREVIEW_CONTEXT_IN_LATENTS)
+                padded_stop = min(size, stop + PREVIEW_CONTEXT_IN_LATENTS)
+                padded_slices.append(slice(padded_start, padded_stop))
+                crops.append(slice((start - padded_start) * scale, (stop - padded_start) * scale))
+            latent = latent[:, :, :, padded_slices[0], padded_slices[1]]
+
+        chunks = []
+        remaining_frames = num_frames
+        for chunk in self.tiled_decode(latent, TilingConfig.auto(), timestep, generator):
+            chunks.append(chunk[:, :, :remaining_frames, crops[0], crops[1]])
+            remaining_frames -= chunks[-1].shape[2]
+            if remaining_frames == 0:
+                break
+        return torch.cat(chunks, dim=2)
+
     def _prepare_tiles(
         self,
         latent: torch.Tensor,
         tiling_config: TilingConfig | None = None,
     ) -> List[Tile]:
-        splitters = [DEFAULT_SPLIT_OPERATION] * len(latent.shape)
-        mappers = [DEFAULT_MAPPING_OPERATION] * len(latent.shape)
-        if tiling_config is not None and tiling_config.spatial_config is not None:
-            cfg = tiling_config.spatial_config
-            long_side = max(latent.shape[3], latent.shape[4])
-
-            def enable_on_axis(axis_idx: int, factor: int) -> None:
-                size = cfg.tile_size_in_pixels // factor
-                overlap = cfg.tile_overlap_in_pixels // factor
-                axis_length = latent.shape[axis_idx]
-                lower_threshold = max(2, overlap + 1)
-                tile_size = max(lower_threshold, round(size * axis_length / long_side))
-                splitters[axis_idx] = split_with_symmetric_overlaps(tile_size, overlap)
-                mappers[axis_idx] = make_mapping_operation(map_spatial_interval_to_pixel, scale=factor)
-
-            enable_on_axis(3, self.video_downscale_factors.height)
-            enable_on_axis(4, self.video_downscale_factors.width)
-
-        if tiling_config is not None and tiling_config.temporal_config is not None:
-            cfg = tiling_config.temporal_config
-            tile_size = cfg.tile_size_in_frames // self.video_downscale_factors.time
-            overlap = cfg.tile_overlap_in_frames // self.video_downscale_factors.time
-            splitters[2] = split_temporal_latents(tile_size, overlap)
-            mappers[2] = make_mapping_operation(map_temporal_interval_to_frame, scale=self.video_downscale_factors.time)
-
-        return create_tiles(latent.shape, splitters, mappers)
+        return decode_tile_layout(latent.shape, tiling_config, self.video_downscale_factors).tiles
 
     def tiled_decode(
         self,
@@ -818,20 +1013,41 @@ class VideoDecoder(nn.Module):
         Yields:
             Video chunks (B, C, T, H, W) by temporal slices;
         """
+        for chunk, normalizers in self._tiled_decode_chunks(latent, tiling_config, timestep, generator):
+            for normalizer in normalizers:
+                chunk.mul_(normalizer)
+            yield chunk
 
-        # Calculate full video shape from latent shape to get spatial dimensions
-        full_video_shape = VideoLatentShape.from_torch_shape(latent.shape).upscale(self.video_downscale_factors)
-        tiles = self._prepare_tiles(latent, tiling_config)
+    def _tiled_decode_chunks(
+        self,
+        latent: torch.Tensor,
+        tiling_config: TilingConfig | None,
+        timestep: torch.Tensor | None,
+        generator: torch.Generator | None,
+    ) -> Iterator[tuple[torch.Tensor, tuple[torch.Tensor, ...]]]:
+        """
+        Video chunks of :meth:`tiled_decode` before the division by the blend weights, each with the factors that
+        normalize it (see :meth:`DecodeTileLayout.normalizers`). Chunks are not used after they are yielded and
+        may be modified in place.
+        """
+        if tiling_config is not None and tiling_config.automatic:
+            tiling_config = self.plan_tiling(latent.shape)
+            if tiling_config is None:
+                yield self.forward(latent, timestep, generator), ()
+                return
+
+        layout = decode_tile_layout(latent.shape, tiling_config, self.video_downscale_factors)
+        full_video_shape = layout.output_shape
+        tile_batch_size = _tile_batch_size(tiling_config)
 
-        temporal_groups = self._group_tiles_by_temporal_slice(tiles)
+        temporal_groups = self._group_tiles_by_temporal_slice(layout.tiles)
 
         # State for temporal overlap handling
         previous_chunk = None
-        previous_weights = None
         previous_temporal_slice = None
 
         for temporal_group_tiles in temporal_groups:
-            curr_temporal_slice = temporal_group_tiles[0].out_coords[2]
+            curr_temporal_slice = slice(*temporal_group_tiles[0].out_coords[2].indices(full_video_shape.frames)[:2])
 
             # Calculate the shape of the temporal buffer for this group of tiles.
             # The temporal length depends on whether this is the first tile (starts at 0) or not.
@@ -848,12 +1064,14 @@ class VideoDecoder(nn.Module):
                 dtype=latent.dtype,
             )
 
-            curr_weights = self._accumulate_temporal_group_into_buffer(
+            self._accumulate_temporal_group_into_buffer(
                 group_tiles=temporal_group_tiles,
+                layout=layout,
                 buffer=buffer,
                 latent=latent,
                 timestep=timestep,
                 generator=generator,
+                tile_batch_size=tile_batch_size,
             )
 
             # Blend with previous temporal chunk if it exists
@@ -863,34 +1081,47 @@ class VideoDecoder(nn.Module):
                     overlap_len = previous_temporal_slice.stop - curr_temporal_slice.start
                     temporal_overlap_slice = slice(curr_temporal_slice.start - previous_temporal_slice.start, None)
 
-                    # The overlap is already masked before it reaches this step. Each tile is accumulated into buffer
-                    # with its trapezoidal mask, and curr_weights accumulates the same mask. In the overlap blend we add
-                    # the masked values (buffer[...]) and the corresponding weights (curr_weights[...]) into the
-                    # previous buffers, then later normalize by weights.
+                    # The overlap is already masked before it reaches this step: each tile is accumulated into buffer
+                    # with its trapezoidal mask. In the overlap blend we add the masked values (buffer[...]) into the
+                    # previous buffer, and the layout later normalizes by the sum of the masks.
                     previous_chunk[:, :, temporal_overlap_slice, :, :] += buffer[:, :, slice(0, overlap_len), :, :]
-                    previous_weights[:, :, temporal_overlap_slice, :, :] += curr_weights[
-                        :, :, slice(0, overlap_len), :, :
-                    ]
-
                     buffer[:, :, slice(0, overlap_len), :, :] = previous_chunk[:, :, temporal_overlap_slice, :, :]
-                    curr_weights[:, :, slice(0, overlap_len), :, :] = previous_weights[
-                        :, :, temporal_overlap_slice, :, :
-                    ]
 
                 # Yield the non-overlapping part of the previous chunk
-                previous_weights = previous_weights.clamp(min=1e-8)
                 yield_len = curr_temporal_slice.start - previous_temporal_slice.start
-                yield (previous_chunk / previous_weights)[:, :, :yield_len, :, :]
+                yield (
+                    previous_chunk[:, :, :yield_len, :, :],
+                    layout.normalizers(previous_temporal_slice.start, yield_len, latent.device, latent.dtype),
+                )
 
             # Update state for next iteration
             previous_chunk = buffer
-            previous_weights = curr_weights
             previous_temporal_slice = curr_temporal_slice
 
         # Yield any remaining chunk
         if previous_chunk is not None:
-            previous_weights = previous_weights.clamp(min=1e-8)
-            yield previous_chunk / previous_weights
+            yield (
+                previous_chunk,
+                layout.normalizers(previous_temporal_slice.start, previous_chunk.shape[2], latent.device, latent.dtype),
+            )
+
+    def _decode_tiles(
+        self,
+        latent: torch.Tensor,
+        tiles: List[Tile],
+        timestep: torch.Tensor | None,
+        generator: torch.Generator | None,
+    ) -> tuple[torch.Tensor, ...]:
+        """
+        Decode tiles whose inputs have the same shape in one forward, stacked along the batch dimension.
+        Noise injected by the decoder blocks is drawn per forward, so tiles decoded together share it.
+        """
+        if len(tiles) == 1:
+            return (self.forward(latent[tiles[0].in_coords], timestep, generator),)
+        batch = torch.cat([latent[tile.in_coords] for tile in tiles])
+        if timestep is not None:
+            timestep = timestep.flatten().repeat(len(tiles))
+        return self.forward(batch, timestep, generator).chunk(len(tiles))
 
     def _group_tiles_by_temporal_slice(self, tiles: List[Tile]) -> List[List[Tile]]:
         """Group tiles by their temporal output slice."""
@@ -919,48 +1150,165 @@ class VideoDecoder(nn.Module):
     def _accumulate_temporal_group_into_buffer(
         self,
         group_tiles: List[Tile],
+        layout: "DecodeTileLayout",
         buffer: torch.Tensor,
         latent: torch.Tensor,
         timestep: torch.Tensor | None,
         generator: torch.Generator | None,
-    ) -> torch.Tensor:
+        tile_batch_size: int = 1,
+    ) -> None:
         """
-        Decode and accumulate all tiles of a temporal group into a local buffer.
-        The buffer is local to the group and always starts at time 0; temporal coordinates
-        are rebased by subtracting temporal_slice.start.
+        Decode all tiles of a temporal group, batching tiles of the same shape, and accumulate them into a
+        local buffer weighted by their blend masks. The buffer is local to the group and always starts at
+        time 0: all tiles of the group share its temporal slice.
         """
-        temporal_slice = group_tiles[0].out_coords[2]
-
-        weights = torch.zeros_like(buffer)
-
-        for tile in group_tiles:
-            decoded_tile = self.forward(latent[tile.in_coords], timestep, generator)
-            mask = tile.blend_mask.to(device=buffer.device, dtype=buffer.dtype)
-            temporal_offset = tile.out_coords[2].start - temporal_slice.start
-            # Use the tile's output coordinate length, not the decoded tile's length,
-            # as the decoder may produce a different number of frames than expected
-            expected_temporal_len = tile.out_coords[2].stop - tile.out_coords[2].start
-            decoded_temporal_len = decoded_tile.shape[2]
-
-            # Ensure we don't exceed the buffer or decoded tile bounds
-            actual_temporal_len = min(expected_temporal_len, decoded_temporal_len, buffer.shape[2] - temporal_offset)
-
-            chunk_coords = (
-                slice(None),  # batch
-                slice(None),  # channels
-                slice(temporal_offset, temporal_offset + actual_temporal_len),
-                tile.out_coords[3],  # height
-                tile.out_coords[4],  # width
-            )
+        for batch in _batch_tiles_by_shape(group_tiles, tile_batch_size):
+            for tile, decoded_tile in zip(batch, self._decode_tiles(latent, batch, timestep, generator), strict=True):
+                mask = layout.blend_mask(tile, buffer.device, buffer.dtype)
+                # The decoder may produce a different number of frames than the tile's output coordinates expect
+                actual_temporal_len = min(decoded_tile.shape[2], buffer.shape[2])
+
+                chunk_coords = (
+                    slice(None),  # batch
+                    slice(None),  # channels
+                    slice(0, actual_temporal_len),
+                    tile.out_coords[3],  # height
+                    tile.out_coords[4],  # width
+                )
+
+                # Slice decoded_tile and mask to match the actual length we're writing
+                decoded_slice = decoded_tile[:, :, :actual_temporal_len, :, :]
+                mask_slice = mask[:, :, :actual_temporal_len, :, :] if mask.shape[2] > 1 else mask
+
+                buffer[chunk_coords].addcmul_(decoded_slice, mask_slice)
+
+
+class DecodeTileLayout:
+    """
+    Tiles the decoder splits a latent shape into, with their blend masks and the normalizer of the blended
+    video. Blend masks are separable and tiles form a grid, so the sum of the masks over all tiles is the
+    outer product of per-axis sums (see :func:`blend_weights_1d`) and no weight buffer is accumulated.
+    Layouts depend only on shapes and are cached by :func:`decode_tile_layout`; their masks are moved to
+    each device and dtype once.
+    Attributes:
+        tiles: Tiles of the latent.
+        output_shape: Shape of the decoded video.
+    """
+
+    def __init__(self, tiles: List[Tile], output_shape: VideoLatentShape) -> None:
+        self.tiles = tiles
+        self.output_shape = output_shape
+        self._tensors: dict[tuple, torch.Tensor] = {}
+
+    def blend_mask(self, tile: Tile, device: torch.device, dtype: torch.dtype) -> torch.Tensor:
+        """Blend mask (1, 1, T, H, W) of ``tile``, with T = 1 when the tile spans all frames."""
+        frames, height, width = (
+            tile.out_coords[axis].indices(length) for axis, length in zip((2, 3, 4), self.output_shape[2:], strict=True)
+        )
+        frame_mask = self._cached(("frame_mask", frames), device, dtype, lambda: _mask_view(tile.masks_1d[2], axis=2))
+        spatial_mask = self._cached(
+            ("spatial_mask", height, width),
+            device,
+            dtype,
+            lambda: _mask_view(tile.masks_1d[3], axis=3) * _mask_view(tile.masks_1d[4], axis=4),
+        )
+        return frame_mask * spatial_mask
+
+    def normalizers(
+        self, frame_offset: int, num_frames: int, device: torch.device, dtype: torch.dtype
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """
+        Reciprocal blend weights (1, 1, 1, H, W) and (1, 1, T, 1, 1) of video frames ``frame_offset`` to
+        ``frame_offset + num_frames``. Multiplying blended frames by both divides them by their weights.
+        """
+
+        def reciprocal_weights(axis: int) -> torch.Tensor:
+            weights = blend_weights_1d(self.tiles, axis, self.output_shape[axis])
+            return _mask_view(weights.clamp(min=1e-8).reciprocal(), axis)
+
+        frame_normalizer = self._cached(("frame_normalizer",), device, dtype, lambda: reciprocal_weights(2))
+        spatial_normalizer = self._cached(
+            ("spatial_normalizer",),
+            device,
+            dtype,
+            lambda: reciprocal_weights(3) * reciprocal_weights(4),
+        )
+        return spatial_normalizer, frame_normalizer[:, :, frame_offset : frame_offset + num_frames]
+
+    def _cached(
+        self, key: tuple, device: torch.device, dtype: torch.dtype, compute: Callable[[], torch.Tensor]
+    ) -> torch.Tensor:
+        key = (*key, device, dtype)
+        tensor = self._tensors.get(key)
+        if tensor is None:
+            tensor = compute().to(device=device, dtype=dtype)
+            self._tensors[key] = tensor
+        return tensor
+
+
+@functools.lru_cache(maxsize=4)
+def decode_tile_layout(
+    latent_shape: torch.Size,
+    tiling_config: TilingConfig | None,
+    downscale_factors: SpatioTemporalScaleFactors,
+) -> DecodeTileLayout:
+    """Split a latent of ``latent_shape`` into decoder tiles, cached by shape and tiling configuration."""
+    splitters = [DEFAULT_SPLIT_OPERATION] * len(latent_shape)
+    mappers = [DEFAULT_MAPPING_OPERATION] * len(latent_shape)
+    if tiling_config is not None and tiling_config.spatial_config is not None:
+        cfg = tiling_config.spatial_config
+        long_side = max(latent_shape[3], latent_shape[4])
+
+        def enable_on_axis(axis_idx: int, factor: int) -> None:
+            size = cfg.tile_size_in_pixels // factor
+            overlap = cfg.tile_overlap_in_pixels // factor
+            axis_length = latent_shape[axis_idx]
+            lower_threshold = max(2, overlap + 1)
+            tile_size = max(lower_threshold, round(size * axis_length / long_side))
+            splitters[axis_idx] = split_with_symmetric_overlaps(tile_size, overlap)
+            mappers[axis_idx] = make_mapping_operation(map_spatial_interval_to_pixel, scale=factor)
+
+        enable_on_axis(3, downscale_factors.height)
+        enable_on_axis(4, downscale_factors.width)
+
+    if tiling_config is not None and tiling_config.temporal_config is not None:
+        cfg = tiling_config.temporal_config
+        tile_size = cfg.tile_size_in_frames // downscale_factors.time
+        overlap = cfg.tile_overlap_in_frames // downscale_factors.time
+        splitters[2] = split_temporal_latents(tile_size, overlap)
+        mappers[2] = make_mapping_operation(map_temporal_interval_to_frame, scale=downscale_factors.time)
+
+    tiles = create_tiles(latent_shape, splitters, mappers)
+    return DecodeTileLayout(tiles, VideoLatentShape.from_torch_shape(latent_shape).upscale(downscale_factors))
+
 
-            # Slice decoded_tile and mask to match the actual length we're writing
-            decoded_slice = decoded_tile[:, :, :actual_temporal_len, :, :]
-            mask_slice = mask[:, :, :actual_temporal_len, :, :] if mask.shape[2] > 1 else mask
+def _mask_view(mask_1d: torch.Tensor | None, axis: int) -> torch.Tensor:
+    """View a 1D mask along ``axis`` of a 5D tensor; a missing mask broadcasts along the axis."""
+    view_shape = [1] * 5
+    if mask_1d is None:
+        return torch.ones(view_shape)
+    view_shape[axis] = mask_1d.shape[0]
+    return mask_1d.view(*view_shape)
 
-            buffer[chunk_coords] += decoded_slice * mask_slice
-            weights[chunk_coords] += mask_slice
 
-        return weights
+def _tile_batch_size(tiling_config: TilingConfig | None) -> int:
+    if tiling_config is None or tiling_config.spatial_config is None:
+        return 1
+    return tiling_config.spatial_config.tile_batch_size
+
+
+def _batch_tiles_by_shape(tiles: List[Tile], tile_batch_size: int) -> List[List[Tile]]:
+    """Group tiles whose inputs have the same shape into batches of at most ``tile_batch_size`` tiles."""
+    tiles_by_shape: dict[tuple[int, ...], List[Tile]] = {}
+    for tile in tiles:
+        shape = tuple(in_slice.stop - in_slice.start for in_slice in tile.in_coords)
+        tiles_by_shape.setdefault(shape, []).append(tile)
+    batches = []
+    for same_shape_tiles in tiles_by_shape.values():
+        batches.extend(
+            same_shape_tiles[i : i + tile_batch_size] for i in range(0, len(same_shape_tiles), tile_batch_size)
+        )
+    return batches
 
 
 def decode_video(
@@ -974,34 +1322,101 @@ def decode_video(
     Args:
         latent: Tensor [c, f, h, w]
         video_decoder: Decoder module.
-        tiling_config: Optional tiling settings.
+        tiling_config: Optional tiling settings. With :meth:`TilingConfig.auto`, the tiling is planned from the free
+            memory of the decoder's device.
         generator: Optional random generator for deterministic decoding.
     Yields:
-        Decoded chunk [f, h, w, c], uint8 in [0, 255].
+        Decoded chunk [f, h, w, c], uint8 in [0, 255], on the host. Chunks decoded on CUDA share one pinned buffer:
+        each chunk is valid until the next one is requested, so clone chunks that are kept longer.
     """
-
-    def convert_to_uint8(frames: torch.Tensor) -> torch.Tensor:
-        frames = (((frames + 1.0) / 2.0).clamp(0.0, 1.0) * 255.0).to(torch.uint8)
-        frames = rearrange(frames[0], "c f h w -> f h w c")
-        return frames
-
     if tiling_config is not None:
-        for frames in video_decoder.tiled_decode(latent, tiling_config, generator=generator):
-            yield convert_to_uint8(frames)
+        host_buffer = _HostFrameBuffer()
+        chunks = video_decoder._tiled_decode_chunks(latent, tiling_config, timestep=None, generator=generator)
+        for frames, normalizers in chunks:
+            yield _convert_to_uint8(frames, normalizers, host_buffer)
     else:
         decoded_video = video_decoder(latent, generator=generator)
-        yield convert_to_uint8(decoded_video)
+        yield _convert_to_uint8(decoded_video, ())
+
+
+def decode_video_preview(
+    latent: torch.Tensor,
+    video_decoder: VideoDecoder,
+    num_latent_frames: int | None = 1,
+    region: tuple[slice, slice] | None = None,
+    look_ahead_in_latents: int | None = None,
+    generator: torch.Generator | None = None,
+) -> torch.Tensor:
+    """
+    Decode a preview of a video latent, see :meth:`VideoDecoder.decode_preview`.
+    Args:
+        latent: Tensor [c, f, h, w]
+        video_decoder: Decoder module.
+        num_latent_frames: Number of leading latent frames to decode, or None for all of them.
+        region: Rows and columns of the latent to decode, or None for the whole frame.
+        look_ahead_in_latents: Latent frames decoded past the requested ones for an approximate preview, or None
+            for an exact one, which for the default decoder costs about a full decode of short clips.
+        generator: Optional random generator for deterministic decoding.
+    Returns:
+        Decoded frames [f, h, w, c], uint8 in [0, 255], on the host.
+    """
+    decoded_video = video_decoder.decode_preview(
+        latent, num_latent_frames, region, look_ahead_in_latents, generator=generator
+    )
+    return _convert_to_uint8(decoded_video, ())
+
+
+def _convert_to_uint8(
+    frames: torch.Tensor, normalizers: tuple[torch.Tensor, ...], host_buffer: "_HostFrameBuffer | None" = None
+) -> torch.Tensor:
+    """
+    Convert decoded frames (1, C, F, H, W) in [-1, 1] to uint8 frames (F, H, W, C) on the host.
+    The blend normalization and the mapping to [0, 255] are computed in place on one float32 copy of the chunk:
+    bfloat16 cannot hold the fractions of values above 128 and would round them before the quantization truncates
+    them. The chunk is then quantized and permuted to channels-last in a single copy, so only uint8 values are
+    transferred from the device, into ``host_buffer`` when given. The operations are those of
+    ``((frames + 1) / 2).clamp(0, 1) * 255`` followed by ``.to(torch.uint8)``, in the same order.
+    """
+    chunk = frames[0].to(dtype=torch.float32, copy=True)
+    for normalizer in normalizers:
+        chunk.mul_(normalizer[0])
+    chunk.add_(1.0).div_(2.0).clamp_(0.0, 1.0).mul_(255.0)
+    quantized = torch.empty((*chunk.shape[1:], chunk.shape[0]), dtype=torch.uint8, device=chunk.device)
+    quantized.copy_(chunk.permute(1, 2, 3, 0))
+    del chunk
+    if quantized.device.type != "cuda":
+        return quantized
+    if host_buffer is None:
+        return torch.empty(quantized.shape, dtype=torch.uint8, pin_memory=True).copy_(quantized)
+    return host_buffer.copy(quantized)
+
+
+class _HostFrameBuffer:
+    """
+    Pinned host buffer that the uint8 chunks of one :func:`decode_video` call are copied into. It is allocated once,
+    for the largest chunk, and every chunk is a view of it, so a chunk is overwritten by the next one.
+    """
+
+    def __init__(self) -> None:
+        self._buffer: torch.Tensor | None = None
+
+    def copy(self, frames: torch.Tensor) -> torch.Tensor:
+        if self._buffer is None or self._buffer.numel() < frames.numel():
+            self._buffer = torch.empty(frames.numel(), dtype=torch.uint8, pin_memory=True)
+        return self._buffer[: frames.numel()].view(frames.shape).copy_(frames)
 
 
-def get_video_chunks_number(num_frames: int, tiling_config: TilingConfig | None = None) -> int:
+def get_video_chunks_number(num_frames: int, tiling_config: TilingConfig | None = None) -> int | None:
     """
     Get the number of video chunks for a given number of frames and tiling configuration.
     Args:
         num_frames: Number of frames in the video.
         tiling_config: Tiling configuration.
     Returns:
-        Number of video chunks.
+        Number of video chunks, or None for :meth:`TilingConfig.auto`, whose tiles are only known once planned.
     """
+    if tiling_config is not None and tiling_config.automatic:
+        return None
     if not tiling_config or not tiling_config.temporal_config:
         return 1
     cfg = tiling_config.temporal_config
@@ -13,6 +13,8 @@ from ltx_core.text_encoders.gemma.encoders.encoder_configurator import (
     EMBEDDINGS_PROCESSOR_KEY_OPS,
     GEMMA_LLM_KEY_OPS,
     GEMMA_MODEL_OPS,
+    GEMMA_TEXT_ONLY_KEY_OPS,
+    GEMMA_TEXT_ONLY_MODEL_OPS,
     VIDEO_ONLY_EMBEDDINGS_PROCESSOR_KEY_OPS,
     EmbeddingsProcessorConfigurator,
     GemmaTextEncoderConfigurator,
@@ -22,6 +24,8 @@ __all__ = [
     "EMBEDDINGS_PROCESSOR_KEY_OPS",
     "GEMMA_LLM_KEY_OPS",
     "GEMMA_MODEL_OPS",
+    "GEMMA_TEXT_ONLY_KEY_OPS",
+    "GEMMA_TEXT_ONLY_MODEL_OPS",
     "VIDEO_ONLY_EMBEDDINGS_PROCESSOR_KEY_OPS",
     "EmbeddingsProcessor",
     "EmbeddingsProcessorConfigurator",
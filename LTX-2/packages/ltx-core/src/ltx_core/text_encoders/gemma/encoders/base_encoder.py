@@ -1,25 +1,31 @@
 import functools
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import torch
-from transformers import AutoImageProcessor, Gemma3ForConditionalGeneration, Gemma3Processor
 
 from ltx_core.loader.module_ops import ModuleOps
 from ltx_core.text_encoders.gemma.tokenizer import LTXVGemmaTokenizer
 from ltx_core.utils import find_matching_file
 
+if TYPE_CHECKING:
+    # transformers is only imported once a text encoder is built
+    from transformers import Gemma3ForConditionalGeneration, Gemma3Processor
+
 
 class GemmaTextEncoder(torch.nn.Module):
     """Pure Gemma text encoder — runs the LLM and returns raw hidden states.
-    Prompt enhancement (generate) is also supported since the full
-    Gemma3ForConditionalGeneration model (including lm_head) is loaded.
+    Prompt enhancement (generate) is also supported when the full
+    Gemma3ForConditionalGeneration model (including lm_head) is loaded. The text-only
+    variant (see ``GEMMA_TEXT_ONLY_MODEL_OPS``) has no vision tower, lm_head or processor
+    and can only encode.
     """
 
     def __init__(
         self,
-        model: Gemma3ForConditionalGeneration | None = None,
+        model: "Gemma3ForConditionalGeneration | None" = None,
         tokenizer: LTXVGemmaTokenizer | None = None,
-        processor: Gemma3Processor | None = None,
+        processor: "Gemma3Processor | None" = None,
         dtype: torch.dtype = torch.bfloat16,
     ):
         super().__init__()
@@ -55,6 +61,8 @@ class GemmaTextEncoder(torch.nn.Module):
         max_new_tokens: int = 512,
         seed: int = 10,
     ) -> str:
+        if self.model.lm_head is None or self.processor is None:
+            raise ValueError("Prompt enhancement requires the full Gemma model, this text encoder is text-only")
         text = self.processor.tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
 
         model_inputs = self.processor(
@@ -174,15 +182,18 @@ def _pad_inputs_for_attention_alignment(
     return model_inputs
 
 
-def module_ops_from_gemma_root(gemma_root: str) -> tuple[ModuleOps, ...]:
+def module_ops_from_gemma_root(gemma_root: str, text_only: bool = False) -> tuple[ModuleOps, ...]:
+    """Module ops that load the tokenizer and, unless ``text_only``, the image processor used for enhancement."""
     tokenizer_root = str(find_matching_file(gemma_root, "tokenizer.model").parent)
-    processor_root = str(find_matching_file(gemma_root, "preprocessor_config.json").parent)
 
     def load_tokenizer(module: GemmaTextEncoder) -> GemmaTextEncoder:
         module.tokenizer = LTXVGemmaTokenizer(tokenizer_root, 1024)
         return module
 
     def load_processor(module: GemmaTextEncoder) -> GemmaTextEncoder:
+        from transformers import AutoImageProcessor, Gemma3Processor  # noqa: PLC0415
+
+        processor_root = str(find_matching_file(gemma_root, "preprocessor_config.json").parent)
         image_processor = AutoImageProcessor.from_pretrained(processor_root, local_files_only=True)
         if not module.tokenizer:
             raise ValueError("Tokenizer model operation must be performed before processor model operation")
@@ -199,4 +210,6 @@ def module_ops_from_gemma_root(gemma_root: str) -> tuple[ModuleOps, ...]:
         matcher=lambda module: isinstance(module, GemmaTextEncoder) and module.processor is None,
         mutator=load_processor,
     )
+    if text_only:
+        return (tokenizer_load_ops,)
     return (tokenizer_load_ops, processor_load_ops)
@@ -1,7 +1,4 @@
 import torch
-from transformers import Gemma3Config
-from transformers.modeling_rope_utils import ROPE_INIT_FUNCTIONS
-from transformers.models.gemma3 import Gemma3ForConditionalGeneration
 
 from ltx_core.loader import KeyValueOperationResult
 from ltx_core.loader.module_ops import ModuleOps
@@ -23,6 +20,8 @@ from ltx_core.text_encoders.gemma.feature_extractor import (
 class GemmaTextEncoderConfigurator(ModelConfigurator[GemmaTextEncoder]):
     @classmethod
     def from_config(cls, config: dict) -> GemmaTextEncoder:  # noqa: ARG003
+        from transformers import Gemma3Config, Gemma3ForConditionalGeneration  # noqa: PLC0415
+
         gemma_config = Gemma3Config.from_dict(GEMMA3_CONFIG_FOR_LTX.to_dict())
         with torch.device("meta"):
             model = Gemma3ForConditionalGeneration(gemma_config)
@@ -121,6 +120,13 @@ GEMMA_LLM_KEY_OPS = (
     )
 )
 
+# Language model only: vision tower, multi-modal projector and lm_head tensors are not loaded at all
+GEMMA_TEXT_ONLY_KEY_OPS = (
+    SDOps("GEMMA_TEXT_ONLY_KEY_OPS")
+    .with_matching(prefix="language_model.model.")
+    .with_replacement("language_model.model.", "model.model.language_model.")
+)
+
 EMBEDDINGS_PROCESSOR_KEY_OPS = (
     SDOps("EMBEDDINGS_PROCESSOR_KEY_OPS")
     # 1. Map the feature extractor (V1: aggregate_embed inside feature_extractor)
@@ -153,6 +159,8 @@ VIDEO_ONLY_EMBEDDINGS_PROCESSOR_KEY_OPS = (
 
 
 def create_and_populate(module: GemmaTextEncoder) -> GemmaTextEncoder:
+    from transformers.modeling_rope_utils import ROPE_INIT_FUNCTIONS  # noqa: PLC0415
+
     model = module.model
     v_model = model.model.vision_tower.vision_model
     l_model = model.model.language_model
@@ -174,8 +182,30 @@ def create_and_populate(module: GemmaTextEncoder) -> GemmaTextEncoder:
     return module
 
 
+def strip_vision_and_lm_head(module: GemmaTextEncoder) -> GemmaTextEncoder:
+    model = module.model
+    model.model.vision_tower = None
+    model.model.multi_modal_projector = None
+    model.lm_head = None
+    return module
+
+
+def _holds_gemma_model(module: torch.nn.Module) -> bool:
+    # transformers is imported here rather than at module level, so importing ltx_core stays fast
+    from transformers import Gemma3ForConditionalGeneration  # noqa: PLC0415
+
+    return hasattr(module, "model") and isinstance(module.model, Gemma3ForConditionalGeneration)
+
+
 GEMMA_MODEL_OPS = ModuleOps(
     name="GemmaModel",
-    matcher=lambda module: hasattr(module, "model") and isinstance(module.model, Gemma3ForConditionalGeneration),
+    matcher=_holds_gemma_model,
     mutator=create_and_populate,
 )
+
+# Applied after GEMMA_MODEL_OPS, together with GEMMA_TEXT_ONLY_KEY_OPS, for encoding without prompt enhancement
+GEMMA_TEXT_ONLY_MODEL_OPS = ModuleOps(
+    name="GemmaTextOnly",
+    matcher=_holds_gemma_model,
+    mutator=strip_vision_and_lm_head,
+)
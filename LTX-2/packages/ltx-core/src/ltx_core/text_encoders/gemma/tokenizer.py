@@ -1,6 +1,3 @@
-from transformers import AutoTokenizer
-
-
 class LTXVGemmaTokenizer:
     """
     Tokenizer wrapper for Gemma models compatible with LTXV processes.
@@ -15,6 +12,8 @@ class LTXVGemmaTokenizer:
             tokenizer_path (str): Path to the pretrained tokenizer files or model directory.
             max_length (int, optional): Max sequence length for encoding. Defaults to 256.
         """
+        from transformers import AutoTokenizer  # noqa: PLC0415
+
         self.tokenizer = AutoTokenizer.from_pretrained(
             tokenizer_path, local_files_only=True, model_max_length=max_length
         )
@@ -180,6 +180,76 @@ class Audio:
         return replace(self, waveform=self.waveform.to(**kwargs))
 
 
+@dataclass(frozen=True)
+class BlockAttentionMask:
+    """
+    Compact self-attention mask for a sequence of noisy tokens followed by conditioning token groups.
+    Describes the same ``(B, T, T)`` matrix that :func:`~ltx_core.conditioning.mask_utils.build_attention_mask`
+    produces, in ``O(T)`` memory:
+      - base tokens ``[0, num_base_tokens)`` (the noisy tokens plus any conditioning tokens appended
+        before masking started) attend to each other with weight 1;
+      - each conditioning group attends to itself with weight 1;
+      - a group and the noisy tokens ``[0, num_noisy_tokens)`` attend to each other with the group's
+        per-token cross weight;
+      - every other pair (different groups, groups and non-noisy base tokens) is masked with 0.
+    Attributes:
+        num_noisy_tokens: Number of noisy tokens at the start of the sequence.
+        num_base_tokens: Number of fully connected tokens at the start of the sequence.
+        group_sizes: Number of tokens of each conditioning group, in sequence order after the base tokens.
+        cross_weights: Per-group ``(B, M)`` tensors in ``[0, 1]`` weighting attention between the group and
+            the noisy tokens.
+    """
+
+    num_noisy_tokens: int
+    num_base_tokens: int
+    group_sizes: tuple[int, ...] = ()
+    cross_weights: tuple[torch.Tensor, ...] = ()
+
+    @property
+    def num_tokens(self) -> int:
+        return self.num_base_tokens + sum(self.group_sizes)
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        batch_size = self.cross_weights[0].shape[0] if self.cross_weights else 1
+        return (batch_size, self.num_tokens, self.num_tokens)
+
+    def with_group(self, cross_weights: torch.Tensor) -> "BlockAttentionMask":
+        """Append a conditioning group whose ``(B, M)`` cross weights also define its size."""
+        return replace(
+            self,
+            group_sizes=(*self.group_sizes, cross_weights.shape[1]),
+            cross_weights=(*self.cross_weights, cross_weights),
+        )
+
+    def group_ids(self, device: torch.device) -> torch.Tensor:
+        """Per-token group index of shape ``(T,)``: 0 for base tokens, ``g`` for the g-th conditioning group."""
+        sizes = torch.tensor([self.num_base_tokens, *self.group_sizes], device=device)
+        return torch.repeat_interleave(torch.arange(len(sizes), device=device, dtype=torch.int32), sizes)
+
+    def token_weights(self, device: torch.device, dtype: torch.dtype) -> torch.Tensor:
+        """Per-token cross weights of shape ``(B, T)``; base tokens get 1."""
+        batch_size = self.shape[0]
+        base = torch.ones(batch_size, self.num_base_tokens, device=device, dtype=dtype)
+        groups = [w.to(device=device, dtype=dtype).expand(batch_size, -1) for w in self.cross_weights]
+        return torch.cat([base, *groups], dim=1)
+
+    def to_dense(self, device: torch.device, dtype: torch.dtype) -> torch.Tensor:
+        """Materialize the ``(B, T, T)`` mask. Only needed by attention backends without structured mask support."""
+        group_ids = self.group_ids(device)
+        weights = self.token_weights(device, dtype)
+        is_noisy = torch.arange(self.num_tokens, device=device) < self.num_noisy_tokens
+        in_group = group_ids > 0
+
+        same_group = (group_ids[:, None] == group_ids[None, :]).to(dtype)
+        noisy_to_group = (is_noisy[:, None] & in_group[None, :]).to(dtype) * weights[:, None, :]
+        group_to_noisy = (in_group[:, None] & is_noisy[None, :]).to(dtype) * weights[:, :, None]
+        return same_group + noisy_to_group + group_to_noisy
+
+    def clone(self) -> "BlockAttentionMask":
+        return replace(self, cross_weights=tuple(w.clone() for w in self.cross_weights))
+
+
 @dataclass(frozen=True)
 class LatentState:
     """
@@ -190,14 +260,15 @@ class LatentState:
         positions: Positional indices for each latent element, used for positional embeddings.
         clean_latent: Initial state of the latent before denoising, may include conditioning latents.
         attention_mask: Optional 2D self-attention mask of shape (B, T, T). Values in [0, 1] where 1 = full attention,
-            0 = no attention. None means full attention everywhere. Built incrementally by conditioning items.
+            0 = no attention. None means full attention everywhere. Built incrementally by conditioning items,
+            which produce the compact :class:`BlockAttentionMask` form.
     """
 
     latent: torch.Tensor
     denoise_mask: torch.Tensor
     positions: torch.Tensor
     clean_latent: torch.Tensor
-    attention_mask: torch.Tensor | None = None
+    attention_mask: torch.Tensor | BlockAttentionMask | None = None
 
     def clone(self) -> "LatentState":
         return LatentState(
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Any
 
@@ -60,3 +61,14 @@ def find_matching_file(root_path: str, pattern: str) -> Path:
     if not matches:
         raise FileNotFoundError(f"No files matching pattern '{pattern}' found under {root_path}")
     return matches[0]
+
+
+def get_cache_dir(*subdirs: str) -> Path:
+    """
+    Return (and create) a directory for on-disk caches shared across processes.
+    The root is ``$LTX_CACHE_DIR`` when set, otherwise ``~/.cache/ltx``.
+    """
+    root = os.environ.get("LTX_CACHE_DIR") or Path.home() / ".cache" / "ltx"
+    path = Path(root).joinpath(*subdirs)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
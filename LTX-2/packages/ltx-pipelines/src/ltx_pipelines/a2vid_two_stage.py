@@ -8,8 +8,9 @@ from ltx_core.components.guiders import MultiModalGuider, MultiModalGuiderParams
 from ltx_core.components.noisers import GaussianNoiser
 from ltx_core.components.protocols import DiffusionStepProtocol
 from ltx_core.components.schedulers import LTX2Scheduler
-from ltx_core.loader import LoraPathStrengthAndSDOps
+from ltx_core.loader import LoraPathStrengthAndSDOps, Registry, shared_registry
 from ltx_core.model.audio_vae import encode_audio as vae_encode_audio
+from ltx_core.model.transformer import CompileConfig
 from ltx_core.model.upsampler import upsample_video
 from ltx_core.model.video_vae import TilingConfig, get_video_chunks_number
 from ltx_core.model.video_vae import decode_video as vae_decode_video
@@ -30,12 +31,10 @@ from ltx_pipelines.utils.helpers import (
     multi_modal_guider_denoising_func,
     simple_denoising_func,
 )
-from ltx_pipelines.utils.media_io import decode_audio_from_file, encode_video
+from ltx_pipelines.utils.media_io import decode_audio_from_file, encode_video, image_decode_cache
 from ltx_pipelines.utils.samplers import euler_denoising_loop
 from ltx_pipelines.utils.types import PipelineComponents
 
-device = get_device()
-
 
 class A2VidPipelineTwoStage:
     """
@@ -52,9 +51,13 @@ class A2VidPipelineTwoStage:
         spatial_upsampler_path: str,
         gemma_root: str,
         loras: list[LoraPathStrengthAndSDOps],
-        device: torch.device = device,
+        device: torch.device | None = None,
         quantization: QuantizationPolicy | None = None,
+        compile_config: CompileConfig | None = None,
+        skip_frozen_tokens: bool = False,
+        registry: Registry | None = None,
     ):
+        device = device if device is not None else get_device()
         self.device = device
         self.dtype = torch.bfloat16
 
@@ -66,6 +69,9 @@ class A2VidPipelineTwoStage:
             spatial_upsampler_path=spatial_upsampler_path,
             loras=loras,
             quantization=quantization,
+            compile_config=compile_config,
+            skip_frozen_tokens=skip_frozen_tokens,
+            registry=registry,
         )
 
         self.stage_2_model_ledger = self.stage_1_model_ledger.with_additional_loras(
@@ -77,6 +83,7 @@ class A2VidPipelineTwoStage:
             device=device,
         )
 
+    @image_decode_cache()
     def __call__(  # noqa: PLR0913
         self,
         prompt: str,
@@ -126,17 +133,19 @@ class A2VidPipelineTwoStage:
             height=height // 2,
             fps=frame_rate,
         )
-        video_encoder = self.stage_1_model_ledger.video_encoder()
-        stage_1_conditionings = combined_image_conditionings(
-            images=images,
-            height=stage_1_output_shape.height,
-            width=stage_1_output_shape.width,
-            video_encoder=video_encoder,
-            dtype=dtype,
-            device=self.device,
-        )
+        stage_1_conditionings = []
+        if images:
+            video_encoder = self.stage_1_model_ledger.video_encoder()
+            stage_1_conditionings = combined_image_conditionings(
+                images=images,
+                height=stage_1_output_shape.height,
+                width=stage_1_output_shape.width,
+                video_encoder=video_encoder,
+                dtype=dtype,
+                device=self.device,
+            )
+            del video_encoder
         torch.cuda.synchronize()
-        del video_encoder
         cleanup_memory()
 
         transformer = self.stage_1_model_ledger.transformer()
@@ -182,23 +191,27 @@ class A2VidPipelineTwoStage:
         cleanup_memory()
 
         # Stage 2: Upsample and refine the video at higher resolution with distilled LoRA.
-        video_encoder = self.stage_1_model_ledger.video_encoder()
         upscaled_video_latent = upsample_video(
             latent=video_state.latent[:1],
-            video_encoder=video_encoder,
+            per_channel_statistics=self.stage_1_model_ledger.video_latent_statistics(),
             upsampler=self.stage_2_model_ledger.spatial_upsampler(),
+            tiling_config=tiling_config,
         )
 
         stage_2_output_shape = VideoPixelShape(batch=1, frames=num_frames, width=width, height=height, fps=frame_rate)
-        stage_2_conditionings = combined_image_conditionings(
-            images=images,
-            height=stage_2_output_shape.height,
-            width=stage_2_output_shape.width,
-            video_encoder=video_encoder,
-            dtype=dtype,
-            device=self.device,
-        )
-        del video_encoder
+        stage_2_conditionings = []
+        if images:
+            # The full video encoder is only needed to encode the image conditionings
+            video_encoder = self.stage_1_model_ledger.video_encoder()
+            stage_2_conditionings = combined_image_conditionings(
+                images=images,
+                height=stage_2_output_shape.height,
+                width=stage_2_output_shape.width,
+                video_encoder=video_encoder,
+                dtype=dtype,
+                device=self.device,
+            )
+            del video_encoder
         torch.cuda.synchronize()
         cleanup_memory()
 
@@ -280,8 +293,11 @@ def main() -> None:
         gemma_root=args.gemma_root,
         loras=tuple(args.lora) if args.lora else (),
         quantization=args.quantization,
+        compile_config=args.compile_config,
+        skip_frozen_tokens=args.skip_frozen_tokens,
+        registry=shared_registry() if args.shared_registry else None,
     )
-    tiling_config = TilingConfig.default()
+    tiling_config = TilingConfig.auto()
     video_chunks_number = get_video_chunks_number(args.num_frames, tiling_config)
     video, audio = pipeline(
         prompt=args.prompt,
@@ -0,0 +1,70 @@
+import argparse
+import logging
+from pathlib import Path
+
+import torch
+
+from ltx_core.loader import SafetensorsStateDictLoader, convert_checkpoint, converted_checkpoint_dirs
+from ltx_pipelines.utils.args import QUANTIZATION_POLICIES, QuantizationAction, resolve_path
+from ltx_pipelines.utils.model_ledger import ModelLedger
+
+DTYPES = {"bfloat16": torch.bfloat16, "float16": torch.float16, "float32": torch.float32}
+
+
+@torch.inference_mode()
+def main() -> None:
+    """CLI entry point that splits a checkpoint into load-ready per-component files."""
+    logging.getLogger().setLevel(logging.INFO)
+    parser = argparse.ArgumentParser(
+        description=(
+            "Split an LTX-2 checkpoint into per-component files with renamed keys and the target dtype "
+            "(or FP8 layout) applied. Pipelines loading the checkpoint pick the converted files up automatically."
+        )
+    )
+    parser.add_argument("--checkpoint-path", type=resolve_path, required=True, help="Path to the LTX-2 checkpoint.")
+    parser.add_argument(
+        "--dtype",
+        choices=tuple(DTYPES),
+        default="bfloat16",
+        help="Dtype the pipelines build the models in (default: bfloat16).",
+    )
+    parser.add_argument(
+        "--quantization",
+        dest="quantization",
+        action=QuantizationAction,
+        nargs="+",
+        metavar=("POLICY", "AMAX_PATH"),
+        default=None,
+        help=(
+            f"Store the transformer in the layout of a quantization policy ({', '.join(QUANTIZATION_POLICIES)}), "
+            "for pipelines run with the same --quantization."
+        ),
+    )
+    parser.add_argument(
+        "--in-cache",
+        action="store_true",
+        help=(
+            "Write to the LTX cache directory ($LTX_CACHE_DIR or ~/.cache/ltx) instead of next to the checkpoint, "
+            "e.g. when the checkpoint is on read-only storage."
+        ),
+    )
+    args = parser.parse_args()
+
+    ledger = ModelLedger(
+        dtype=DTYPES[args.dtype],
+        device=torch.device("cpu"),
+        checkpoint_path=args.checkpoint_path,
+        quantization=args.quantization,
+    )
+    output_dirs = converted_checkpoint_dirs(args.checkpoint_path)
+    index_path = convert_checkpoint(
+        args.checkpoint_path,
+        ledger.checkpoint_components(),
+        loader=SafetensorsStateDictLoader(use_converted=False),
+        output_dir=output_dirs[1] if args.in_cache else output_dirs[0],
+    )
+    logging.info(f"Converted checkpoint written to {Path(index_path).parent}")
+
+
+if __name__ == "__main__":
+    main()
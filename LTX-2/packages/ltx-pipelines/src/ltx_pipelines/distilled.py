@@ -6,8 +6,9 @@ import torch
 from ltx_core.components.diffusion_steps import EulerDiffusionStep
 from ltx_core.components.noisers import GaussianNoiser
 from ltx_core.components.protocols import DiffusionStepProtocol
-from ltx_core.loader import LoraPathStrengthAndSDOps
-from ltx_core.model.audio_vae import decode_audio as vae_decode_audio
+from ltx_core.loader import LoraPathStrengthAndSDOps, Registry, shared_registry
+from ltx_core.model.audio_vae import decode_audio_chunks as vae_decode_audio_chunks
+from ltx_core.model.transformer import CompileConfig
 from ltx_core.model.upsampler import upsample_video
 from ltx_core.model.video_vae import TilingConfig, get_video_chunks_number
 from ltx_core.model.video_vae import decode_video as vae_decode_video
@@ -33,11 +34,9 @@ from ltx_pipelines.utils.helpers import (
     get_device,
     simple_denoising_func,
 )
-from ltx_pipelines.utils.media_io import encode_video
+from ltx_pipelines.utils.media_io import encode_video, image_decode_cache
 from ltx_pipelines.utils.types import PipelineComponents
 
-device = get_device()
-
 
 class DistilledPipeline:
     """
@@ -52,9 +51,13 @@ class DistilledPipeline:
         gemma_root: str,
         spatial_upsampler_path: str,
         loras: list[LoraPathStrengthAndSDOps],
-        device: torch.device = device,
+        device: torch.device | None = None,
         quantization: QuantizationPolicy | None = None,
+        compile_config: CompileConfig | None = None,
+        skip_frozen_tokens: bool = False,
+        registry: Registry | None = None,
     ):
+        device = device if device is not None else get_device()
         self.device = device
         self.dtype = torch.bfloat16
 
@@ -66,6 +69,9 @@ class DistilledPipeline:
             gemma_root_path=gemma_root,
             loras=loras,
             quantization=quantization,
+            compile_config=compile_config,
+            skip_frozen_tokens=skip_frozen_tokens,
+            registry=registry,
         )
 
         self.pipeline_components = PipelineComponents(
@@ -73,6 +79,7 @@ class DistilledPipeline:
             device=device,
         )
 
+    @image_decode_cache()
     def __call__(
         self,
         prompt: str,
@@ -84,7 +91,7 @@ class DistilledPipeline:
         images: list[ImageConditioningInput],
         tiling_config: TilingConfig | None = None,
         enhance_prompt: bool = False,
-    ) -> tuple[Iterator[torch.Tensor], Audio]:
+    ) -> tuple[Iterator[torch.Tensor], Iterator[Audio]]:
         assert_resolution(height=height, width=width, is_two_stage=True)
 
         generator = torch.Generator(device=self.device).manual_seed(seed)
@@ -101,7 +108,38 @@ class DistilledPipeline:
         video_context, audio_context = ctx_p.video_encoding, ctx_p.audio_encoding
 
         # Stage 1: Initial low resolution video generation.
-        video_encoder = self.model_ledger.video_encoder()
+        stage_1_output_shape = VideoPixelShape(
+            batch=1,
+            frames=num_frames,
+            width=width // 2,
+            height=height // 2,
+            fps=frame_rate,
+        )
+        stage_2_output_shape = VideoPixelShape(batch=1, frames=num_frames, width=width, height=height, fps=frame_rate)
+        stage_1_conditionings = []
+        stage_2_conditionings = []
+        if images:
+            # The full video encoder is only needed to encode the image conditionings of both stages
+            video_encoder = self.model_ledger.video_encoder()
+            stage_1_conditionings = combined_image_conditionings(
+                images=images,
+                height=stage_1_output_shape.height,
+                width=stage_1_output_shape.width,
+                video_encoder=video_encoder,
+                dtype=dtype,
+                device=self.device,
+            )
+            stage_2_conditionings = combined_image_conditionings(
+                images=images,
+                height=stage_2_output_shape.height,
+                width=stage_2_output_shape.width,
+                video_encoder=video_encoder,
+                dtype=dtype,
+                device=self.device,
+            )
+            del video_encoder
+            cleanup_memory()
+
         transformer = self.model_ledger.transformer()
         stage_1_sigmas = torch.Tensor(DISTILLED_SIGMA_VALUES).to(self.device)
 
@@ -120,22 +158,6 @@ class DistilledPipeline:
                 ),
             )
 
-        stage_1_output_shape = VideoPixelShape(
-            batch=1,
-            frames=num_frames,
-            width=width // 2,
-            height=height // 2,
-            fps=frame_rate,
-        )
-        stage_1_conditionings = combined_image_conditionings(
-            images=images,
-            height=stage_1_output_shape.height,
-            width=stage_1_output_shape.width,
-            video_encoder=video_encoder,
-            dtype=dtype,
-            device=self.device,
-        )
-
         video_state, audio_state = denoise_audio_video(
             output_shape=stage_1_output_shape,
             conditionings=stage_1_conditionings,
@@ -150,22 +172,16 @@ class DistilledPipeline:
 
         # Stage 2: Upsample and refine the video at higher resolution with distilled LORA.
         upscaled_video_latent = upsample_video(
-            latent=video_state.latent[:1], video_encoder=video_encoder, upsampler=self.model_ledger.spatial_upsampler()
+            latent=video_state.latent[:1],
+            per_channel_statistics=self.model_ledger.video_latent_statistics(),
+            upsampler=self.model_ledger.spatial_upsampler(),
+            tiling_config=tiling_config,
         )
 
         torch.cuda.synchronize()
         cleanup_memory()
 
         stage_2_sigmas = torch.Tensor(STAGE_2_DISTILLED_SIGMA_VALUES).to(self.device)
-        stage_2_output_shape = VideoPixelShape(batch=1, frames=num_frames, width=width, height=height, fps=frame_rate)
-        stage_2_conditionings = combined_image_conditionings(
-            images=images,
-            height=stage_2_output_shape.height,
-            width=stage_2_output_shape.width,
-            video_encoder=video_encoder,
-            dtype=dtype,
-            device=self.device,
-        )
         video_state, audio_state = denoise_audio_video(
             output_shape=stage_2_output_shape,
             conditionings=stage_2_conditionings,
@@ -183,13 +199,12 @@ class DistilledPipeline:
 
         torch.cuda.synchronize()
         del transformer
-        del video_encoder
         cleanup_memory()
 
         decoded_video = vae_decode_video(
             video_state.latent, self.model_ledger.video_decoder(), tiling_config, generator
         )
-        decoded_audio = vae_decode_audio(
+        decoded_audio = vae_decode_audio_chunks(
             audio_state.latent, self.model_ledger.audio_decoder(), self.model_ledger.vocoder()
         )
         return decoded_video, decoded_audio
@@ -208,8 +223,11 @@ def main() -> None:
         gemma_root=args.gemma_root,
         loras=tuple(args.lora) if args.lora else (),
         quantization=args.quantization,
+        compile_config=args.compile_config,
+        skip_frozen_tokens=args.skip_frozen_tokens,
+        registry=shared_registry() if args.shared_registry else None,
     )
-    tiling_config = TilingConfig.default()
+    tiling_config = TilingConfig.auto()
     video_chunks_number = get_video_chunks_number(args.num_frames, tiling_config)
     video, audio = pipeline(
         prompt=args.prompt,
@@ -13,8 +13,9 @@ from ltx_core.conditioning import (
     ConditioningItemAttentionStrengthWrapper,
     VideoConditionByReferenceLatent,
 )
-from ltx_core.loader import LoraPathStrengthAndSDOps
-from ltx_core.model.audio_vae import decode_audio as vae_decode_audio
+from ltx_core.loader import LoraPathStrengthAndSDOps, Registry, shared_registry
+from ltx_core.model.audio_vae import decode_audio_chunks as vae_decode_audio_chunks
+from ltx_core.model.transformer import CompileConfig
 from ltx_core.model.upsampler import upsample_video
 from ltx_core.model.video_vae import TilingConfig, VideoEncoder, get_video_chunks_number
 from ltx_core.model.video_vae import decode_video as vae_decode_video
@@ -43,11 +44,9 @@ from ltx_pipelines.utils.constants import (
     STAGE_2_DISTILLED_SIGMA_VALUES,
     detect_params,
 )
-from ltx_pipelines.utils.media_io import encode_video, load_video_conditioning
+from ltx_pipelines.utils.media_io import encode_video, image_decode_cache, load_video_conditioning
 from ltx_pipelines.utils.types import PipelineComponents
 
-device = get_device()
-
 
 class ICLoraPipeline:
     """
@@ -66,9 +65,13 @@ class ICLoraPipeline:
         spatial_upsampler_path: str,
         gemma_root: str,
         loras: list[LoraPathStrengthAndSDOps],
-        device: torch.device = device,
+        device: torch.device | None = None,
         quantization: QuantizationPolicy | None = None,
+        compile_config: CompileConfig | None = None,
+        skip_frozen_tokens: bool = False,
+        registry: Registry | None = None,
     ):
+        device = device if device is not None else get_device()
         self.dtype = torch.bfloat16
         self.stage_1_model_ledger = ModelLedger(
             dtype=self.dtype,
@@ -78,6 +81,9 @@ class ICLoraPipeline:
             gemma_root_path=gemma_root,
             loras=loras,
             quantization=quantization,
+            compile_config=compile_config,
+            skip_frozen_tokens=skip_frozen_tokens,
+            registry=registry,
         )
         self.stage_2_model_ledger = ModelLedger(
             dtype=self.dtype,
@@ -87,6 +93,9 @@ class ICLoraPipeline:
             gemma_root_path=gemma_root,
             loras=[],
             quantization=quantization,
+            compile_config=compile_config,
+            skip_frozen_tokens=skip_frozen_tokens,
+            registry=registry,
         )
         self.pipeline_components = PipelineComponents(
             dtype=self.dtype,
@@ -109,6 +118,7 @@ class ICLoraPipeline:
                     )
                 self.reference_downscale_factor = scale
 
+    @image_decode_cache()
     def __call__(  # noqa: PLR0913
         self,
         prompt: str,
@@ -124,7 +134,7 @@ class ICLoraPipeline:
         conditioning_attention_strength: float = 1.0,
         skip_stage_2: bool = False,
         conditioning_attention_mask: torch.Tensor | None = None,
-    ) -> tuple[Iterator[torch.Tensor], Audio]:
+    ) -> tuple[Iterator[torch.Tensor], Iterator[Audio]]:
         """
         Generate video with IC-LoRA conditioning.
         Args:
@@ -137,7 +147,7 @@ class ICLoraPipeline:
             images: List of (path, frame_idx, strength) tuples for image conditioning.
             video_conditioning: List of (path, strength) tuples for IC-LoRA video conditioning.
             enhance_prompt: Whether to enhance the prompt using the text encoder.
-            tiling_config: Optional tiling configuration for VAE decoding.
+            tiling_config: Optional tiling configuration for the latent upsampler and VAE decoding.
             conditioning_attention_strength: Scale factor for IC-LoRA conditioning attention.
                 Controls how strongly the conditioning video influences the output.
                 0.0 = ignore conditioning, 1.0 = full conditioning influence. Default 1.0.
@@ -198,6 +208,8 @@ class ICLoraPipeline:
             conditioning_attention_strength=conditioning_attention_strength,
             conditioning_attention_mask=conditioning_attention_mask,
         )
+        del video_encoder
+        cleanup_memory()
 
         transformer = self.stage_1_model_ledger.transformer()
         stage_1_sigmas = torch.Tensor(DISTILLED_SIGMA_VALUES).to(self.device)
@@ -239,20 +251,34 @@ class ICLoraPipeline:
             decoded_video = vae_decode_video(
                 video_state.latent, self.stage_1_model_ledger.video_decoder(), tiling_config, generator
             )
-            decoded_audio = vae_decode_audio(
+            decoded_audio = vae_decode_audio_chunks(
                 audio_state.latent, self.stage_1_model_ledger.audio_decoder(), self.stage_1_model_ledger.vocoder()
             )
-            del video_encoder
-            cleanup_memory()
             return decoded_video, decoded_audio
 
         # Stage 2: Upsample and refine the video at higher resolution with distilled LORA.
         upscaled_video_latent = upsample_video(
             latent=video_state.latent[:1],
-            video_encoder=video_encoder,
+            per_channel_statistics=self.stage_1_model_ledger.video_latent_statistics(),
             upsampler=self.stage_2_model_ledger.spatial_upsampler(),
+            tiling_config=tiling_config,
         )
 
+        stage_2_output_shape = VideoPixelShape(batch=1, frames=num_frames, width=width, height=height, fps=frame_rate)
+        stage_2_conditionings = []
+        if images:
+            # The full video encoder is only needed to encode the image conditionings
+            video_encoder = self.stage_1_model_ledger.video_encoder()
+            stage_2_conditionings = combined_image_conditionings(
+                images=images,
+                height=stage_2_output_shape.height,
+                width=stage_2_output_shape.width,
+                video_encoder=video_encoder,
+                dtype=self.dtype,
+                device=self.device,
+            )
+            del video_encoder
+
         torch.cuda.synchronize()
         cleanup_memory()
 
@@ -274,16 +300,6 @@ class ICLoraPipeline:
                 ),
             )
 
-        stage_2_output_shape = VideoPixelShape(batch=1, frames=num_frames, width=width, height=height, fps=frame_rate)
-        stage_2_conditionings = combined_image_conditionings(
-            images=images,
-            height=stage_2_output_shape.height,
-            width=stage_2_output_shape.width,
-            video_encoder=video_encoder,
-            dtype=self.dtype,
-            device=self.device,
-        )
-
         video_state, audio_state = denoise_audio_video(
             output_shape=stage_2_output_shape,
             conditionings=stage_2_conditionings,
@@ -301,13 +317,12 @@ class ICLoraPipeline:
 
         torch.cuda.synchronize()
         del transformer
-        del video_encoder
         cleanup_memory()
 
         decoded_video = vae_decode_video(
             video_state.latent, self.stage_2_model_ledger.video_decoder(), tiling_config, generator
         )
-        decoded_audio = vae_decode_audio(
+        decoded_audio = vae_decode_audio_chunks(
             audio_state.latent, self.stage_2_model_ledger.audio_decoder(), self.stage_2_model_ledger.vocoder()
         )
         return decoded_video, decoded_audio
@@ -501,6 +516,7 @@ def main() -> None:
             height=args.height // 2,  # Stage 1 operates at half resolution
             width=args.width // 2,
             num_frames=args.num_frames,
+            device=get_device(),
         )
 
     pipeline = ICLoraPipeline(
@@ -509,8 +525,11 @@ def main() -> None:
         gemma_root=args.gemma_root,
         loras=tuple(args.lora) if args.lora else (),
         quantization=args.quantization,
+        compile_config=args.compile_config,
+        skip_frozen_tokens=args.skip_frozen_tokens,
+        registry=shared_registry() if args.shared_registry else None,
     )
-    tiling_config = TilingConfig.default()
+    tiling_config = TilingConfig.auto()
     video_chunks_number = get_video_chunks_number(args.num_frames, tiling_config)
     video, audio = pipeline(
         prompt=args.prompt,
@@ -541,6 +560,7 @@ def _load_mask_video(
     height: int,
     width: int,
     num_frames: int,
+    device: torch.device,
 ) -> torch.Tensor:
     """Load a mask video and return a pixel-space tensor of shape (1, 1, F, H, W).
     The mask video is loaded, resized to (height, width), converted to
@@ -550,6 +570,7 @@ def _load_mask_video(
         height: Target height in pixels.
         width: Target width in pixels.
         num_frames: Maximum number of frames to load.
+        device: Device to load the mask onto.
     Returns:
         Tensor of shape ``(1, 1, F, H, W)`` with values in ``[0, 1]``.
     """
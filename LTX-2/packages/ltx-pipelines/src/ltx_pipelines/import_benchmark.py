@@ -0,0 +1,83 @@
+import argparse
+import logging
+import subprocess
+import sys
+from typing import NamedTuple
+
+# Optional or heavy dependencies that must only be imported once a model is built or run
+DEFERRED_MODULES = ("transformers", "triton", "xformers", "flash_attn_interface", "tensorrt_llm")
+
+DEFAULT_MODULES = (
+    "ltx_pipelines.ti2vid_two_stages",
+    "ltx_pipelines.ti2vid_two_stages_hq",
+    "ltx_pipelines.ti2vid_one_stage",
+    "ltx_pipelines.distilled",
+    "ltx_pipelines.ic_lora",
+    "ltx_pipelines.keyframe_interpolation",
+    "ltx_pipelines.a2vid_two_stage",
+    "ltx_pipelines.retake",
+)
+
+
+class ImportTime(NamedTuple):
+    """One line of ``python -X importtime`` output; times are in microseconds."""
+
+    self_us: int
+    cumulative_us: int
+    module: str
+
+
+def measure_import(module: str) -> list[ImportTime]:
+    """Import ``module`` in a fresh interpreter with ``-X importtime`` and return the per-module times."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times.append(ImportTime(int(self_us), int(cumulative_us), name.strip()))
+    return times
+
+
+def check_import(module: str, max_seconds: float, top: int) -> list[str]:
+    """Measure the import of ``module`` and return the budget violations, if any."""
+    times = measure_import(module)
+    total_us = next((t.cumulative_us for t in times if t.module == module), 0)
+    logging.info(f"{module}: {total_us / 1e6:.3f} s")
+    for t in sorted(times, key=lambda t: t.self_us, reverse=True)[:top]:
+        logging.info(f"    {t.self_us / 1e3:8.1f} ms  {t.module}")
+
+    errors = []
+    if total_us > max_seconds * 1e6:
+        errors.append(f"{module} took {total_us / 1e6:.3f} s to import (budget {max_seconds:.3f} s)")
+    imported = {t.module.split(".")[0] for t in times}
+    errors.extend(f"{module} imports {name} at module load" for name in DEFERRED_MODULES if name in imported)
+    return errors
+
+
+def main() -> None:
+    """
+    Import-time regression benchmark: imports each pipeline module in a fresh interpreter and fails if
+    it exceeds the time budget or pulls in a dependency that should only load on first use.
+    """
+    logging.getLogger().setLevel(logging.INFO)
+    parser = argparse.ArgumentParser(description="Check that pipeline modules import fast (`python -X importtime`).")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="Modules to import.")
+    parser.add_argument("--max-seconds", type=float, default=5.0, help="Import time budget per module (default: 5.0).")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest modules to report (default: 10).")
+    args = parser.parse_args()
+
+    errors = [error for module in args.modules for error in check_import(module, args.max_seconds, args.top)]
+    for error in errors:
+        logging.error(error)
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
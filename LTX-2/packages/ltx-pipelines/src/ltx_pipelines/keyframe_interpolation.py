@@ -12,8 +12,9 @@ from ltx_core.components.guiders import (
 from ltx_core.components.noisers import GaussianNoiser
 from ltx_core.components.protocols import DiffusionStepProtocol
 from ltx_core.components.schedulers import LTX2Scheduler
-from ltx_core.loader import LoraPathStrengthAndSDOps
-from ltx_core.model.audio_vae import decode_audio as vae_decode_audio
+from ltx_core.loader import LoraPathStrengthAndSDOps, Registry, shared_registry
+from ltx_core.model.audio_vae import decode_audio_chunks as vae_decode_audio_chunks
+from ltx_core.model.transformer import CompileConfig
 from ltx_core.model.upsampler import upsample_video
 from ltx_core.model.video_vae import TilingConfig, get_video_chunks_number
 from ltx_core.model.video_vae import decode_video as vae_decode_video
@@ -32,12 +33,10 @@ from ltx_pipelines.utils.helpers import (
     multi_modal_guider_factory_denoising_func,
     simple_denoising_func,
 )
-from ltx_pipelines.utils.media_io import encode_video
+from ltx_pipelines.utils.media_io import encode_video, image_decode_cache
 from ltx_pipelines.utils.samplers import euler_denoising_loop
 from ltx_pipelines.utils.types import PipelineComponents
 
-device = get_device()
-
 
 class KeyframeInterpolationPipeline:
     """
@@ -56,9 +55,13 @@ class KeyframeInterpolationPipeline:
         spatial_upsampler_path: str,
         gemma_root: str,
         loras: list[LoraPathStrengthAndSDOps],
-        device: torch.device = device,
+        device: torch.device | None = None,
         quantization: QuantizationPolicy | None = None,
+        compile_config: CompileConfig | None = None,
+        skip_frozen_tokens: bool = False,
+        registry: Registry | None = None,
     ):
+        device = device if device is not None else get_device()
         self.device = device
         self.dtype = torch.bfloat16
         self.stage_1_model_ledger = ModelLedger(
@@ -69,6 +72,9 @@ class KeyframeInterpolationPipeline:
             gemma_root_path=gemma_root,
             loras=loras,
             quantization=quantization,
+            compile_config=compile_config,
+            skip_frozen_tokens=skip_frozen_tokens,
+            registry=registry,
         )
         self.stage_2_model_ledger = self.stage_1_model_ledger.with_additional_loras(
             loras=distilled_lora,
@@ -78,6 +84,7 @@ class KeyframeInterpolationPipeline:
             device=device,
         )
 
+    @image_decode_cache()
     def __call__(  # noqa: PLR0913
         self,
         prompt: str,
@@ -93,7 +100,7 @@ class KeyframeInterpolationPipeline:
         images: list[ImageConditioningInput],
         tiling_config: TilingConfig | None = None,
         enhance_prompt: bool = False,
-    ) -> tuple[Iterator[torch.Tensor], Audio]:
+    ) -> tuple[Iterator[torch.Tensor], Iterator[Audio]]:
         assert_resolution(height=height, width=width, is_two_stage=True)
 
         generator = torch.Generator(device=self.device).manual_seed(seed)
@@ -112,7 +119,28 @@ class KeyframeInterpolationPipeline:
         v_context_n, a_context_n = ctx_n.video_encoding, ctx_n.audio_encoding
 
         # Stage 1: Initial low resolution video generation.
-        video_encoder = self.stage_1_model_ledger.video_encoder()
+        stage_1_output_shape = VideoPixelShape(
+            batch=1,
+            frames=num_frames,
+            width=width // 2,
+            height=height // 2,
+            fps=frame_rate,
+        )
+        stage_1_conditionings = []
+        if images:
+            # Encode conditionings before loading the transformer to reduce peak VRAM
+            video_encoder = self.stage_1_model_ledger.video_encoder()
+            stage_1_conditionings = image_conditionings_by_adding_guiding_latent(
+                images=images,
+                height=stage_1_output_shape.height,
+                width=stage_1_output_shape.width,
+                video_encoder=video_encoder,
+                dtype=dtype,
+                device=self.device,
+            )
+            del video_encoder
+            cleanup_memory()
+
         transformer = self.stage_1_model_ledger.transformer()
         sigmas = LTX2Scheduler().execute(steps=num_inference_steps).to(dtype=torch.float32, device=self.device)
 
@@ -139,21 +167,6 @@ class KeyframeInterpolationPipeline:
                 ),
             )
 
-        stage_1_output_shape = VideoPixelShape(
-            batch=1,
-            frames=num_frames,
-            width=width // 2,
-            height=height // 2,
-            fps=frame_rate,
-        )
-        stage_1_conditionings = image_conditionings_by_adding_guiding_latent(
-            images=images,
-            height=stage_1_output_shape.height,
-            width=stage_1_output_shape.width,
-            video_encoder=video_encoder,
-            dtype=dtype,
-            device=self.device,
-        )
         video_state, audio_state = denoise_audio_video(
             output_shape=stage_1_output_shape,
             conditionings=stage_1_conditionings,
@@ -173,10 +186,26 @@ class KeyframeInterpolationPipeline:
         # Stage 2: Upsample and refine the video at higher resolution with distilled LORA.
         upscaled_video_latent = upsample_video(
             latent=video_state.latent[:1],
-            video_encoder=video_encoder,
+            per_channel_statistics=self.stage_1_model_ledger.video_latent_statistics(),
             upsampler=self.stage_2_model_ledger.spatial_upsampler(),
+            tiling_config=tiling_config,
         )
 
+        stage_2_output_shape = VideoPixelShape(batch=1, frames=num_frames, width=width, height=height, fps=frame_rate)
+        stage_2_conditionings = []
+        if images:
+            # The full video encoder is only needed to encode the image conditionings
+            video_encoder = self.stage_1_model_ledger.video_encoder()
+            stage_2_conditionings = image_conditionings_by_adding_guiding_latent(
+                images=images,
+                height=stage_2_output_shape.height,
+                width=stage_2_output_shape.width,
+                video_encoder=video_encoder,
+                dtype=dtype,
+                device=self.device,
+            )
+            del video_encoder
+
         torch.cuda.synchronize()
         cleanup_memory()
 
@@ -198,15 +227,6 @@ class KeyframeInterpolationPipeline:
                 ),
             )
 
-        stage_2_output_shape = VideoPixelShape(batch=1, frames=num_frames, width=width, height=height, fps=frame_rate)
-        stage_2_conditionings = image_conditionings_by_adding_guiding_latent(
-            images=images,
-            height=stage_2_output_shape.height,
-            width=stage_2_output_shape.width,
-            video_encoder=video_encoder,
-            dtype=dtype,
-            device=self.device,
-        )
         video_state, audio_state = denoise_audio_video(
             output_shape=stage_2_output_shape,
             conditionings=stage_2_conditionings,
@@ -224,13 +244,12 @@ class KeyframeInterpolationPipeline:
 
         torch.cuda.synchronize()
         del transformer
-        del video_encoder
         cleanup_memory()
 
         decoded_video = vae_decode_video(
             video_state.latent, self.stage_2_model_ledger.video_decoder(), tiling_config, generator
         )
-        decoded_audio = vae_decode_audio(
+        decoded_audio = vae_decode_audio_chunks(
             audio_state.latent, self.stage_2_model_ledger.audio_decoder(), self.stage_2_model_ledger.vocoder()
         )
         return decoded_video, decoded_audio
@@ -250,8 +269,11 @@ def main() -> None:
         gemma_root=args.gemma_root,
         loras=tuple(args.lora) if args.lora else (),
         quantization=args.quantization,
+        compile_config=args.compile_config,
+        skip_frozen_tokens=args.skip_frozen_tokens,
+        registry=shared_registry() if args.shared_registry else None,
     )
-    tiling_config = TilingConfig.default()
+    tiling_config = TilingConfig.auto()
     video_chunks_number = get_video_chunks_number(args.num_frames, tiling_config)
     video, audio = pipeline(
         prompt=args.prompt,
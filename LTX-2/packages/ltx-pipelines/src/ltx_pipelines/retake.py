@@ -14,9 +14,10 @@ from ltx_core.components.patchifiers import get_pixel_coords
 from ltx_core.components.protocols import DiffusionStepProtocol
 from ltx_core.components.schedulers import LTX2Scheduler
 from ltx_core.conditioning import ConditioningItem
-from ltx_core.loader import LoraPathStrengthAndSDOps
-from ltx_core.model.audio_vae import decode_audio as vae_decode_audio
+from ltx_core.loader import LoraPathStrengthAndSDOps, Registry, shared_registry
+from ltx_core.model.audio_vae import decode_audio_chunks as vae_decode_audio_chunks
 from ltx_core.model.audio_vae import encode_audio as vae_encode_audio
+from ltx_core.model.transformer import CompileConfig
 from ltx_core.model.video_vae import TilingConfig, get_video_chunks_number
 from ltx_core.model.video_vae import decode_video as vae_decode_video
 from ltx_core.quantization import QuantizationPolicy
@@ -29,7 +30,7 @@ from ltx_core.types import (
     VideoPixelShape,
 )
 from ltx_pipelines.utils import ModelLedger
-from ltx_pipelines.utils.args import QuantizationAction
+from ltx_pipelines.utils.args import COMPILE_OPTIONS, CompileAction, QuantizationAction
 from ltx_pipelines.utils.constants import DISTILLED_SIGMA_VALUES, detect_params
 from ltx_pipelines.utils.helpers import (
     cleanup_memory,
@@ -49,8 +50,6 @@ from ltx_pipelines.utils.media_io import (
 from ltx_pipelines.utils.samplers import euler_denoising_loop
 from ltx_pipelines.utils.types import PipelineComponents
 
-device = get_device()
-
 
 def _encode_video_for_retake(
     video_encoder: torch.nn.Module,
@@ -164,10 +163,18 @@ class RetakePipeline:
         Root directory containing Gemma text-encoder weights.
     loras : list[LoraPathStrengthAndSDOps]
         Optional LoRA configs applied to the transformer.
-    device : torch.device
-        Target device (default: CUDA if available).
+    device : torch.device | None
+        Target device (default: CUDA if available, resolved when the pipeline is created).
     quantization : QuantizationPolicy | None
         Optional quantization policy for the transformer.
+    compile_config : CompileConfig | None
+        Optional ``torch.compile`` settings for the transformer (default: eager).
+    skip_frozen_tokens : bool
+        Skip the preserved (``denoise_mask == 0``) tokens after the first step, reusing their cached
+        keys/values (default: False, exact forward).
+    registry : Registry | None
+        Weight registry of the model ledger, e.g. :func:`~ltx_core.loader.shared_registry` to share loaded
+        weights with other pipelines in the process (default: :class:`~ltx_core.loader.DummyRegistry`).
     """
 
     def __init__(
@@ -175,9 +182,13 @@ class RetakePipeline:
         checkpoint_path: str,
         gemma_root: str,
         loras: list[LoraPathStrengthAndSDOps],
-        device: torch.device = device,
+        device: torch.device | None = None,
         quantization: QuantizationPolicy | None = None,
+        compile_config: CompileConfig | None = None,
+        skip_frozen_tokens: bool = False,
+        registry: Registry | None = None,
     ):
+        device = device if device is not None else get_device()
         self.device = device
         self.dtype = torch.bfloat16
         self.model_ledger = ModelLedger(
@@ -187,6 +198,9 @@ class RetakePipeline:
             gemma_root_path=gemma_root,
             loras=loras,
             quantization=quantization,
+            compile_config=compile_config,
+            skip_frozen_tokens=skip_frozen_tokens,
+            registry=registry,
         )
         self.pipeline_components = PipelineComponents(
             dtype=self.dtype,
@@ -214,7 +228,7 @@ class RetakePipeline:
         enhance_prompt: bool = False,
         distilled: bool = False,
         tiling_config: TilingConfig | None = None,
-    ) -> tuple[Iterator[torch.Tensor], torch.Tensor]:
+    ) -> tuple[Iterator[torch.Tensor], Iterator[Audio]]:
         """Regenerate ``[start_time, end_time]`` of the source video (retake).
         Parameters
         ----------
@@ -250,8 +264,8 @@ class RetakePipeline:
             function.  The model checkpoint must be the distilled variant.
         Returns
         -------
-        tuple[Iterator[torch.Tensor], torch.Tensor]
-            ``(video_frames_iterator, audio_waveform)``
+        tuple[Iterator[torch.Tensor], Iterator[Audio]]
+            ``(video_frames_iterator, audio_pieces)``; the audio is vocoded piece by piece as it is consumed.
         """
         if start_time >= end_time:
             raise ValueError(f"start_time ({start_time}) must be less than end_time ({end_time})")
@@ -410,7 +424,7 @@ class RetakePipeline:
         decoded_video = vae_decode_video(
             video_state.latent, self.model_ledger.video_decoder(), tiling_config, generator
         )
-        decoded_audio = vae_decode_audio(
+        decoded_audio = vae_decode_audio_chunks(
             audio_state.latent, self.model_ledger.audio_decoder(), self.model_ledger.vocoder()
         )
 
@@ -440,6 +454,25 @@ def main() -> None:
         default=None,
         help="Quantization policy: fp8-cast or fp8-scaled-mm [AMAX_PATH].",
     )
+    parser.add_argument(
+        "--compile",
+        dest="compile_config",
+        action=CompileAction,
+        nargs="*",
+        metavar="OPTION",
+        default=None,
+        help=f"Run the transformer through torch.compile. Options: {', '.join(COMPILE_OPTIONS)}.",
+    )
+    parser.add_argument(
+        "--skip-frozen-tokens",
+        action="store_true",
+        help="Run the preserved tokens only as cached keys/values after the first step (approximate, faster).",
+    )
+    parser.add_argument(
+        "--shared-registry",
+        action="store_true",
+        help="Load weights through the process-wide weight registry (no fused Q/K/V projection).",
+    )
     args = parser.parse_args()
 
     if args.start_time >= args.end_time:
@@ -461,9 +494,12 @@ def main() -> None:
         gemma_root=args.gemma_root,
         loras=tuple(args.loras) if args.loras else (),
         quantization=args.quantization,
+        compile_config=args.compile_config,
+        skip_frozen_tokens=args.skip_frozen_tokens,
+        registry=shared_registry() if args.shared_registry else None,
     )
     params = detect_params(args.checkpoint_path)
-    tiling_config = TilingConfig.default()
+    tiling_config = TilingConfig.auto()
     video_iter, audio = pipeline(
         video_path=args.video_path,
         prompt=args.prompt,
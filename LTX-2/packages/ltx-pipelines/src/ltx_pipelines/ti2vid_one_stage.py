@@ -12,8 +12,9 @@ from ltx_core.components.guiders import (
 from ltx_core.components.noisers import GaussianNoiser
 from ltx_core.components.protocols import DiffusionStepProtocol
 from ltx_core.components.schedulers import LTX2Scheduler
-from ltx_core.loader import LoraPathStrengthAndSDOps
-from ltx_core.model.audio_vae import decode_audio as vae_decode_audio
+from ltx_core.loader import LoraPathStrengthAndSDOps, Registry, shared_registry
+from ltx_core.model.audio_vae import decode_audio_chunks as vae_decode_audio_chunks
+from ltx_core.model.transformer import CompileConfig
 from ltx_core.model.video_vae import decode_video as vae_decode_video
 from ltx_core.quantization import QuantizationPolicy
 from ltx_core.types import Audio, LatentState, VideoPixelShape
@@ -33,8 +34,6 @@ from ltx_pipelines.utils.constants import detect_params
 from ltx_pipelines.utils.media_io import encode_video
 from ltx_pipelines.utils.types import PipelineComponents
 
-device = get_device()
-
 
 class TI2VidOneStagePipeline:
     """
@@ -50,9 +49,13 @@ class TI2VidOneStagePipeline:
         checkpoint_path: str,
         gemma_root: str,
         loras: list[LoraPathStrengthAndSDOps],
-        device: torch.device = device,
+        device: torch.device | None = None,
         quantization: QuantizationPolicy | None = None,
+        compile_config: CompileConfig | None = None,
+        skip_frozen_tokens: bool = False,
+        registry: Registry | None = None,
     ):
+        device = device if device is not None else get_device()
         self.dtype = torch.bfloat16
         self.device = device
         self.model_ledger = ModelLedger(
@@ -62,6 +65,9 @@ class TI2VidOneStagePipeline:
             gemma_root_path=gemma_root,
             loras=loras,
             quantization=quantization,
+            compile_config=compile_config,
+            skip_frozen_tokens=skip_frozen_tokens,
+            registry=registry,
         )
         self.pipeline_components = PipelineComponents(
             dtype=self.dtype,
@@ -82,7 +88,7 @@ class TI2VidOneStagePipeline:
         audio_guider_params: MultiModalGuiderParams | MultiModalGuiderFactory,
         images: list[ImageConditioningInput],
         enhance_prompt: bool = False,
-    ) -> tuple[Iterator[torch.Tensor], Audio]:
+    ) -> tuple[Iterator[torch.Tensor], Iterator[Audio]]:
         assert_resolution(height=height, width=width, is_two_stage=False)
 
         generator = torch.Generator(device=self.device).manual_seed(seed)
@@ -103,17 +109,19 @@ class TI2VidOneStagePipeline:
         # Encode image conditionings with the VAE encoder, then free it
         # before loading the transformer to reduce peak VRAM.
         stage_1_output_shape = VideoPixelShape(batch=1, frames=num_frames, width=width, height=height, fps=frame_rate)
-        video_encoder = self.model_ledger.video_encoder()
-        stage_1_conditionings = combined_image_conditionings(
-            images=images,
-            height=stage_1_output_shape.height,
-            width=stage_1_output_shape.width,
-            video_encoder=video_encoder,
-            dtype=dtype,
-            device=self.device,
-        )
+        stage_1_conditionings = []
+        if images:
+            video_encoder = self.model_ledger.video_encoder()
+            stage_1_conditionings = combined_image_conditionings(
+                images=images,
+                height=stage_1_output_shape.height,
+                width=stage_1_output_shape.width,
+                video_encoder=video_encoder,
+                dtype=dtype,
+                device=self.device,
+            )
+            del video_encoder
         torch.cuda.synchronize()
-        del video_encoder
         cleanup_memory()
 
         transformer = self.model_ledger.transformer()
@@ -162,7 +170,7 @@ class TI2VidOneStagePipeline:
         cleanup_memory()
 
         decoded_video = vae_decode_video(video_state.latent, self.model_ledger.video_decoder(), generator=generator)
-        decoded_audio = vae_decode_audio(
+        decoded_audio = vae_decode_audio_chunks(
             audio_state.latent, self.model_ledger.audio_decoder(), self.model_ledger.vocoder()
         )
         return decoded_video, decoded_audio
@@ -180,6 +188,9 @@ def main() -> None:
         gemma_root=args.gemma_root,
         loras=tuple(args.lora) if args.lora else (),
         quantization=args.quantization,
+        compile_config=args.compile_config,
+        skip_frozen_tokens=args.skip_frozen_tokens,
+        registry=shared_registry() if args.shared_registry else None,
     )
     video, audio = pipeline(
         prompt=args.prompt,
@@ -12,11 +12,13 @@ from ltx_core.components.guiders import (
 from ltx_core.components.noisers import GaussianNoiser
 from ltx_core.components.protocols import DiffusionStepProtocol
 from ltx_core.components.schedulers import LTX2Scheduler
-from ltx_core.loader import LoraPathStrengthAndSDOps
-from ltx_core.model.audio_vae import decode_audio as vae_decode_audio
+from ltx_core.loader import LoraPathStrengthAndSDOps, Registry, shared_registry
+from ltx_core.model.audio_vae import decode_audio_chunks as vae_decode_audio_chunks
+from ltx_core.model.transformer import CompileConfig
 from ltx_core.model.upsampler import upsample_video
 from ltx_core.model.video_vae import TilingConfig, get_video_chunks_number
 from ltx_core.model.video_vae import decode_video as vae_decode_video
+from ltx_core.model.video_vae import decode_video_preview as vae_decode_video_preview
 from ltx_core.quantization import QuantizationPolicy
 from ltx_core.types import Audio, LatentState, VideoPixelShape
 from ltx_pipelines.utils import (
@@ -31,12 +33,28 @@ from ltx_pipelines.utils import (
     multi_modal_guider_factory_denoising_func,
     simple_denoising_func,
 )
-from ltx_pipelines.utils.args import ImageConditioningInput, default_2_stage_arg_parser, detect_checkpoint_path
-from ltx_pipelines.utils.constants import STAGE_2_DISTILLED_SIGMA_VALUES, detect_params
-from ltx_pipelines.utils.media_io import encode_video
+from ltx_pipelines.utils.args import (
+    ImageConditioningInput,
+    default_2_stage_arg_parser,
+    detect_checkpoint_path,
+    resolve_path,
+)
+from ltx_pipelines.utils.constants import (
+    PREVIEW_LOOK_AHEAD_IN_LATENTS,
+    STAGE_2_DISTILLED_SIGMA_VALUES,
+    detect_params,
+)
+from ltx_pipelines.utils.latent_checkpoint import (
+    LatentCheckpoint,
+    ResumePoint,
+    guider_params_json,
+    loras_json,
+    quantization_json,
+)
+from ltx_pipelines.utils.media_io import encode_video, image_decode_cache, write_preview
 from ltx_pipelines.utils.types import PipelineComponents
 
-device = get_device()
+logger = logging.getLogger(__name__)
 
 
 class TI2VidTwoStagesPipeline:
@@ -55,9 +73,13 @@ class TI2VidTwoStagesPipeline:
         spatial_upsampler_path: str,
         gemma_root: str,
         loras: list[LoraPathStrengthAndSDOps],
-        device: torch.device = device,
+        device: torch.device | None = None,
         quantization: QuantizationPolicy | None = None,
+        compile_config: CompileConfig | None = None,
+        skip_frozen_tokens: bool = False,
+        registry: Registry | None = None,
     ):
+        device = device if device is not None else get_device()
         self.device = device
         self.dtype = torch.bfloat16
         self.stage_1_model_ledger = ModelLedger(
@@ -68,6 +90,9 @@ class TI2VidTwoStagesPipeline:
             spatial_upsampler_path=spatial_upsampler_path,
             loras=loras,
             quantization=quantization,
+            compile_config=compile_config,
+            skip_frozen_tokens=skip_frozen_tokens,
+            registry=registry,
         )
 
         self.stage_2_model_ledger = self.stage_1_model_ledger.with_additional_loras(
@@ -79,7 +104,8 @@ class TI2VidTwoStagesPipeline:
             device=device,
         )
 
-    def __call__(  # noqa: PLR0913
+    @image_decode_cache()
+    def __call__(  # noqa: PLR0913, PLR0915
         self,
         prompt: str,
         negative_prompt: str,
@@ -94,7 +120,20 @@ class TI2VidTwoStagesPipeline:
         images: list[ImageConditioningInput],
         tiling_config: TilingConfig | None = None,
         enhance_prompt: bool = False,
-    ) -> tuple[Iterator[torch.Tensor], Audio]:
+        latent_checkpoint_path: str | None = None,
+        resume_from: ResumePoint | None = None,
+        preview_path: str | None = None,
+    ) -> tuple[Iterator[torch.Tensor], Iterator[Audio]]:
+        """
+        Generate a video and its audio.
+        With ``latent_checkpoint_path``, the prompt contexts and the latents are saved after stage 1, after the
+        upsampling and after stage 2 (see :class:`LatentCheckpoint`). If the file already holds results of the
+        same job, the pipeline resumes from ``resume_from``, or from the last saved point if it is None, so a
+        retry after a crash or a decode with another ``tiling_config`` skips the completed stages.
+        With ``preview_path``, the first frame is written there with :func:`write_preview` once denoising finishes,
+        before the video is decoded. It is decoded with :data:`PREVIEW_LOOK_AHEAD_IN_LATENTS` latents of look-ahead
+        only, so it costs a fraction of the full decode and can differ slightly from the first frame of the video.
+        """
         assert_resolution(height=height, width=width, is_two_stage=True)
 
         generator = torch.Generator(device=self.device).manual_seed(seed)
@@ -102,142 +141,219 @@ class TI2VidTwoStagesPipeline:
         stepper = EulerDiffusionStep()
         dtype = torch.bfloat16
 
-        ctx_p, ctx_n = encode_prompts(
-            [prompt, negative_prompt],
-            self.stage_1_model_ledger,
-            enhance_first_prompt=enhance_prompt,
-            enhance_prompt_image=images[0][0] if len(images) > 0 else None,
-            enhance_prompt_seed=seed,
-        )
-        v_context_p, a_context_p = ctx_p.video_encoding, ctx_p.audio_encoding
-        v_context_n, a_context_n = ctx_n.video_encoding, ctx_n.audio_encoding
-
-        # Stage 1: encode image conditionings with the VAE encoder, then free it
-        # before loading the transformer to reduce peak VRAM.
-        stage_1_output_shape = VideoPixelShape(
-            batch=1,
-            frames=num_frames,
-            width=width // 2,
-            height=height // 2,
-            fps=frame_rate,
-        )
-        video_encoder = self.stage_1_model_ledger.video_encoder()
-        stage_1_conditionings = combined_image_conditionings(
-            images=images,
-            height=stage_1_output_shape.height,
-            width=stage_1_output_shape.width,
-            video_encoder=video_encoder,
-            dtype=dtype,
-            device=self.device,
-        )
-        torch.cuda.synchronize()
-        del video_encoder
-        cleanup_memory()
+        checkpoint = None
+        resume_point = None
+        if latent_checkpoint_path is not None:
+            checkpoint = LatentCheckpoint.open(
+                latent_checkpoint_path,
+                params={
+                    "prompt": prompt,
+                    "negative_prompt": negative_prompt,
+                    "seed": seed,
+                    "height": height,
+                    "width": width,
+                    "num_frames": num_frames,
+                    "frame_rate": frame_rate,
+                    "num_inference_steps": num_inference_steps,
+                    "images": images,
+                    "enhance_prompt": enhance_prompt,
+                    "video_guider_params": guider_params_json(video_guider_params),
+                    "audio_guider_params": guider_params_json(audio_guider_params),
+                    "checkpoint_path": self.stage_1_model_ledger.checkpoint_path,
+                    "spatial_upsampler_path": self.stage_2_model_ledger.spatial_upsampler_path,
+                    "loras": loras_json(self.stage_1_model_ledger.loras),
+                    "stage_2_loras": loras_json(self.stage_2_model_ledger.loras),
+                    "quantization": quantization_json(self.stage_1_model_ledger.quantization),
+                    "skip_frozen_tokens": self.stage_1_model_ledger.skip_frozen_tokens,
+                },
+            )
+            resume_point = checkpoint.resume_point(resume_from)
 
-        transformer = self.stage_1_model_ledger.transformer()
-        sigmas = LTX2Scheduler().execute(steps=num_inference_steps).to(dtype=torch.float32, device=self.device)
+        if resume_point is None:
+            ctx_p, ctx_n = encode_prompts(
+                [prompt, negative_prompt],
+                self.stage_1_model_ledger,
+                enhance_first_prompt=enhance_prompt,
+                enhance_prompt_image=images[0][0] if len(images) > 0 else None,
+                enhance_prompt_seed=seed,
+            )
+            v_context_p, a_context_p = ctx_p.video_encoding, ctx_p.audio_encoding
+            v_context_n, a_context_n = ctx_n.video_encoding, ctx_n.audio_encoding
+
+            # Stage 1: encode image conditionings with the VAE encoder, then free it
+            # before loading the transformer to reduce peak VRAM.
+            stage_1_output_shape = VideoPixelShape(
+                batch=1,
+                frames=num_frames,
+                width=width // 2,
+                height=height // 2,
+                fps=frame_rate,
+            )
+            stage_1_conditionings = []
+            if images:
+                video_encoder = self.stage_1_model_ledger.video_encoder()
+                stage_1_conditionings = combined_image_conditionings(
+                    images=images,
+                    height=stage_1_output_shape.height,
+                    width=stage_1_output_shape.width,
+                    video_encoder=video_encoder,
+                    dtype=dtype,
+                    device=self.device,
+                )
+                del video_encoder
+            torch.cuda.synchronize()
+            cleanup_memory()
 
-        def first_stage_denoising_loop(
-            sigmas: torch.Tensor, video_state: LatentState, audio_state: LatentState, stepper: DiffusionStepProtocol
-        ) -> tuple[LatentState, LatentState]:
-            return euler_denoising_loop(
+            transformer = self.stage_1_model_ledger.transformer()
+            sigmas = LTX2Scheduler().execute(steps=num_inference_steps).to(dtype=torch.float32, device=self.device)
+
+            def first_stage_denoising_loop(
+                sigmas: torch.Tensor, video_state: LatentState, audio_state: LatentState, stepper: DiffusionStepProtocol
+            ) -> tuple[LatentState, LatentState]:
+                return euler_denoising_loop(
+                    sigmas=sigmas,
+                    video_state=video_state,
+                    audio_state=audio_state,
+                    stepper=stepper,
+                    denoise_fn=multi_modal_guider_factory_denoising_func(
+                        video_guider_factory=create_multimodal_guider_factory(
+                            params=video_guider_params,
+                            negative_context=v_context_n,
+                        ),
+                        audio_guider_factory=create_multimodal_guider_factory(
+                            params=audio_guider_params,
+                            negative_context=a_context_n,
+                        ),
+                        v_context=v_context_p,
+                        a_context=a_context_p,
+                        transformer=transformer,
+                    ),
+                )
+
+            video_state, audio_state = denoise_audio_video(
+                output_shape=stage_1_output_shape,
+                conditionings=stage_1_conditionings,
+                noiser=noiser,
                 sigmas=sigmas,
-                video_state=video_state,
-                audio_state=audio_state,
                 stepper=stepper,
-                denoise_fn=multi_modal_guider_factory_denoising_func(
-                    video_guider_factory=create_multimodal_guider_factory(
-                        params=video_guider_params,
-                        negative_context=v_context_n,
-                    ),
-                    audio_guider_factory=create_multimodal_guider_factory(
-                        params=audio_guider_params,
-                        negative_context=a_context_n,
-                    ),
-                    v_context=v_context_p,
-                    a_context=a_context_p,
-                    transformer=transformer,  # noqa: F821
-                ),
+                denoising_loop_fn=first_stage_denoising_loop,
+                components=self.pipeline_components,
+                dtype=dtype,
+                device=self.device,
             )
 
-        video_state, audio_state = denoise_audio_video(
-            output_shape=stage_1_output_shape,
-            conditionings=stage_1_conditionings,
-            noiser=noiser,
-            sigmas=sigmas,
-            stepper=stepper,
-            denoising_loop_fn=first_stage_denoising_loop,
-            components=self.pipeline_components,
-            dtype=dtype,
-            device=self.device,
-        )
+            torch.cuda.synchronize()
+            del transformer
+            cleanup_memory()
 
-        torch.cuda.synchronize()
-        del transformer
-        cleanup_memory()
+            if checkpoint is not None:
+                checkpoint.save(
+                    ResumePoint.AFTER_STAGE_1,
+                    generator,
+                    video_context=v_context_p,
+                    audio_context=a_context_p,
+                    stage_1_video_state=video_state,
+                    stage_1_audio_state=audio_state,
+                )
+        else:
+            logger.info(f"Resuming from {resume_point.value} of {latent_checkpoint_path}")
+            checkpoint.restore_generator(resume_point, generator)
+            v_context_p = checkpoint.tensor("video_context", self.device)
+            a_context_p = checkpoint.tensor("audio_context", self.device)
+            states = "stage_2" if resume_point == ResumePoint.AFTER_STAGE_2 else "stage_1"
+            video_state = checkpoint.state(f"{states}_video_state", self.device)
+            audio_state = checkpoint.state(f"{states}_audio_state", self.device)
+            upscaled_video_latent = checkpoint.tensor("upscaled_video_latent", self.device)
 
         # Stage 2: Upsample and refine the video at higher resolution with distilled LORA.
-        video_encoder = self.stage_1_model_ledger.video_encoder()
-        upscaled_video_latent = upsample_video(
-            latent=video_state.latent[:1],
-            video_encoder=video_encoder,
-            upsampler=self.stage_2_model_ledger.spatial_upsampler(),
-        )
+        if resume_point in (None, ResumePoint.AFTER_STAGE_1):
+            upscaled_video_latent = upsample_video(
+                latent=video_state.latent[:1],
+                per_channel_statistics=self.stage_1_model_ledger.video_latent_statistics(),
+                upsampler=self.stage_2_model_ledger.spatial_upsampler(),
+                tiling_config=tiling_config,
+            )
+            if checkpoint is not None:
+                checkpoint.save(ResumePoint.AFTER_UPSAMPLE, generator, upscaled_video_latent=upscaled_video_latent)
 
-        stage_2_output_shape = VideoPixelShape(batch=1, frames=num_frames, width=width, height=height, fps=frame_rate)
-        stage_2_conditionings = combined_image_conditionings(
-            images=images,
-            height=stage_2_output_shape.height,
-            width=stage_2_output_shape.width,
-            video_encoder=video_encoder,
-            dtype=dtype,
-            device=self.device,
-        )
-        del video_encoder
-        torch.cuda.synchronize()
-        cleanup_memory()
+        if resume_point != ResumePoint.AFTER_STAGE_2:
+            stage_2_output_shape = VideoPixelShape(
+                batch=1, frames=num_frames, width=width, height=height, fps=frame_rate
+            )
+            stage_2_conditionings = []
+            if images:
+                # The full video encoder is only needed to encode the image conditionings
+                video_encoder = self.stage_1_model_ledger.video_encoder()
+                stage_2_conditionings = combined_image_conditionings(
+                    images=images,
+                    height=stage_2_output_shape.height,
+                    width=stage_2_output_shape.width,
+                    video_encoder=video_encoder,
+                    dtype=dtype,
+                    device=self.device,
+                )
+                del video_encoder
+            torch.cuda.synchronize()
+            cleanup_memory()
 
-        transformer = self.stage_2_model_ledger.transformer()
-        distilled_sigmas = torch.Tensor(STAGE_2_DISTILLED_SIGMA_VALUES).to(self.device)
+            transformer = self.stage_2_model_ledger.transformer()
+            distilled_sigmas = torch.Tensor(STAGE_2_DISTILLED_SIGMA_VALUES).to(self.device)
 
-        def second_stage_denoising_loop(
-            sigmas: torch.Tensor, video_state: LatentState, audio_state: LatentState, stepper: DiffusionStepProtocol
-        ) -> tuple[LatentState, LatentState]:
-            return euler_denoising_loop(
-                sigmas=sigmas,
-                video_state=video_state,
-                audio_state=audio_state,
+            def second_stage_denoising_loop(
+                sigmas: torch.Tensor, video_state: LatentState, audio_state: LatentState, stepper: DiffusionStepProtocol
+            ) -> tuple[LatentState, LatentState]:
+                return euler_denoising_loop(
+                    sigmas=sigmas,
+                    video_state=video_state,
+                    audio_state=audio_state,
+                    stepper=stepper,
+                    denoise_fn=simple_denoising_func(
+                        video_context=v_context_p,
+                        audio_context=a_context_p,
+                        transformer=transformer,
+                    ),
+                )
+
+            video_state, audio_state = denoise_audio_video(
+                output_shape=stage_2_output_shape,
+                conditionings=stage_2_conditionings,
+                noiser=noiser,
+                sigmas=distilled_sigmas,
                 stepper=stepper,
-                denoise_fn=simple_denoising_func(
-                    video_context=v_context_p,
-                    audio_context=a_context_p,
-                    transformer=transformer,  # noqa: F821
-                ),
+                denoising_loop_fn=second_stage_denoising_loop,
+                components=self.pipeline_components,
+                dtype=dtype,
+                device=self.device,
+                noise_scale=distilled_sigmas[0],
+                initial_video_latent=upscaled_video_latent,
+                initial_audio_latent=audio_state.latent,
             )
 
-        video_state, audio_state = denoise_audio_video(
-            output_shape=stage_2_output_shape,
-            conditionings=stage_2_conditionings,
-            noiser=noiser,
-            sigmas=distilled_sigmas,
-            stepper=stepper,
-            denoising_loop_fn=second_stage_denoising_loop,
-            components=self.pipeline_components,
-            dtype=dtype,
-            device=self.device,
-            noise_scale=distilled_sigmas[0],
-            initial_video_latent=upscaled_video_latent,
-            initial_audio_latent=audio_state.latent,
-        )
+            torch.cuda.synchronize()
+            del transformer
+            cleanup_memory()
 
-        torch.cuda.synchronize()
-        del transformer
-        cleanup_memory()
+            if checkpoint is not None:
+                checkpoint.save(
+                    ResumePoint.AFTER_STAGE_2,
+                    generator,
+                    stage_2_video_state=video_state,
+                    stage_2_audio_state=audio_state,
+                )
 
-        decoded_video = vae_decode_video(
-            video_state.latent, self.stage_2_model_ledger.video_decoder(), tiling_config, generator
-        )
-        decoded_audio = vae_decode_audio(
+        video_decoder = self.stage_2_model_ledger.video_decoder()
+        if preview_path is not None:
+            # A generator of its own keeps the decode noise of the video unchanged
+            preview = vae_decode_video_preview(
+                video_state.latent,
+                video_decoder,
+                look_ahead_in_latents=PREVIEW_LOOK_AHEAD_IN_LATENTS,
+                generator=torch.Generator(device=self.device).manual_seed(seed),
+            )
+            write_preview(preview, preview_path, fps=frame_rate)
+
+        decoded_video = vae_decode_video(video_state.latent, video_decoder, tiling_config, generator)
+        decoded_audio = vae_decode_audio_chunks(
             audio_state.latent, self.stage_2_model_ledger.audio_decoder(), self.stage_2_model_ledger.vocoder()
         )
         return decoded_video, decoded_audio
@@ -249,6 +365,33 @@ def main() -> None:
     checkpoint_path = detect_checkpoint_path()
     params = detect_params(checkpoint_path)
     parser = default_2_stage_arg_parser(params=params)
+    parser.add_argument(
+        "--latent-checkpoint-path",
+        type=resolve_path,
+        default=None,
+        help=(
+            "Path of a .safetensors file the intermediate latents and prompt contexts are saved to after each stage. "
+            "If it already holds results of the same job, the completed stages are skipped."
+        ),
+    )
+    parser.add_argument(
+        "--resume-from",
+        choices=[point.value for point in ResumePoint],
+        default=None,
+        help=(
+            "Point of the latent checkpoint to resume from, after_stage_2 only decodes. "
+            "Defaults to the last saved point."
+        ),
+    )
+    parser.add_argument(
+        "--preview-path",
+        type=resolve_path,
+        default=None,
+        help=(
+            "Path of a .jpg, .png, .gif or .webp preview of the first frame, written once denoising finishes and "
+            "before the video is decoded. It is decoded with a short look-ahead and can differ slightly from the video."
+        ),
+    )
     args = parser.parse_args()
     pipeline = TI2VidTwoStagesPipeline(
         checkpoint_path=args.checkpoint_path,
@@ -257,8 +400,11 @@ def main() -> None:
         gemma_root=args.gemma_root,
         loras=tuple(args.lora) if args.lora else (),
         quantization=args.quantization,
+        compile_config=args.compile_config,
+        skip_frozen_tokens=args.skip_frozen_tokens,
+        registry=shared_registry() if args.shared_registry else None,
     )
-    tiling_config = TilingConfig.default()
+    tiling_config = TilingConfig.auto()
     video_chunks_number = get_video_chunks_number(args.num_frames, tiling_config)
     video, audio = pipeline(
         prompt=args.prompt,
@@ -287,6 +433,9 @@ def main() -> None:
         ),
         images=args.images,
         tiling_config=tiling_config,
+        latent_checkpoint_path=args.latent_checkpoint_path,
+        resume_from=ResumePoint(args.resume_from) if args.resume_from is not None else None,
+        preview_path=args.preview_path,
     )
 
     encode_video(
@@ -8,8 +8,9 @@ from ltx_core.components.guiders import MultiModalGuider, MultiModalGuiderParams
 from ltx_core.components.noisers import GaussianNoiser
 from ltx_core.components.protocols import DiffusionStepProtocol
 from ltx_core.components.schedulers import LTX2Scheduler
-from ltx_core.loader import LoraPathStrengthAndSDOps
-from ltx_core.model.audio_vae import decode_audio as vae_decode_audio
+from ltx_core.loader import LoraPathStrengthAndSDOps, Registry, shared_registry
+from ltx_core.model.audio_vae import decode_audio_chunks as vae_decode_audio_chunks
+from ltx_core.model.transformer import CompileConfig
 from ltx_core.model.upsampler import upsample_video
 from ltx_core.model.video_vae import TilingConfig, get_video_chunks_number
 from ltx_core.model.video_vae import decode_video as vae_decode_video
@@ -30,11 +31,9 @@ from ltx_pipelines.utils import (
 )
 from ltx_pipelines.utils.args import ImageConditioningInput, hq_2_stage_arg_parser
 from ltx_pipelines.utils.constants import LTX_2_3_HQ_PARAMS, STAGE_2_DISTILLED_SIGMA_VALUES
-from ltx_pipelines.utils.media_io import encode_video
+from ltx_pipelines.utils.media_io import encode_video, image_decode_cache
 from ltx_pipelines.utils.types import PipelineComponents
 
-device = get_device()
-
 
 class TI2VidTwoStagesHQPipeline:
     """
@@ -48,7 +47,7 @@ class TI2VidTwoStagesHQPipeline:
     the images parameter.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913, PLR0917
         self,
         checkpoint_path: str,
         distilled_lora: list[LoraPathStrengthAndSDOps],
@@ -57,9 +56,13 @@ class TI2VidTwoStagesHQPipeline:
         spatial_upsampler_path: str,
         gemma_root: str,
         loras: tuple[LoraPathStrengthAndSDOps, ...],
-        device: str = device,
+        device: torch.device | None = None,
         quantization: QuantizationPolicy | None = None,
+        compile_config: CompileConfig | None = None,
+        skip_frozen_tokens: bool = False,
+        registry: Registry | None = None,
     ):
+        device = device if device is not None else get_device()
         self.device = device
         self.dtype = torch.bfloat16
         distilled_lora_stage_1 = LoraPathStrengthAndSDOps(
@@ -80,6 +83,9 @@ class TI2VidTwoStagesHQPipeline:
             spatial_upsampler_path=spatial_upsampler_path,
             loras=(*loras, distilled_lora_stage_1),
             quantization=quantization,
+            compile_config=compile_config,
+            skip_frozen_tokens=skip_frozen_tokens,
+            registry=registry,
         )
 
         self.stage_2_model_ledger = self.stage_1_model_ledger.with_loras(
@@ -92,6 +98,7 @@ class TI2VidTwoStagesHQPipeline:
         )
 
     @torch.inference_mode()
+    @image_decode_cache()
     def __call__(  # noqa: PLR0913
         self,
         prompt: str,
@@ -107,7 +114,7 @@ class TI2VidTwoStagesHQPipeline:
         images: list[ImageConditioningInput],
         tiling_config: TilingConfig | None = None,
         enhance_prompt: bool = False,
-    ) -> tuple[Iterator[torch.Tensor], Audio]:
+    ) -> tuple[Iterator[torch.Tensor], Iterator[Audio]]:
         assert_resolution(height=height, width=width, is_two_stage=True)
 
         generator = torch.Generator(device=self.device).manual_seed(seed)
@@ -133,17 +140,19 @@ class TI2VidTwoStagesHQPipeline:
             height=height // 2,
             fps=frame_rate,
         )
-        video_encoder = self.stage_1_model_ledger.video_encoder()
-        stage_1_conditionings = combined_image_conditionings(
-            images=images,
-            height=stage_1_output_shape.height,
-            width=stage_1_output_shape.width,
-            video_encoder=video_encoder,
-            dtype=dtype,
-            device=self.device,
-        )
+        stage_1_conditionings = []
+        if images:
+            video_encoder = self.stage_1_model_ledger.video_encoder()
+            stage_1_conditionings = combined_image_conditionings(
+                images=images,
+                height=stage_1_output_shape.height,
+                width=stage_1_output_shape.width,
+                video_encoder=video_encoder,
+                dtype=dtype,
+                device=self.device,
+            )
+            del video_encoder
         torch.cuda.synchronize()
-        del video_encoder
         cleanup_memory()
 
         transformer = self.stage_1_model_ledger.transformer()
@@ -196,24 +205,28 @@ class TI2VidTwoStagesHQPipeline:
         cleanup_memory()
 
         # Stage 2: Upsample and refine the video at higher resolution with distilled LORA.
-        video_encoder = self.stage_1_model_ledger.video_encoder()
         upscaled_video_latent = upsample_video(
             latent=video_state.latent[:1],
-            video_encoder=video_encoder,
+            per_channel_statistics=self.stage_1_model_ledger.video_latent_statistics(),
             upsampler=self.stage_2_model_ledger.spatial_upsampler(),
+            tiling_config=tiling_config,
         )
 
         stage_2_output_shape = VideoPixelShape(batch=1, frames=num_frames, width=width, height=height, fps=frame_rate)
-        stage_2_conditionings = combined_image_conditionings(
-            images=images,
-            height=stage_2_output_shape.height,
-            width=stage_2_output_shape.width,
-            video_encoder=video_encoder,
-            dtype=dtype,
-            device=self.device,
-        )
+        stage_2_conditionings = []
+        if images:
+            # The full video encoder is only needed to encode the image conditionings
+            video_encoder = self.stage_1_model_ledger.video_encoder()
+            stage_2_conditionings = combined_image_conditionings(
+                images=images,
+                height=stage_2_output_shape.height,
+                width=stage_2_output_shape.width,
+                video_encoder=video_encoder,
+                dtype=dtype,
+                device=self.device,
+            )
+            del video_encoder
         torch.cuda.synchronize()
-        del video_encoder
         cleanup_memory()
 
         transformer = self.stage_2_model_ledger.transformer()
@@ -256,7 +269,7 @@ class TI2VidTwoStagesHQPipeline:
         decoded_video = vae_decode_video(
             video_state.latent, self.stage_2_model_ledger.video_decoder(), tiling_config, generator
         )
-        decoded_audio = vae_decode_audio(
+        decoded_audio = vae_decode_audio_chunks(
             audio_state.latent, self.stage_2_model_ledger.audio_decoder(), self.stage_2_model_ledger.vocoder()
         )
         return decoded_video, decoded_audio
@@ -276,8 +289,11 @@ def main() -> None:
         gemma_root=args.gemma_root,
         loras=tuple(args.lora) if args.lora else (),
         quantization=args.quantization,
+        compile_config=args.compile_config,
+        skip_frozen_tokens=args.skip_frozen_tokens,
+        registry=shared_registry() if args.shared_registry else None,
     )
-    tiling_config = TilingConfig.default()
+    tiling_config = TilingConfig.auto()
     video_chunks_number = get_video_chunks_number(args.num_frames, tiling_config)
     video, audio = pipeline(
         prompt=args.prompt,
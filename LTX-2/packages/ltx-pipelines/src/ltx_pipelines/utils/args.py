@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import NamedTuple
 
 from ltx_core.loader import LTXV_LORA_COMFY_RENAMING_MAP, LoraPathStrengthAndSDOps
+from ltx_core.model.transformer import CompileConfig
 from ltx_core.quantization import QuantizationPolicy
 from ltx_pipelines.utils.constants import (
     DEFAULT_IMAGE_CRF,
@@ -145,6 +146,30 @@ class QuantizationAction(argparse.Action):
         setattr(namespace, self.dest, policy)
 
 
+COMPILE_OPTIONS = ("cuda-graphs", "max-autotune", "fullgraph")
+
+
+class CompileAction(argparse.Action):
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,  # noqa: ARG002
+        namespace: argparse.Namespace,
+        values: list[str],
+        option_string: str | None = None,
+    ) -> None:
+        unknown = [value for value in values if value not in COMPILE_OPTIONS]
+        if unknown:
+            msg = f"{option_string} got unknown options {unknown}. Choose from: {', '.join(COMPILE_OPTIONS)}"
+            raise argparse.ArgumentError(self, msg)
+
+        config = CompileConfig(
+            cuda_graphs="cuda-graphs" in values,
+            max_autotune="max-autotune" in values,
+            fullgraph="fullgraph" in values,
+        )
+        setattr(namespace, self.dest, config)
+
+
 def detect_checkpoint_path(distilled: bool = False) -> str:
     """Pre-parse argv to extract the checkpoint path before building the full parser."""
     pre = argparse.ArgumentParser(add_help=False)
@@ -276,6 +301,40 @@ def basic_arg_parser(
             "Example: --quantization fp8-cast or --quantization fp8-scaled-mm /path/to/amax.json"
         ),
     )
+    parser.add_argument(
+        "--compile",
+        dest="compile_config",
+        action=CompileAction,
+        nargs="*",
+        metavar="OPTION",
+        default=None,
+        help=(
+            "Run the transformer through torch.compile with static shapes; each resolution is compiled on "
+            "its first step and compiled artifacts are cached on disk. Falls back to eager if compilation fails. "
+            f"Optional options: {', '.join(COMPILE_OPTIONS)}. "
+            "Example: --compile or --compile cuda-graphs"
+        ),
+    )
+    parser.add_argument(
+        "--skip-frozen-tokens",
+        action="store_true",
+        help=(
+            "Exclude conditioning tokens that are not denoised (denoise mask 0, e.g. image or keyframe "
+            "conditionings) from the transformer queries and feed-forward after the first step; their keys and "
+            "values are computed once and reused. Faster, but approximates the full forward. Cannot be combined with "
+            "--compile."
+        ),
+    )
+    parser.add_argument(
+        "--shared-registry",
+        action="store_true",
+        help=(
+            "Load checkpoint weights through the process-wide weight registry, so that the ledgers of all stages "
+            "read each component from disk once and keep it in CPU memory (budget: $LTX_REGISTRY_MAX_GB, default "
+            "half of the physical memory). Models are then built from the CPU copy and without the fused Q/K/V "
+            "projection, so each build is slower and attention runs three projections."
+        ),
+    )
     return parser
 
 
@@ -1,9 +1,8 @@
 import logging
 from dataclasses import dataclass, field, replace
 
-from safetensors import safe_open
-
 from ltx_core.components.guiders import MultiModalGuiderParams
+from ltx_core.loader.checkpoint_index import read_checkpoint_header
 from ltx_core.types import SpatioTemporalScaleFactors
 
 # =============================================================================
@@ -97,6 +96,9 @@ DEFAULT_LORA_STRENGTH = 1.0
 DEFAULT_IMAGE_CRF = 33
 VIDEO_SCALE_FACTORS = SpatioTemporalScaleFactors.default()
 VIDEO_LATENT_CHANNELS = 128
+# Latent frames decoded past the first frame of a pipeline preview. Far fewer than the look-ahead of the video
+# decoder, so the preview is approximate but cheap, see ltx_core.model.video_vae.decode_video_preview.
+PREVIEW_LOOK_AHEAD_IN_LATENTS = 2
 
 _LTX_2_3_MODEL_VERSION_PREFIX = "2.3"
 
@@ -110,9 +112,7 @@ def detect_params(checkpoint_path: str) -> PipelineParams:
     logger = logging.getLogger(__name__)
 
     try:
-        with safe_open(checkpoint_path, framework="pt") as f:
-            metadata = f.metadata() or {}
-        version = metadata.get("model_version", "")
+        version = read_checkpoint_header(checkpoint_path).metadata.get("model_version", "")
     except Exception:
         logger.warning("Could not read checkpoint metadata from %s, using LTX-2 defaults", checkpoint_path)
         return LTX_2_PARAMS
@@ -25,7 +25,7 @@ from ltx_core.text_encoders.gemma.embeddings_processor import EmbeddingsProcesso
 from ltx_core.tools import AudioLatentTools, LatentTools, VideoLatentTools
 from ltx_core.types import AudioLatentShape, LatentState, VideoLatentShape, VideoPixelShape
 from ltx_pipelines.utils.args import ImageConditioningInput
-from ltx_pipelines.utils.media_io import decode_image, load_image_conditioning, resize_aspect_ratio_preserving
+from ltx_pipelines.utils.media_io import decode_image, load_image_conditionings, resize_aspect_ratio_preserving
 from ltx_pipelines.utils.types import (
     DenoisingFunc,
     DenoisingLoopFunc,
@@ -54,11 +54,12 @@ def encode_prompts(
     enhance_first_prompt: bool = False,
 ) -> list[EmbeddingsProcessorOutput]:
     """Encode prompts through Gemma → embeddings processor, freeing each after use.
-    Loads the text encoder from *model_ledger*, optionally enhances the first
-    prompt, encodes all *prompts*, frees the text encoder, then loads the
-    embeddings processor to produce the final outputs.  Because the text encoder
-    is loaded and freed entirely within this function, there are no lingering
-    references that could prevent GPU memory reclamation.
+    Loads the text encoder from *model_ledger* (text-only unless the first prompt
+    is enhanced), optionally enhances the first prompt, encodes all *prompts*,
+    frees the text encoder, then loads the embeddings processor to produce the
+    final outputs.  Because the text encoder is loaded and freed entirely within
+    this function, there are no lingering references that could prevent GPU
+    memory reclamation.
     Args:
         prompts: Text prompts to encode.
         model_ledger: ModelLedger instance (used to load text encoder and embeddings processor).
@@ -68,7 +69,8 @@ def encode_prompts(
     Returns:
         List of EmbeddingsProcessorOutput, one per prompt.
     """
-    text_encoder = model_ledger.text_encoder()
+    # Enhancement generates text (and may look at the image), plain encoding needs only the language model
+    text_encoder = model_ledger.text_encoder(text_only=not enhance_first_prompt)
     if enhance_first_prompt:
         prompts = list(prompts)
         prompts[0] = generate_enhanced_prompt(text_encoder, prompts[0], enhance_prompt_image, seed=enhance_prompt_seed)
@@ -86,6 +88,30 @@ def encode_prompts(
     return results
 
 
+def encode_images(
+    images: list[ImageConditioningInput],
+    height: int,
+    width: int,
+    video_encoder: VideoEncoder,
+    dtype: torch.dtype,
+    device: torch.device,
+) -> list[torch.Tensor]:
+    """Encode conditioning images at ``height`` x ``width`` in one batched forward of the video encoder.
+    Images are decoded and preprocessed on a pool of threads. Inside an
+    :func:`~ltx_pipelines.utils.media_io.image_decode_cache` block, as in the pipelines, the decoded pixels are
+    kept, so encoding the same images at the resolution of another stage only resizes them."""
+    if not images:
+        return []
+    pixels = load_image_conditionings(
+        images=[(img.path, img.crf) for img in images],
+        height=height,
+        width=width,
+        dtype=dtype,
+        device=device,
+    )
+    return list(video_encoder(pixels).split(1))
+
+
 def combined_image_conditionings(
     images: list[ImageConditioningInput],
     height: int,
@@ -97,16 +123,8 @@ def combined_image_conditionings(
     """Create a list of conditionings by replacing the latent at the first frame with the encoded image if present
     and using other encoded images as the keyframe conditionings."""
     conditionings = []
-    for img in images:
-        image = load_image_conditioning(
-            image_path=img.path,
-            height=height,
-            width=width,
-            dtype=dtype,
-            device=device,
-            crf=img.crf,
-        )
-        encoded_image = video_encoder(image)
+    encoded_images = encode_images(images, height, width, video_encoder, dtype, device)
+    for img, encoded_image in zip(images, encoded_images, strict=True):
         if img.frame_idx == 0:
             conditioning = VideoConditionByLatentIndex(
                 latent=encoded_image,
@@ -132,16 +150,8 @@ def image_conditionings_by_replacing_latent(
     device: torch.device,
 ) -> list[ConditioningItem]:
     conditionings = []
-    for img in images:
-        image = load_image_conditioning(
-            image_path=img.path,
-            height=height,
-            width=width,
-            dtype=dtype,
-            device=device,
-            crf=img.crf,
-        )
-        encoded_image = video_encoder(image)
+    encoded_images = encode_images(images, height, width, video_encoder, dtype, device)
+    for img, encoded_image in zip(images, encoded_images, strict=True):
         conditionings.append(
             VideoConditionByLatentIndex(
                 latent=encoded_image,
@@ -162,16 +172,8 @@ def image_conditionings_by_adding_guiding_latent(
     device: torch.device,
 ) -> list[ConditioningItem]:
     conditionings = []
-    for img in images:
-        image = load_image_conditioning(
-            image_path=img.path,
-            height=height,
-            width=width,
-            dtype=dtype,
-            device=device,
-            crf=img.crf,
-        )
-        encoded_image = video_encoder(image)
+    encoded_images = encode_images(images, height, width, video_encoder, dtype, device)
+    for img, encoded_image in zip(images, encoded_images, strict=True):
         conditionings.append(
             VideoConditionByKeyframeIndex(keyframes=encoded_image, frame_idx=img.frame_idx, strength=img.strength)
         )
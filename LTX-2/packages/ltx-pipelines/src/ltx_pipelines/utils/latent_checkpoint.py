@@ -0,0 +1,181 @@
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import safetensors
+import safetensors.torch
+import torch
+
+from ltx_core.components.guiders import (
+    MultiModalGuiderFactory,
+    MultiModalGuiderParams,
+    create_multimodal_guider_factory,
+)
+from ltx_core.loader import LoraPathStrengthAndSDOps
+from ltx_core.quantization import QuantizationPolicy
+from ltx_core.types import LatentState
+
+logger = logging.getLogger(__name__)
+
+LATENT_CHECKPOINT_FORMAT_VERSION = 1
+_LATENT_STATE_FIELDS = ("latent", "denoise_mask", "positions", "clean_latent")
+
+
+class ResumePoint(Enum):
+    """Point of a two-stage pipeline a :class:`LatentCheckpoint` can resume from, in pipeline order."""
+
+    AFTER_STAGE_1 = "after_stage_1"
+    AFTER_UPSAMPLE = "after_upsample"
+    AFTER_STAGE_2 = "after_stage_2"
+
+
+@dataclass
+class LatentCheckpoint:
+    """
+    Intermediate results of a pipeline job, kept in one ``.safetensors`` file: the latent states after each stage,
+    the prompt contexts and the state of the random generator at each :class:`ResumePoint`. A job resumes after
+    its last completed stage when it is run again, and a finished job can be decoded again with other settings
+    without denoising again.
+    Every :meth:`save` rewrites the file with all results so far. Latents are small compared to the decoded video,
+    so this takes a fraction of a second.
+    Attributes:
+        path: Path of the checkpoint file.
+        params: JSON-serializable job parameters the results depend on. A file saved with other parameters is
+            not resumed.
+        resume_points: Points saved so far, in pipeline order.
+        tensors: Saved tensors by name, on the host.
+    """
+
+    path: Path
+    params: dict[str, Any]
+    resume_points: list[ResumePoint] = field(default_factory=list)
+    tensors: dict[str, torch.Tensor] = field(default_factory=dict)
+
+    @classmethod
+    def open(cls, path: str | Path, params: dict[str, Any]) -> "LatentCheckpoint":
+        """
+        Load the checkpoint at ``path``, or start an empty one if there is no file yet.
+        Raises:
+            ValueError: If the file has another format version or was saved with other ``params``.
+        """
+        path = Path(path)
+        # Round trip through JSON so that tuples compare equal to the lists they are loaded as
+        params = json.loads(json.dumps(params))
+        if not path.exists():
+            return cls(path=path, params=params)
+
+        with safetensors.safe_open(str(path), framework="pt") as f:
+            metadata = f.metadata() or {}
+            tensors = {key: f.get_tensor(key) for key in f.keys()}  # noqa: SIM118
+        if metadata.get("format_version") != str(LATENT_CHECKPOINT_FORMAT_VERSION):
+            raise ValueError(f"Unsupported latent checkpoint format in {path}")
+        saved_params = json.loads(metadata["params"])
+        if saved_params != params:
+            changed = sorted(
+                key for key in saved_params.keys() | params.keys() if saved_params.get(key) != params.get(key)
+            )
+            raise ValueError(f"Latent checkpoint {path} was saved with other parameters: {', '.join(changed)}")
+
+        resume_points = [ResumePoint(point) for point in json.loads(metadata["resume_points"])]
+        logger.info(f"Loaded latent checkpoint {path} ({', '.join(point.value for point in resume_points)})")
+        return cls(path=path, params=params, resume_points=resume_points, tensors=tensors)
+
+    def resume_point(self, requested: ResumePoint | None = None) -> ResumePoint | None:
+        """
+        Point to resume from: ``requested``, or the last saved point if it is None. None means that the job runs
+        from the start.
+        Raises:
+            ValueError: If ``requested`` was not saved.
+        """
+        if requested is None:
+            return self.resume_points[-1] if self.resume_points else None
+        if requested not in self.resume_points:
+            saved = ", ".join(point.value for point in self.resume_points) or "none"
+            raise ValueError(f"Cannot resume {self.path} from {requested.value}, saved points: {saved}")
+        return requested
+
+    def save(
+        self,
+        point: ResumePoint,
+        generator: torch.Generator | None = None,
+        **entries: LatentState | torch.Tensor | None,
+    ) -> None:
+        """
+        Record the results of ``point`` and rewrite the file. Latent states are stored field by field as
+        ``<name>.<field>``, tensors as ``<name>``, and None entries are skipped. The state of ``generator`` is
+        stored with the point, so that a resumed job draws the same noise as an uninterrupted one. Points after
+        ``point`` are dropped, since their results came from an earlier run of this one.
+        """
+        for name, value in entries.items():
+            if isinstance(value, LatentState):
+                self._put_state(name, value)
+            elif value is not None:
+                self.tensors[name] = _to_host(value)
+        if generator is not None:
+            self.tensors[f"{point.value}.generator_state"] = generator.get_state()
+
+        order = list(ResumePoint)
+        earlier_points = [saved for saved in self.resume_points if order.index(saved) < order.index(point)]
+        self.resume_points = [*earlier_points, point]
+        self._write()
+        logger.info(f"Saved latent checkpoint {self.path} ({point.value})")
+
+    def state(self, name: str, device: torch.device) -> LatentState:
+        """Latent state saved as ``name``, on ``device``."""
+        return LatentState(**{key: self.tensors[f"{name}.{key}"].to(device) for key in _LATENT_STATE_FIELDS})
+
+    def tensor(self, name: str, device: torch.device) -> torch.Tensor | None:
+        """Tensor saved as ``name`` on ``device``, or None if it was not saved."""
+        value = self.tensors.get(name)
+        return value.to(device) if value is not None else None
+
+    def restore_generator(self, point: ResumePoint, generator: torch.Generator) -> None:
+        """Set ``generator`` to its state at ``point``, if it was saved."""
+        state = self.tensors.get(f"{point.value}.generator_state")
+        if state is not None:
+            generator.set_state(state)
+
+    def _put_state(self, name: str, state: LatentState) -> None:
+        # Stage outputs have their conditioning cleared, which also drops the attention mask
+        if state.attention_mask is not None:
+            raise ValueError(f"Latent state {name!r} has an attention mask, save it before conditioning instead")
+        for key in _LATENT_STATE_FIELDS:
+            self.tensors[f"{name}.{key}"] = _to_host(getattr(state, key))
+
+    def _write(self) -> None:
+        metadata = {
+            "format_version": str(LATENT_CHECKPOINT_FORMAT_VERSION),
+            "params": json.dumps(self.params, sort_keys=True),
+            "resume_points": json.dumps([point.value for point in self.resume_points]),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        safetensors.torch.save_file(self.tensors, str(tmp_path), metadata=metadata)
+        tmp_path.replace(self.path)
+
+
+def guider_params_json(params: MultiModalGuiderParams | MultiModalGuiderFactory) -> list:
+    """Guider params as (sigma upper bound, params) bins in JSON form, for :attr:`LatentCheckpoint.params`."""
+    factory = create_multimodal_guider_factory(params)
+    return [[sigma, asdict(bin_params)] for sigma, bin_params in factory.params_by_sigma]
+
+
+def loras_json(loras: tuple[LoraPathStrengthAndSDOps, ...]) -> list:
+    """LoRA paths, strengths and state dict ops in JSON form, for :attr:`LatentCheckpoint.params`."""
+    return [[lora.path, lora.strength, lora.sd_ops.name if lora.sd_ops is not None else None] for lora in loras]
+
+
+def quantization_json(policy: QuantizationPolicy | None) -> list | None:
+    """Names of the state dict and module ops of a quantization policy, for :attr:`LatentCheckpoint.params`."""
+    if policy is None:
+        return None
+    return [policy.sd_ops.name if policy.sd_ops is not None else None, [ops.name for ops in policy.module_ops]]
+
+
+def _to_host(tensor: torch.Tensor) -> torch.Tensor:
+    # A copy, so that views of a larger tensor are saved without the rest of its storage
+    return tensor.detach().to("cpu", copy=True).contiguous()
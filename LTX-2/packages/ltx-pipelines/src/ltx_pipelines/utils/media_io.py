@@ -1,8 +1,12 @@
 import logging
 import math
 from collections.abc import Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from fractions import Fraction
 from io import BytesIO
+from pathlib import Path
 
 import av
 import numpy as np
@@ -17,6 +21,13 @@ from ltx_pipelines.utils.constants import DEFAULT_IMAGE_CRF
 
 logger = logging.getLogger(__name__)
 
+# Threads decoding and re-encoding conditioning images; PIL and libav release the GIL while they work
+IMAGE_DECODE_WORKERS = 8
+# Long side of preview images and animations, in pixels
+PREVIEW_MAX_SIZE = 512
+# Images decoded inside the current image_decode_cache block, by path and CRF
+_decoded_images: ContextVar[dict[tuple[str, int], np.ndarray] | None] = ContextVar("decoded_images", default=None)
+
 
 def resize_aspect_ratio_preserving(image: torch.Tensor, long_side: int) -> torch.Tensor:
     """
@@ -91,12 +102,70 @@ def load_image_conditioning(
     Loads an image from a path and preprocesses it for conditioning.
     Note: The image is resized to the nearest multiple of 2 for compatibility with video codecs.
     """
-    image = decode_image(image_path=image_path)
-    image = preprocess(image=image, crf=crf)
-    image = torch.tensor(image, dtype=torch.float32, device=device)
-    image = resize_and_center_crop(image, height, width)
-    image = normalize_latent(image, device, dtype)
-    return image
+    return load_image_conditionings([(image_path, crf)], height, width, dtype, device)
+
+
+def load_image_conditionings(
+    images: list[tuple[str, int]],
+    height: int,
+    width: int,
+    dtype: torch.dtype,
+    device: torch.device,
+) -> torch.Tensor:
+    """
+    Loads images from (path, crf) pairs and preprocesses them for conditioning, see :func:`load_image_conditioning`.
+    Images are decoded and preprocessed by :func:`decode_and_preprocess_images`, so inside an
+    :func:`image_decode_cache` block loading the same images at another resolution only resizes the pixels
+    decoded the first time.
+    Returns:
+        Tensor with shape (len(images), C, 1, height, width)
+    """
+    pixels = decode_and_preprocess_images(images)
+    resized = [
+        resize_and_center_crop(torch.tensor(image, dtype=torch.float32, device=device), height, width)
+        for image in pixels
+    ]
+    return normalize_latent(torch.cat(resized), device, dtype)
+
+
+def decode_and_preprocess_images(images: list[tuple[str, int]]) -> list[np.ndarray]:
+    """
+    Decodes images from (path, crf) pairs and applies :func:`preprocess`, on a pool of threads.
+    Inside an :func:`image_decode_cache` block the results are kept until the block exits, so the stages of a
+    pipeline call share them; the returned arrays are then shared with the cache and must not be modified.
+    """
+    cache = _decoded_images.get()
+    decoded = cache if cache is not None else {}
+    missing = [key for key in dict.fromkeys(images) if key not in decoded]
+    if len(missing) <= 1:
+        decoded.update((key, _decode_and_preprocess_image(*key)) for key in missing)
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(len(missing), IMAGE_DECODE_WORKERS), thread_name_prefix="image-decoder"
+        ) as pool:
+            decoded.update(zip(missing, pool.map(lambda key: _decode_and_preprocess_image(*key), missing), strict=True))
+    return [decoded[key] for key in images]
+
+
+@contextmanager
+def image_decode_cache() -> Iterator[None]:
+    """
+    Keep the images decoded by :func:`decode_and_preprocess_images` until the block exits, so that the stages of
+    one pipeline call decode each conditioning image once. Nested blocks share the outermost cache. Also usable
+    as a decorator of a pipeline's ``__call__``.
+    """
+    if _decoded_images.get() is not None:
+        yield
+        return
+    token = _decoded_images.set({})
+    try:
+        yield
+    finally:
+        _decoded_images.reset(token)
+
+
+def _decode_and_preprocess_image(image_path: str, crf: int) -> np.ndarray:
+    return preprocess(image=decode_image(image_path=image_path), crf=crf)
 
 
 def load_video_conditioning(
@@ -121,8 +190,9 @@ def decode_image(image_path: str) -> np.ndarray:
     return np_array
 
 
-def _write_audio(container: av.container.Container, audio_stream: av.audio.AudioStream, audio: Audio) -> None:
-    samples = audio.waveform
+def _stereo_samples(waveform: torch.Tensor) -> torch.Tensor:
+    """Reshape a mono or stereo waveform to interleaved stereo samples of shape (samples, 2)."""
+    samples = waveform
     if samples.ndim == 1:
         samples = samples[:, None]
 
@@ -131,20 +201,7 @@ def _write_audio(container: av.container.Container, audio_stream: av.audio.Audio
 
     if samples.shape[1] != 2:
         raise ValueError(f"Expected samples with 2 channels; got shape {samples.shape}.")
-
-    # Convert to int16 packed for ingestion; resampler converts to encoder fmt.
-    if samples.dtype != torch.int16:
-        samples = torch.clip(samples, -1.0, 1.0)
-        samples = (samples * 32767.0).to(torch.int16)
-
-    frame_in = av.AudioFrame.from_ndarray(
-        samples.contiguous().reshape(1, -1).cpu().numpy(),
-        format="s16",
-        layout="stereo",
-    )
-    frame_in.sample_rate = audio.sampling_rate
-
-    _resample_audio(container, audio_stream, frame_in)
+    return samples
 
 
 def _prepare_audio_stream(container: av.container.Container, audio_sample_rate: int) -> av.audio.AudioStream:
@@ -158,42 +215,108 @@ def _prepare_audio_stream(container: av.container.Container, audio_sample_rate:
     return audio_stream
 
 
-def _resample_audio(
-    container: av.container.Container, audio_stream: av.audio.AudioStream, frame_in: av.AudioFrame
-) -> None:
-    cc = audio_stream.codec_context
-
-    # Use the encoder's format/layout/rate as the *target*
-    target_format = cc.format or "fltp"  # AAC → usually fltp
-    target_layout = cc.layout or "stereo"
-    target_rate = cc.sample_rate or frame_in.sample_rate
-
-    audio_resampler = av.audio.resampler.AudioResampler(
-        format=target_format,
-        layout=target_layout,
-        rate=target_rate,
-    )
-
-    audio_next_pts = 0
-    for rframe in audio_resampler.resample(frame_in):
-        if rframe.pts is None:
-            rframe.pts = audio_next_pts
-        audio_next_pts += rframe.samples
-        rframe.sample_rate = frame_in.sample_rate
-        container.mux(audio_stream.encode(rframe))
-
-    # flush audio encoder
-    for packet in audio_stream.encode():
-        container.mux(packet)
+class _AudioMuxer:
+    """
+    Encodes audio into a container piece by piece, so that audio packets are interleaved with the video packets.
+    Pieces stay on their device: each slice that is encoded is converted to int16 there, and only that int16 slice
+    is copied to the host and resampled to the encoder's format with a single resampler. The host never holds the
+    whole waveform, in float or in int16.
+    """
+
+    def __init__(self, container: av.container.Container, audio: Audio | Iterator[Audio]) -> None:
+        self._container = container
+        self._pieces = iter([audio]) if isinstance(audio, Audio) else audio
+        first_piece = next(self._pieces, None)
+        if first_piece is None:
+            raise ValueError("Expected at least one piece of audio.")
+        self.sampling_rate = first_piece.sampling_rate
+        self._pending = _stereo_samples(first_piece.waveform)
+        self._stream = _prepare_audio_stream(container, self.sampling_rate)
+
+        # Use the encoder's format/layout/rate as the *target*
+        cc = self._stream.codec_context
+        self._resampler = av.audio.resampler.AudioResampler(
+            format=cc.format or "fltp",  # AAC → usually fltp
+            layout=cc.layout or "stereo",
+            rate=cc.sample_rate or self.sampling_rate,
+        )
+        self._written_samples = 0
+        self._next_pts = 0
+
+    def write_until(self, seconds: float) -> None:
+        """Encode the audio up to ``seconds`` from its start, or as much of it as there is."""
+        target_samples = round(seconds * self.sampling_rate)
+        while self._pending is not None and self._written_samples < target_samples:
+            samples = self._pending[: target_samples - self._written_samples]
+            self._encode(samples)
+            self._pending = self._pending[samples.shape[0] :]
+            if self._pending.shape[0] == 0:
+                self._pending = self._next_piece()
+
+    def close(self) -> None:
+        """Encode the rest of the audio and flush the resampler and the encoder."""
+        while self._pending is not None:
+            self._encode(self._pending)
+            self._pending = self._next_piece()
+        self._mux(self._resampler.resample(None))
+        for packet in self._stream.encode():
+            self._container.mux(packet)
+
+    def _next_piece(self) -> torch.Tensor | None:
+        for piece in self._pieces:
+            if piece.sampling_rate != self.sampling_rate:
+                raise ValueError(
+                    f"Expected audio sampled at {self.sampling_rate} Hz throughout; got {piece.sampling_rate} Hz."
+                )
+            samples = _stereo_samples(piece.waveform)
+            if samples.shape[0] > 0:
+                return samples
+        return None
+
+    def _encode(self, samples: torch.Tensor) -> None:
+        # Convert to int16 packed on the samples' device and copy only that; resampler converts to encoder fmt.
+        if samples.dtype != torch.int16:
+            samples = (samples.clamp(-1.0, 1.0) * 32767.0).to(torch.int16)
+
+        frame_in = av.AudioFrame.from_ndarray(
+            samples.contiguous().cpu().reshape(1, -1).numpy(),
+            format="s16",
+            layout="stereo",
+        )
+        frame_in.sample_rate = self.sampling_rate
+        frame_in.pts = self._written_samples
+        self._written_samples += samples.shape[0]
+        self._mux(self._resampler.resample(frame_in))
+
+    def _mux(self, frames: list[av.AudioFrame]) -> None:
+        for rframe in frames:
+            rframe.pts = self._next_pts
+            self._next_pts += rframe.samples
+            self._container.mux(self._stream.encode(rframe))
 
 
 def encode_video(
     video: torch.Tensor | Iterator[torch.Tensor],
     fps: int,
-    audio: Audio | None,
+    audio: Audio | Iterator[Audio] | None,
     output_path: str,
-    video_chunks_number: int,
+    video_chunks_number: int | None,
+    faststart: bool = False,
 ) -> None:
+    """
+    Encode video frames, and audio if given, into a file.
+    Audio is encoded as the video frames are written, up to the time of the last frame, so that the packets of
+    both streams are interleaved in the file and audio encoding overlaps with the production of the video chunks.
+    Audio beyond the last video frame is written at the end.
+    Args:
+        video: Frames [f, h, w, c] as uint8, in one tensor or as chunks.
+        fps: Frame rate of the video.
+        audio: Audio to mux with the video, in one piece or as consecutive pieces with the same sampling rate.
+        output_path: Path of the output file.
+        video_chunks_number: Number of video chunks, for the progress bar, or None if unknown.
+        faststart: Move the index of an MP4 file to its start, so that playback can start before the whole file is
+            downloaded. This rewrites the file once it is complete.
+    """
     if isinstance(video, torch.Tensor):
         video = iter([video])
 
@@ -201,14 +324,13 @@ def encode_video(
 
     _, height, width, _ = first_chunk.shape
 
-    container = av.open(output_path, mode="w")
+    container = av.open(output_path, mode="w", options={"movflags": "+faststart"} if faststart else None)
     stream = container.add_stream("libx264", rate=int(fps))
     stream.width = width
     stream.height = height
     stream.pix_fmt = "yuv420p"
 
-    if audio is not None:
-        audio_stream = _prepare_audio_stream(container, audio.sampling_rate)
+    audio_muxer = _AudioMuxer(container, audio) if audio is not None else None
 
     def all_tiles(
         first_chunk: torch.Tensor, tiles_generator: Generator[tuple[torch.Tensor, int], None, None]
@@ -216,24 +338,71 @@ def encode_video(
         yield first_chunk
         yield from tiles_generator
 
+    frames_written = 0
     for video_chunk in tqdm(all_tiles(first_chunk, video), total=video_chunks_number):
         video_chunk_cpu = video_chunk.to("cpu").numpy()
         for frame_array in video_chunk_cpu:
             frame = av.VideoFrame.from_ndarray(frame_array, format="rgb24")
             for packet in stream.encode(frame):
                 container.mux(packet)
+            frames_written += 1
+            if audio_muxer is not None:
+                audio_muxer.write_until(frames_written / fps)
 
     # Flush encoder
     for packet in stream.encode():
         container.mux(packet)
 
-    if audio is not None:
-        _write_audio(container, audio_stream, audio)
+    if audio_muxer is not None:
+        audio_muxer.close()
 
     container.close()
     logger.info(f"Video saved to {output_path}")
 
 
+def write_preview(
+    frames: torch.Tensor,
+    output_path: str,
+    fps: float,
+    frame_stride: int = 1,
+    max_size: int | None = PREVIEW_MAX_SIZE,
+) -> None:
+    """
+    Write decoded frames as a preview: the first frame as a still image for ``.jpg``, ``.jpeg`` and ``.png``, or
+    every ``frame_stride``-th frame as a looping animation for ``.gif`` and ``.webp`` (a still image when there is
+    only one such frame).
+    Args:
+        frames: Frames [f, h, w, c] as uint8, e.g. from :func:`~ltx_core.model.video_vae.decode_video_preview`.
+        output_path: Path of the output file, whose suffix selects the format.
+        fps: Frame rate of ``frames``; the animation plays at the same speed.
+        frame_stride: Step between the frames of the animation.
+        max_size: Long side the frames are downscaled to, or None to keep their size.
+    """
+    suffix = Path(output_path).suffix.lower()
+    if suffix in (".jpg", ".jpeg", ".png"):
+        frames = frames[:1]
+    elif suffix not in (".gif", ".webp"):
+        raise ValueError(f"Unsupported preview format {suffix!r}, expected .jpg, .jpeg, .png, .gif or .webp")
+
+    images = [Image.fromarray(frame) for frame in frames[::frame_stride].to("cpu").numpy()]
+    if max_size is not None:
+        for image in images:
+            image.thumbnail((max_size, max_size))
+
+    first_image, *other_images = images
+    if other_images:
+        first_image.save(
+            output_path,
+            save_all=True,
+            append_images=other_images,
+            duration=round(1000 * frame_stride / fps),
+            loop=0,
+        )
+    else:
+        first_image.save(output_path)
+    logger.info(f"Preview saved to {output_path}")
+
+
 _INT_FORMAT_MAX: dict[str, float] = {
     "u8": 128.0,
     "u8p": 128.0,
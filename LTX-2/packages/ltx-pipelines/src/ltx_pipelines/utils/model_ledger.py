@@ -2,7 +2,7 @@ from dataclasses import replace
 
 import torch
 
-from ltx_core.loader import SDOps
+from ltx_core.loader import FusedLoraCache, SDOps, fused_lora_cache_from_env
 from ltx_core.loader.primitives import LoraPathStrengthAndSDOps
 from ltx_core.loader.registry import DummyRegistry, Registry
 from ltx_core.loader.single_gpu_model_builder import SingleGPUModelBuilder as Builder
@@ -18,7 +18,12 @@ from ltx_core.model.audio_vae import (
     VocoderConfigurator,
 )
 from ltx_core.model.transformer import (
+    FUSED_QKV_MODULE_OPS,
     LTXV_MODEL_COMFY_RENAMING_MAP,
+    CompileConfig,
+    CompiledX0Model,
+    FrozenTokenCache,
+    LTXModel,
     LTXModelConfigurator,
     X0Model,
 )
@@ -26,6 +31,9 @@ from ltx_core.model.upsampler import LatentUpsampler, LatentUpsamplerConfigurato
 from ltx_core.model.video_vae import (
     VAE_DECODER_COMFY_KEYS_FILTER,
     VAE_ENCODER_COMFY_KEYS_FILTER,
+    VAE_PER_CHANNEL_STATISTICS_KEYS_FILTER,
+    PerChannelStatistics,
+    PerChannelStatisticsConfigurator,
     VideoDecoder,
     VideoDecoderConfigurator,
     VideoEncoder,
@@ -36,6 +44,8 @@ from ltx_core.text_encoders.gemma import (
     EMBEDDINGS_PROCESSOR_KEY_OPS,
     GEMMA_LLM_KEY_OPS,
     GEMMA_MODEL_OPS,
+    GEMMA_TEXT_ONLY_KEY_OPS,
+    GEMMA_TEXT_ONLY_MODEL_OPS,
     EmbeddingsProcessor,
     EmbeddingsProcessorConfigurator,
     GemmaTextEncoder,
@@ -60,7 +70,8 @@ class ModelLedger:
         Models are **not cached**. Each call to a model method creates a new instance.
         Callers are responsible for storing references to models they wish to reuse
         and for freeing GPU memory (e.g. by deleting references and calling
-        ``torch.cuda.empty_cache()``).
+        ``torch.cuda.empty_cache()``). The only exception is :meth:`video_latent_statistics`,
+        which is a pair of vectors and is built once per ledger.
     ### Constructor parameters
     dtype:
         Torch dtype used when constructing all models (e.g. ``torch.bfloat16``).
@@ -82,18 +93,41 @@ class ModelLedger:
         Tuple of LoRA configurations (path, strength, sd_ops) applied on top of the base
         transformer weights. Use ``()`` for none.
     registry:
-        Optional :class:`Registry` instance for weight caching across builders.
-        Defaults to :class:`DummyRegistry` which performs no cross-builder caching.
+        Optional :class:`Registry` instance for weight caching across builders. Defaults to
+        :class:`DummyRegistry`, which loads every model straight to ``device`` without caching. Pass the
+        process-wide :func:`~ltx_core.loader.registry.shared_registry` so that ledgers of different
+        pipelines in one process load a checkpoint once, within its RAM budget; models are then built
+        from a CPU copy of the weights. With a caching registry the transformer is built without the fused
+        Q/K/V projection (:data:`~ltx_core.model.transformer.FUSED_QKV_MODULE_OPS`): fusing concatenates the
+        weights into new tensors, which would keep a second copy of every attention projection next to the
+        registry's. Pipelines take the registry as their ``registry`` argument (``--shared-registry`` on the
+        command line).
     quantization:
         Optional :class:`QuantizationPolicy` controlling how transformer weights
         are stored and how matmul is executed. Defaults to None, which means no quantization.
+    compile_config:
+        Optional :class:`~ltx_core.model.transformer.CompileConfig`. When set, :meth:`transformer`
+        returns a :class:`~ltx_core.model.transformer.CompiledX0Model` that runs the denoising step
+        through ``torch.compile`` (and optionally CUDA graphs). Cannot be combined with
+        ``skip_frozen_tokens``. Defaults to None (eager).
+    skip_frozen_tokens:
+        When True, the transformer runs conditioning tokens with zero denoise strength only as
+        keys/values cached on the first step (see :class:`~ltx_core.model.transformer.FrozenTokenCache`).
+        Faster for image, keyframe and retake conditionings, but approximate. Cannot be combined with
+        ``compile_config``: the cache's bookkeeping has data-dependent shapes and Python state, and CUDA graph
+        replays would overwrite the cached keys/values. Defaults to False.
+    fused_lora_cache:
+        Optional :class:`~ltx_core.loader.FusedLoraCache` that stores the transformer weights with the
+        LoRAs fused in, so later builds with the same checkpoint, LoRAs, strengths, dtype and
+        quantization read them instead of fusing again. Defaults to
+        :func:`~ltx_core.loader.fused_lora_cache_from_env` (enabled by ``$LTX_FUSED_LORA_CACHE_GB``).
     ### Creating Variants
     Use :meth:`with_additional_loras` to create a new ``ModelLedger`` instance that
     includes additional LoRA configurations or :meth:`with_loras` to replace existing
     lora configurations while sharing the same registry for weight caching.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913, PLR0917
         self,
         dtype: torch.dtype,
         device: torch.device,
@@ -103,15 +137,27 @@ class ModelLedger:
         loras: tuple[LoraPathStrengthAndSDOps, ...] = (),
         registry: Registry | None = None,
         quantization: QuantizationPolicy | None = None,
+        compile_config: CompileConfig | None = None,
+        skip_frozen_tokens: bool = False,
+        fused_lora_cache: FusedLoraCache | None = None,
     ):
+        if skip_frozen_tokens and compile_config is not None:
+            raise ValueError(
+                "skip_frozen_tokens cannot be combined with compile_config: the frozen token cache cannot run "
+                "inside torch.compile"
+            )
         self.dtype = dtype
         self.device = device
         self.checkpoint_path = checkpoint_path
         self.gemma_root_path = gemma_root_path
         self.spatial_upsampler_path = spatial_upsampler_path
         self.loras = loras
-        self.registry = registry or DummyRegistry()
+        self.registry = registry if registry is not None else DummyRegistry()
         self.quantization = quantization
+        self.compile_config = compile_config
+        self.skip_frozen_tokens = skip_frozen_tokens
+        self.fused_lora_cache = fused_lora_cache if fused_lora_cache is not None else fused_lora_cache_from_env()
+        self._video_latent_statistics: PerChannelStatistics | None = None
         self.build_model_builders()
 
     def build_model_builders(self) -> None:
@@ -120,8 +166,12 @@ class ModelLedger:
                 model_path=self.checkpoint_path,
                 model_class_configurator=LTXModelConfigurator,
                 model_sd_ops=LTXV_MODEL_COMFY_RENAMING_MAP,
+                # Fusion concatenates the Q/K/V weights into new tensors, which would double the attention
+                # weights while a caching registry keeps the originals alive
+                module_ops=(FUSED_QKV_MODULE_OPS,) if isinstance(self.registry, DummyRegistry) else (),
                 loras=tuple(self.loras),
                 registry=self.registry,
+                fused_lora_cache=self.fused_lora_cache,
             )
 
             self.vae_decoder_builder = Builder(
@@ -138,6 +188,13 @@ class ModelLedger:
                 registry=self.registry,
             )
 
+            self.video_latent_statistics_builder = Builder(
+                model_path=self.checkpoint_path,
+                model_class_configurator=PerChannelStatisticsConfigurator,
+                model_sd_ops=VAE_PER_CHANNEL_STATISTICS_KEYS_FILTER,
+                registry=self.registry,
+            )
+
             self.audio_encoder_builder = Builder[AudioEncoder](
                 model_path=self.checkpoint_path,
                 model_class_configurator=AudioEncoderConfigurator,
@@ -179,6 +236,15 @@ class ModelLedger:
                     registry=self.registry,
                     module_ops=(GEMMA_MODEL_OPS, *module_ops),
                 )
+                self.text_only_encoder_builder = replace(
+                    self.text_encoder_builder,
+                    model_sd_ops=GEMMA_TEXT_ONLY_KEY_OPS,
+                    module_ops=(
+                        GEMMA_MODEL_OPS,
+                        *module_ops_from_gemma_root(self.gemma_root_path, text_only=True),
+                        GEMMA_TEXT_ONLY_MODEL_OPS,
+                    ),
+                )
 
         if self.spatial_upsampler_path is not None:
             self.upsampler_builder = Builder(
@@ -208,6 +274,9 @@ class ModelLedger:
             loras=loras,
             registry=self.registry,
             quantization=self.quantization,
+            compile_config=self.compile_config,
+            skip_frozen_tokens=self.skip_frozen_tokens,
+            fused_lora_cache=self.fused_lora_cache,
         )
 
     def transformer(self) -> X0Model:
@@ -218,23 +287,56 @@ class ModelLedger:
 
         if self.quantization is None:
             return (
-                X0Model(self.transformer_builder.build(device=self._target_device(), dtype=self.dtype))
+                self._x0_model(self.transformer_builder.build(device=self._target_device(), dtype=self.dtype))
                 .to(self.device)
                 .eval()
             )
         else:
-            sd_ops = self.transformer_builder.model_sd_ops
-            if self.quantization.sd_ops is not None:
-                sd_ops = SDOps(
-                    name=f"sd_ops_chain_{sd_ops.name}+{self.quantization.sd_ops.name}",
-                    mapping=(*sd_ops.mapping, *self.quantization.sd_ops.mapping),
-                )
-            builder = replace(
-                self.transformer_builder,
-                module_ops=(*self.transformer_builder.module_ops, *self.quantization.module_ops),
-                model_sd_ops=sd_ops,
+            builder = self._quantized_transformer_builder()
+            return self._x0_model(builder.build(device=self._target_device())).to(self.device).eval()
+
+    def _quantized_transformer_builder(self) -> Builder:
+        sd_ops = self.transformer_builder.model_sd_ops
+        if self.quantization.sd_ops is not None:
+            sd_ops = SDOps(
+                name=f"sd_ops_chain_{sd_ops.name}+{self.quantization.sd_ops.name}",
+                mapping=(*sd_ops.mapping, *self.quantization.sd_ops.mapping),
             )
-            return X0Model(builder.build(device=self._target_device())).to(self.device).eval()
+        return replace(
+            self.transformer_builder,
+            module_ops=(*self.transformer_builder.module_ops, *self.quantization.module_ops),
+            model_sd_ops=sd_ops,
+        )
+
+    def checkpoint_components(self) -> dict[str, tuple[SDOps, torch.dtype | None]]:
+        """
+        Components loaded from ``checkpoint_path``, with the ``sd_ops`` and dtype their builders load them
+        with, as expected by :func:`~ltx_core.loader.convert_checkpoint`.
+        """
+        if not hasattr(self, "transformer_builder"):
+            raise ValueError("No checkpoint path was provided to the ModelLedger constructor.")
+
+        if self.quantization is None:
+            transformer = (self.transformer_builder.model_sd_ops, self.dtype)
+        else:
+            transformer = (self._quantized_transformer_builder().model_sd_ops, None)
+        return {
+            "transformer": transformer,
+            "video_encoder": (self.vae_encoder_builder.model_sd_ops, self.dtype),
+            "video_decoder": (self.vae_decoder_builder.model_sd_ops, self.dtype),
+            "video_latent_statistics": (self.video_latent_statistics_builder.model_sd_ops, self.dtype),
+            "audio_encoder": (self.audio_encoder_builder.model_sd_ops, self.dtype),
+            "audio_decoder": (self.audio_decoder_builder.model_sd_ops, self.dtype),
+            "vocoder": (self.vocoder_builder.model_sd_ops, self.dtype),
+            "embeddings_processor": (self.embeddings_processor_builder.model_sd_ops, self.dtype),
+        }
+
+    def _x0_model(self, velocity_model: LTXModel) -> X0Model:
+        if self.skip_frozen_tokens:
+            velocity_model.set_frozen_token_cache(FrozenTokenCache())
+        if self.compile_config is None:
+            return X0Model(velocity_model)
+        return CompiledX0Model(velocity_model, self.compile_config)
 
     def video_decoder(self) -> VideoDecoder:
         if not hasattr(self, "vae_decoder_builder"):
@@ -252,14 +354,39 @@ class ModelLedger:
 
         return self.vae_encoder_builder.build(device=self._target_device(), dtype=self.dtype).to(self.device).eval()
 
-    def text_encoder(self) -> GemmaTextEncoder:
+    def video_latent_statistics(self) -> PerChannelStatistics:
+        """
+        Per-channel statistics of the video latents, built from just their keys in the checkpoint. Use it
+        instead of :meth:`video_encoder` to normalize or un-normalize latents (e.g. around the spatial
+        upsampler). It is built on the first call and reused by later ones.
+        """
+        if not hasattr(self, "video_latent_statistics_builder"):
+            raise ValueError(
+                "Video latent statistics not initialized. Please provide a checkpoint path to the ModelLedger "
+                "constructor."
+            )
+
+        if self._video_latent_statistics is None:
+            self._video_latent_statistics = (
+                self.video_latent_statistics_builder.build(device=self._target_device(), dtype=self.dtype)
+                .to(self.device)
+                .eval()
+            )
+        return self._video_latent_statistics
+
+    def text_encoder(self, text_only: bool = False) -> GemmaTextEncoder:
+        """
+        Build the Gemma text encoder. With ``text_only``, the vision tower, multi-modal projector and
+        ``lm_head`` are neither built nor loaded; the encoder can then encode prompts but not enhance them.
+        """
         if not hasattr(self, "text_encoder_builder"):
             raise ValueError(
                 "Text encoder not initialized. Please provide a checkpoint path and gemma root path to the "
                 "ModelLedger constructor."
             )
 
-        return self.text_encoder_builder.build(device=self._target_device(), dtype=self.dtype).to(self.device).eval()
+        builder = self.text_only_encoder_builder if text_only else self.text_encoder_builder
+        return builder.build(device=self._target_device(), dtype=self.dtype).to(self.device).eval()
 
     def gemma_embeddings_processor(self) -> EmbeddingsProcessor:
         if not hasattr(self, "embeddings_processor_builder"):
@@ -28,15 +28,11 @@ from rich.progress import (
 )
 from transformers.utils.logging import disable_progress_bar
 
-from ltx_core.model.video_vae import SpatialTilingConfig, TemporalTilingConfig, TilingConfig
+from ltx_core.model.video_vae import TilingConfig
 from ltx_trainer import logger
 from ltx_trainer.model_loader import load_audio_vae_decoder, load_video_vae_decoder, load_vocoder
 from ltx_trainer.video_utils import save_video
 
-DEFAULT_TILE_SIZE_PIXELS = 512  # Spatial tile size in pixels (must be ≥64 and divisible by 32)
-DEFAULT_TILE_OVERLAP_PIXELS = 128  # Spatial tile overlap in pixels (must be divisible by 32)
-DEFAULT_TILE_SIZE_FRAMES = 128  # Temporal tile size in frames (must be ≥16 and divisible by 8)
-DEFAULT_TILE_OVERLAP_FRAMES = 24  # Temporal tile overlap in frames (must be divisible by 8)
 
 disable_progress_bar()
 console = Console()
@@ -227,21 +223,11 @@ class LatentsDecoder:
     def _decode_video(self, latents: torch.Tensor, generator: torch.Generator | None = None) -> torch.Tensor:
         """Decode latents to video frames."""
         if self.vae_tiling:
-            # Use tiled decoding for reduced VRAM
-            tiling_config = TilingConfig(
-                spatial_config=SpatialTilingConfig(
-                    tile_size_in_pixels=DEFAULT_TILE_SIZE_PIXELS,
-                    tile_overlap_in_pixels=DEFAULT_TILE_OVERLAP_PIXELS,
-                ),
-                temporal_config=TemporalTilingConfig(
-                    tile_size_in_frames=DEFAULT_TILE_SIZE_FRAMES,
-                    tile_overlap_in_frames=DEFAULT_TILE_OVERLAP_FRAMES,
-                ),
-            )
+            # Use tiled decoding for reduced VRAM, with tiles planned from the free memory
             chunks = list(
                 self.vae.tiled_decode(
                     latents,
-                    tiling_config=tiling_config,
+                    tiling_config=TilingConfig.auto(),
                     generator=generator,
                 )
             )
@@ -60,7 +60,6 @@ VAE_TEMPORAL_FACTOR = 8
 AUDIO_LATENT_CHANNELS = 8
 AUDIO_FREQUENCY_BINS = 16
 
-DEFAULT_TILE_SIZE = 512  # Spatial tile size in pixels (must be ≥64 and divisible by 32)
 DEFAULT_TILE_OVERLAP = 128  # Spatial tile overlap in pixels (must be divisible by 32)
 
 app = typer.Typer(
@@ -610,7 +609,7 @@ def encode_video(
     video: torch.Tensor,
     dtype: torch.dtype | None = None,
     use_tiling: bool = False,
-    tile_size: int = DEFAULT_TILE_SIZE,
+    tile_size: int | None = None,
     tile_overlap: int = DEFAULT_TILE_OVERLAP,
 ) -> dict[str, torch.Tensor | int]:
     """Encode video into non-patchified latent representation.
@@ -620,7 +619,7 @@ def encode_video(
                This is the format expected by the VAE encoder.
         dtype: Target dtype for output latents
         use_tiling: Whether to use spatial tiling for memory efficiency
-        tile_size: Tile size in pixels (must be divisible by 32)
+        tile_size: Tile size in pixels (must be divisible by 32), or None to plan it from the free memory
         tile_overlap: Overlap between tiles in pixels (must be divisible by 32)
     Returns:
         Dict containing non-patchified latents and shape information:
@@ -668,7 +667,7 @@ def encode_video(
 def tiled_encode_video(  # noqa: PLR0912, PLR0915
     vae: torch.nn.Module,
     video: torch.Tensor,
-    tile_size: int = DEFAULT_TILE_SIZE,
+    tile_size: int | None = None,
     tile_overlap: int = DEFAULT_TILE_OVERLAP,
 ) -> torch.Tensor:
     """Encode video using spatial tiling for memory efficiency.
@@ -677,7 +676,8 @@ def tiled_encode_video(  # noqa: PLR0912, PLR0915
     Args:
         vae: Video VAE encoder model
         video: Input tensor of shape [B, C, F, H, W]
-        tile_size: Tile size in pixels (must be divisible by 32)
+        tile_size: Tile size in pixels (must be divisible by 32). If None, the largest tile that fits in the
+            free memory is used (see VideoEncoder.plan_tiling), and the video is encoded whole if it fits.
         tile_overlap: Overlap between tiles in pixels (must be divisible by 32)
     Returns:
         Encoded latent tensor [B, C_latent, F_latent, H_latent, W_latent]
@@ -686,6 +686,12 @@ def tiled_encode_video(  # noqa: PLR0912, PLR0915
     device = video.device
     dtype = video.dtype
 
+    if tile_size is None:
+        tiling_config = vae.plan_tiling(video.shape, temporal=False)
+        if tiling_config is None or tiling_config.spatial_config is None:
+            return vae(video)
+        tile_size = tiling_config.spatial_config.tile_size_in_pixels
+
     # Validate tile parameters
     if tile_size % VAE_SPATIAL_FACTOR != 0:
         raise ValueError(f"tile_size must be divisible by {VAE_SPATIAL_FACTOR}, got {tile_size}")
@@ -45,6 +45,8 @@ SCALAR_FLAG_MAP = {
     "audio_rescale_scale": "--audio-rescale-scale",
     "v2a_guidance_scale": "--v2a-guidance-scale",
     "audio_skip_step": "--audio-skip-step",
+    "latent_checkpoint_path": "--latent-checkpoint-path",
+    "resume_from": "--resume-from",
 }
 
 LIST_FLAG_MAP = {
@@ -54,6 +56,7 @@ LIST_FLAG_MAP = {
 
 BOOL_FLAG_MAP = {
     "enhance_prompt": "--enhance-prompt",
+    "shared_registry": "--shared-registry",
 }
 
 class LTX2JobRequest(BaseModel):
@@ -75,6 +78,7 @@ class Job:
     error: Optional[str] = None
     output_path: str = ""  # Für n8n Anzeige
     output_file: str = ""  # Interner Pfad
+    preview_file: str = ""  # Vorschaubild, geschrieben sobald das Denoising fertig ist
     log_file: str = ""
     prompt: str = ""
     overrides: Dict[str, Any] = None
@@ -268,7 +272,9 @@ def _append_raw_flags(cmd: list[str], value: Any) -> None:
     raise ValueError(f"Unsupported raw_flags value: {value!r}")
 
 
-def _build_command(prompt: str, output_file: str, overrides: Dict[str, Any]) -> tuple[list[str], Dict[str, str]]:
+def _build_command(
+    prompt: str, output_file: str, overrides: Dict[str, Any], preview_file: str = ""
+) -> tuple[list[str], Dict[str, str]]:
     ov = _normalize_overrides(overrides)
 
     checkpoint_path = str(ov.get("checkpoint_path") or DEFAULT_CHECKPOINT_PATH)
@@ -300,6 +306,8 @@ def _build_command(prompt: str, output_file: str, overrides: Dict[str, Any]) ->
         "--output-path",
         output_file,
     ]
+    if preview_file:
+        cmd.extend(["--preview-path", preview_file])
 
     for path, strength in distilled_loras:
         cmd.extend(["--distilled-lora", path, str(strength)])
@@ -382,6 +390,7 @@ class _LTX2Service:
             created_at=time.time(),
             output_path=f"/workspace/jobs/{jid}/{jid}.mp4",
             output_file=str(job_dir / f"{jid}.mp4"),
+            preview_file=str(job_dir / f"{jid}_preview.jpg"),
             log_file=str(job_dir / "job.log"),
             prompt=prompt,
             overrides=overrides or {},
@@ -402,7 +411,7 @@ class _LTX2Service:
                 self._persist(job)
 
                 try:
-                    cmd, env = _build_command(job.prompt, job.output_file, job.overrides or {})
+                    cmd, env = _build_command(job.prompt, job.output_file, job.overrides or {}, job.preview_file)
                     job.command = cmd
                     self._persist(job)
 
@@ -444,6 +453,15 @@ async def submit_job(req: LTX2JobRequest):
 
 def get_status(job_id: str):
     if job_id in _service.jobs:
-        return asdict(_service.jobs[job_id])
-    status_file = Path(LTX_JOBS_DIR) / job_id / "job_status.json"
-    return json.loads(status_file.read_text()) if status_file.exists() else {"error": "not found"}
+        info = asdict(_service.jobs[job_id])
+    else:
+        status_file = Path(LTX_JOBS_DIR) / job_id / "job_status.json"
+        if not status_file.exists():
+            return {"error": "not found"}
+        info = json.loads(status_file.read_text())
+    # Die Vorschau existiert, sobald das Denoising fertig ist, noch bevor das Video dekodiert wird
+    preview_file = info.get("preview_file")
+    info["preview_url"] = (
+        f"/jobs/{job_id}/{Path(preview_file).name}" if preview_file and Path(preview_file).exists() else None
+    )
+    return info